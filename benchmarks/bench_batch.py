@@ -0,0 +1,50 @@
+"""Benchmark render_all_channels against a per-call render loop.
+
+Usage:
+    python benchmarks/bench_batch.py [contexts]
+"""
+
+from __future__ import annotations
+
+import copy
+import sys
+import time
+from pathlib import Path
+
+from kerygma_templates.cli import sample_context
+from kerygma_templates.engine import TemplateEngine
+
+TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
+
+
+def main(n_contexts: int = 2000) -> None:
+    engine = TemplateEngine()
+    engine.load_directory(TEMPLATES_DIR)
+    contexts = []
+    for i in range(n_contexts):
+        ctx = copy.deepcopy(sample_context())
+        ctx["repo"]["name"] = f"repo-{i}"
+        contexts.append(ctx)
+    templates = engine.list_templates()
+
+    start = time.perf_counter()
+    for t in templates:
+        for ctx in contexts:
+            for ch in t.channels:
+                engine.render(t.template_id, ctx, ch)
+    loop = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for t in templates:
+        engine.render_all_channels(t.template_id, contexts)
+    batch = time.perf_counter() - start
+
+    renders = n_contexts * sum(len(t.channels) for t in templates)
+    print(f"{renders} renders")
+    print(f"  render() loop:         {loop:.3f}s — {renders / loop:,.0f} renders/s")
+    print(f"  render_all_channels(): {batch:.3f}s — {renders / batch:,.0f} renders/s")
+    print(f"  speedup: {loop / batch:.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,56 @@
+"""Benchmark the render cache on a workload with redelivered events.
+
+Each event is delivered ``repeats`` times (retries, duplicate webhooks) as a
+fresh, equal context dict; every template/channel is rendered per delivery.
+
+Usage:
+    python benchmarks/bench_cache.py [events] [repeats]
+"""
+
+from __future__ import annotations
+
+import copy
+import sys
+import time
+from pathlib import Path
+
+from kerygma_templates.cli import sample_context
+from kerygma_templates.engine import TemplateEngine
+
+TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
+
+
+def _run(engine: TemplateEngine, deliveries: list[dict]) -> float:
+    templates = engine.list_templates()
+    start = time.perf_counter()
+    for ctx in deliveries:
+        for t in templates:
+            for ch in t.channels:
+                engine.render(t.template_id, ctx, ch)
+    return time.perf_counter() - start
+
+
+def main(events: int = 200, repeats: int = 3) -> None:
+    deliveries = []
+    for i in range(events):
+        ctx = copy.deepcopy(sample_context())
+        ctx["repo"]["name"] = f"repo-{i}"
+        deliveries.extend(copy.deepcopy(ctx) for _ in range(repeats))
+
+    plain = TemplateEngine()
+    plain.load_directory(TEMPLATES_DIR)
+    cached = TemplateEngine(cache_size=8192)
+    cached.load_directory(TEMPLATES_DIR)
+
+    uncached_s = _run(plain, deliveries)
+    cached_s = _run(cached, deliveries)
+    stats = cached.cache_stats()
+    print(f"deliveries: {len(deliveries)} ({repeats}x each)")
+    print(f"uncached: {uncached_s * 1e3:8.1f} ms")
+    print(f"cached:   {cached_s * 1e3:8.1f} ms  ({uncached_s / cached_s:.2f}x)")
+    print(f"hits {stats.hits}  misses {stats.misses}  evictions {stats.evictions}")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
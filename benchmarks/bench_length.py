@@ -0,0 +1,47 @@
+"""Throughput of each length-counting strategy.
+
+Counts every rendered template/channel of the sample context, as ASCII and
+with emoji, accents and CJK appended, against plain len().
+
+Usage:
+    python benchmarks/bench_length.py [rounds]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+from kerygma_templates.cli import sample_context
+from kerygma_templates.engine import TemplateEngine
+from kerygma_templates.length import COUNTERS
+
+TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
+UNICODE_TAIL = " \U0001F680 cafe\u0301 \u00e9 \u65e5\u672c \U0001F468\u200d\U0001F469\u200d\U0001F467"
+
+
+def main(rounds: int = 200) -> None:
+    engine = TemplateEngine()
+    engine.load_directory(TEMPLATES_DIR)
+    ctx = sample_context()
+    texts = [
+        engine.render(t.template_id, ctx, ch).text
+        for t in engine.list_templates() for ch in t.channels
+    ]
+    corpora = {"ascii": texts, "unicode": [t + UNICODE_TAIL for t in texts]}
+
+    print(f"{'strategy':<10} {'corpus':<8} {'µs/text':>8}")
+    for name, count in COUNTERS.items():
+        for corpus, items in corpora.items():
+            count(items[0])  # Build lazy tables outside the timing
+            start = time.perf_counter()
+            for _ in range(rounds):
+                for text in items:
+                    count(text)
+            elapsed = time.perf_counter() - start
+            print(f"{name:<10} {corpus:<8} {elapsed / (rounds * len(items)) * 1e6:>8.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
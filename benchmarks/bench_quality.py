@@ -0,0 +1,71 @@
+"""QualityChecker scanning throughput as the anti-pattern list grows.
+
+Compares the single-pass scanner behind ``QualityChecker.check`` against the
+previous per-check approach (one substring search per anti-pattern plus
+separate regex walks for placeholders and hashtags) on a typical rendered
+announcement. Only metric gathering is timed; building the report is the
+same for both.
+
+Usage:
+    python benchmarks/bench_quality.py [checks]
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import string
+import sys
+import time
+
+from kerygma_templates.quality_checker import ANTI_PATTERNS, _Scanner
+
+TEXT = (
+    "New in ORGAN-I: recursive-engine v2.1 ships a rewritten evaluator, "
+    "faster startup and a stay-tuned roadmap for the next cycle. "
+    "Read the release notes at https://example.com/releases/recursive-engine "
+    "#release #opensource #python #organvm"
+) * 2
+
+
+def _patterns(n: int) -> list[str]:
+    rng = random.Random(n)
+    extra = [
+        " ".join("".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 9)))
+                 for _ in range(rng.randint(1, 2)))
+        for _ in range(max(0, n - len(ANTI_PATTERNS)))
+    ]
+    return ANTI_PATTERNS + extra
+
+
+def _naive(text: str, patterns: list[str]) -> tuple:
+    lower = text.lower()
+    return (
+        [p for p in patterns if p in lower],
+        re.findall(r"\{\{.*?\}\}", text),
+        "http://" in text or "https://" in text,
+        len(re.findall(r"#\w+", text)),
+    )
+
+
+def main(checks: int = 2_000) -> None:
+    print(f"{'patterns':>8} {'naive/s':>10} {'scanner/s':>10} {'speedup':>8}")
+    for n in (10, 1_000, 5_000):
+        patterns = _patterns(n)
+        scanner = _Scanner(patterns)
+
+        start = time.perf_counter()
+        for _ in range(checks):
+            _naive(TEXT, patterns)
+        naive = checks / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for _ in range(checks):
+            scanner.scan(TEXT)
+        fused = checks / (time.perf_counter() - start)
+
+        print(f"{n:>8} {naive:>10.0f} {fused:>10.0f} {fused / naive:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000)
@@ -0,0 +1,64 @@
+"""Benchmark RegistryLoader lookups on a synthetic registry.
+
+Compares indexed list_repos()/query() with the equivalent linear scans.
+
+Usage:
+    python benchmarks/bench_registry.py [repos]
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from kerygma_templates.bench import ORGANS, synthetic_registry
+from kerygma_templates.registry_loader import RegistryLoader
+
+
+def _timed(label: str, fn, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    elapsed = (time.perf_counter() - start) / rounds
+    print(f"  {label:<40} {elapsed * 1000:9.3f} ms")
+    return elapsed
+
+
+def main(n_repos: int = 100_000) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "registry.json"
+        path.write_text(json.dumps(synthetic_registry(n_repos)))
+        start = time.perf_counter()
+        loader = RegistryLoader(path)
+        print(f"load {n_repos} repos: {time.perf_counter() - start:.3f}s")
+
+    repos = loader.list_repos()
+    print("per-organ digest (8 organs):")
+    scan = _timed("linear scan", lambda: [
+        [r for r in repos if r.organ == o] for o in ORGANS
+    ], 10)
+    indexed = _timed("list_repos(organ=...)", lambda: [
+        loader.list_repos(organ=o) for o in ORGANS
+    ], 10)
+    print(f"  speedup: {scan / indexed:.1f}x")
+
+    print("composite query (organ + tier + status + metadata):")
+    scan = _timed("linear scan", lambda: [
+        r for r in repos
+        if r.organ == "organ-4" and r.tier == "flagship"
+        and r.implementation_status == "PRODUCTION"
+        and r.metadata.get("promotion_status") == "GRADUATED"
+    ], 10)
+    loader.query(metadata={"promotion_status": "GRADUATED"})  # build the lazy index
+    indexed = _timed("query(...)", lambda: loader.query(
+        organ="organ-4", tier="flagship", implementation_status="PRODUCTION",
+        metadata={"promotion_status": "GRADUATED"},
+    ), 10)
+    print(f"  speedup: {scan / indexed:.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,47 @@
+"""Peak and retained memory of RegistryLoader.load, eager vs streaming.
+
+Usage:
+    python benchmarks/bench_registry_memory.py [repos]
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from kerygma_templates.bench import synthetic_registry
+from kerygma_templates.registry_loader import RegistryLoader
+
+
+def _measure(path: Path, streaming: bool) -> None:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    loader = RegistryLoader()
+    loader.load(path, streaming=streaming)
+    elapsed = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    label = "streaming" if streaming else "eager"
+    print(
+        f"  {label:<10} {elapsed:6.2f}s  peak {peak / 2**20:8.1f} MiB  "
+        f"retained {retained / 2**20:8.1f} MiB  ({loader.repo_count} repos)"
+    )
+
+
+def main(n_repos: int = 200_000) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "registry.json"
+        path.write_text(json.dumps(synthetic_registry(n_repos, rich=True)))
+        print(f"registry: {path.stat().st_size / 2**20:.1f} MiB on disk")
+        _measure(path, streaming=False)
+        _measure(path, streaming=True)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,36 @@
+"""Benchmark TemplateEngine.render across every shipped template and channel.
+
+Usage:
+    python benchmarks/bench_render.py [rounds]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+from kerygma_templates.cli import sample_context
+from kerygma_templates.engine import TemplateEngine
+
+TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
+
+
+def main(rounds: int = 2000) -> None:
+    engine = TemplateEngine()
+    engine.load_directory(TEMPLATES_DIR)
+    context = sample_context()
+    pairs = [(t.template_id, ch) for t in engine.list_templates() for ch in t.channels]
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for template_id, channel in pairs:
+            engine.render(template_id, context, channel)
+    elapsed = time.perf_counter() - start
+
+    renders = rounds * len(pairs)
+    print(f"{renders} renders in {elapsed:.3f}s — {renders / elapsed:,.0f} renders/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
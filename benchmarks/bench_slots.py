@@ -0,0 +1,72 @@
+"""Per-object memory of the slotted result/context dataclasses.
+
+Each class is compared with an equivalent dataclass without __slots__, then
+the savings are projected onto a run of N renders (one RenderResult, one
+QualityReport and six CheckResults per render, one EventContext per render
+and one RepoContext per 100 renders).
+
+Usage:
+    python benchmarks/bench_slots.py [renders]
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import gc
+import sys
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from kerygma_templates.engine import RenderResult
+from kerygma_templates.quality_checker import CheckResult, QualityReport
+from kerygma_templates.registry_loader import EventContext, RepoContext
+
+SAMPLES = 50_000
+
+# (class, factory arguments, instances per render)
+CASES: list[tuple[type, Callable[[], dict[str, Any]], float]] = [
+    (RenderResult, lambda: {"template_id": "repo-launch", "channel": "mastodon", "text": "x"}, 1),
+    (QualityReport, lambda: {"template_id": "repo-launch", "channel": "mastodon"}, 1),
+    (CheckResult, lambda: {"check_name": "char_limit", "passed": True, "message": "ok"}, 6),
+    (EventContext, lambda: {"event_type": "repo-launch", "title": "t"}, 1),
+    (RepoContext, lambda: {
+        "name": "r", "organ": "o", "description": "d", "tier": "standard", "url": "u",
+    }, 0.01),
+]
+
+
+def _unslotted(cls: type) -> type:
+    return dataclasses.make_dataclass(
+        f"Plain{cls.__name__}",
+        [(f.name, f.type, f) for f in dataclasses.fields(cls)],
+    )
+
+
+def _bytes_per_object(cls: type, kwargs: Callable[[], dict[str, Any]]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    objects = [cls(**kwargs()) for _ in range(SAMPLES)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size / SAMPLES
+
+
+def main(renders: int = 1_000_000) -> None:
+    total_plain = total_slotted = 0.0
+    print(f"{'class':<15} {'plain B':>9} {'slotted B':>10} {'saved':>7}")
+    for cls, kwargs, per_render in CASES:
+        plain = _bytes_per_object(_unslotted(cls), kwargs)
+        slotted = _bytes_per_object(cls, kwargs)
+        total_plain += plain * per_render * renders
+        total_slotted += slotted * per_render * renders
+        print(f"{cls.__name__:<15} {plain:9.0f} {slotted:10.0f} {1 - slotted / plain:7.0%}")
+    print(
+        f"\n{renders:,} renders: {total_plain / 2**20:,.0f} MiB -> "
+        f"{total_slotted / 2**20:,.0f} MiB ({1 - total_slotted / total_plain:.0%} saved)"
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
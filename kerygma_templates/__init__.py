@@ -6,14 +6,29 @@
 
 __version__ = "0.2.0"
 
-from kerygma_templates.engine import TemplateEngine
-from kerygma_templates.quality_checker import QualityChecker, QualityReport
+from kerygma_templates.engine import TemplateEngine, TemplateSyntaxError
+from kerygma_templates.filters import register_filter
+from kerygma_templates.quality_checker import QualityChecker, QualityReport, register_check
 from kerygma_templates.registry_loader import RegistryLoader, EventContext
 
 __all__ = [
     "TemplateEngine",
+    "TemplateSyntaxError",
+    "AsyncTemplateEngine",
+    "register_filter",
     "QualityChecker",
     "QualityReport",
+    "register_check",
     "RegistryLoader",
     "EventContext",
 ]
+
+
+def __getattr__(name: str) -> object:
+    # AsyncTemplateEngine pulls in asyncio (and with it ssl and socket), so
+    # it is imported on first use rather than with the package
+    if name == "AsyncTemplateEngine":
+        from kerygma_templates.async_engine import AsyncTemplateEngine
+
+        return AsyncTemplateEngine
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,160 @@
+"""Asyncio façade over TemplateEngine for event-driven services.
+
+Loading templates, bundles and registries reads and parses files, so those
+calls run in an executor. A single render takes microseconds — less than a
+hop to a worker thread — so ``render`` runs inline; batches are split into
+chunks that run in the executor, with at most ``max_concurrency`` chunks in
+flight across the whole engine, so large batches never stall the loop.
+
+Rendering in threads is safe: every render reads one snapshot of the
+engine's templates (see TemplateEngine.refresh). Threads keep the loop
+responsive but share the GIL; for CPU parallelism across cores use
+ParallelRenderer.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Any, TypeVar
+
+from kerygma_templates.bundle import load_templates
+from kerygma_templates.engine import RefreshReport, RenderResult, TemplateEngine
+from kerygma_templates.parallel import RenderJob
+from kerygma_templates.registry_loader import RegistryLoader
+
+T = TypeVar("T")
+
+
+class AsyncTemplateEngine:
+    """Awaitable rendering and loading on top of a TemplateEngine.
+
+    Use an instance from one event loop only.
+
+    Args:
+        engine: Engine to wrap; a new empty TemplateEngine by default.
+        max_concurrency: Chunks (and loads) allowed in the executor at once.
+        chunk_size: Jobs per executor task in render_batch() and stream().
+        executor: Executor for blocking work; the loop's default thread
+            pool if None.
+    """
+
+    def __init__(
+        self,
+        engine: TemplateEngine | None = None,
+        max_concurrency: int = 4,
+        chunk_size: int = 64,
+        executor: Executor | None = None,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.engine = engine if engine is not None else TemplateEngine()
+        self._max_concurrency = max_concurrency
+        self._chunk_size = chunk_size
+        self._executor = executor
+        self._slots = asyncio.Semaphore(max_concurrency)
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+
+    # --- Loading ---
+
+    async def load_directory(self, directory: Path) -> int:
+        """Load all templates under ``directory``; see TemplateEngine.load_directory."""
+        return await self._run(self.engine.load_directory, directory)
+
+    async def load_templates(self, directory: Path, bundle_path: Path | None = None) -> int:
+        """Load from a fresh compiled bundle, else from the sources; see bundle.load_templates."""
+        return await self._run(load_templates, self.engine, directory, bundle_path)
+
+    async def refresh(self) -> RefreshReport:
+        """Re-read changed template files; see TemplateEngine.refresh."""
+        return await self._run(self.engine.refresh)
+
+    async def load_registry(
+        self, path: Path, loader: RegistryLoader | None = None, streaming: bool | None = None,
+    ) -> RegistryLoader:
+        """Load registry JSON into ``loader`` (a new RegistryLoader by default) and return it."""
+        loader = loader if loader is not None else RegistryLoader()
+        await self._run(loader.load, path, streaming)
+        return loader
+
+    # --- Rendering ---
+
+    async def render(
+        self, template_id: str, context: dict[str, Any], channel: str,
+    ) -> RenderResult:
+        """Render one template; runs inline, as it is cheaper than an executor hop."""
+        return self.engine.render(template_id, context, channel)
+
+    async def render_batch(self, requests: Iterable[RenderJob]) -> list[RenderResult]:
+        """Render (template_id, context, channel) requests; results in input order."""
+        return [result async for result in self.stream(requests)]
+
+    async def stream(
+        self,
+        requests: Iterable[RenderJob] | AsyncIterable[RenderJob],
+        ordered: bool = True,
+    ) -> AsyncIterator[RenderResult]:
+        """Render requests chunk by chunk in the executor, yielding results.
+
+        ``requests`` may be an async iterable (a queue reader, say) and is
+        consumed lazily, with at most ``max_concurrency`` chunks of this
+        stream in flight. With ``ordered=True`` results come back in request
+        order, otherwise in completion order. Raises KeyError for an unknown
+        template; chunks not yet started are cancelled when iteration stops.
+        """
+        in_flight: deque[asyncio.Task[list[RenderResult]]] = deque()
+        try:
+            async for chunk in _chunks(requests, self._chunk_size):
+                in_flight.append(asyncio.ensure_future(self._run(self.engine.render_batch, chunk)))
+                if len(in_flight) < self._max_concurrency:
+                    continue
+                if ordered:
+                    for result in await in_flight.popleft():
+                        yield result
+                else:
+                    done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        in_flight.remove(task)
+                        for result in task.result():
+                            yield result
+            while in_flight:
+                if ordered:
+                    task = in_flight.popleft()
+                else:
+                    done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    task = done.pop()
+                    in_flight.remove(task)
+                for result in await task:
+                    yield result
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+
+async def _chunks(
+    items: Iterable[T] | AsyncIterable[T], size: int,
+) -> AsyncIterator[list[T]]:
+    chunk: list[T] = []
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            chunk.append(item)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+    else:
+        for item in items:
+            chunk.append(item)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
@@ -0,0 +1,409 @@
+"""Benchmark suite for the engine, quality checker and registry loader.
+
+Each case builds its synthetic input once (large registries, deeply nested
+templates, huge anti-pattern lists, many contexts) and returns a callable
+that performs a known number of operations. run_suite() times every case
+over several rounds and returns a JSON-serializable report with the best
+and median seconds per operation; compare() flags cases whose median got
+slower than a stored baseline by more than a threshold.
+
+Exposed as ``announce bench``. Timings depend on the machine, so baselines
+are only meaningful when recorded on the same host.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import platform
+import random
+import statistics
+import string
+import tempfile
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from kerygma_templates import __version__
+from kerygma_templates.engine import Template, TemplateEngine
+from kerygma_templates.quality_checker import ANTI_PATTERNS, QualityChecker
+from kerygma_templates.registry_loader import EventContext, RegistryLoader
+
+SCHEMA_VERSION = 1
+DEFAULT_THRESHOLD = 0.2
+
+ORGANS = [f"organ-{i}" for i in range(8)]
+TIERS = ["flagship", "standard", "infrastructure", "archive"]
+STATUSES = ["PRODUCTION", "PROTOTYPE", "DESIGN_ONLY", "SKELETON"]
+CHANNELS = ["mastodon", "discord", "bluesky", "linkedin", "ghost"]
+
+
+# --- Synthetic inputs ---
+
+
+def synthetic_registry(n_repos: int, rich: bool = False) -> dict[str, object]:
+    """Build a registry dict; ``rich`` adds the bulkier fields real entries carry."""
+    organs: dict[str, dict[str, list[dict[str, object]]]] = {
+        o: {"repositories": []} for o in ORGANS
+    }
+    for i in range(n_repos):
+        repo: dict[str, object] = {
+            "name": f"repo-{i}",
+            "description": f"Synthetic repository {i}",
+            "tier": TIERS[i % len(TIERS)],
+            "url": f"https://example.com/repo-{i}",
+            "implementation_status": STATUSES[(i // 3) % len(STATUSES)],
+            "promotion_status": "GRADUATED" if i % 50 == 0 else "LOCAL",
+        }
+        if rich:
+            repo.update({
+                "documentation_status": "DEPLOYED",
+                "ci_workflow": "ci.yml",
+                "platinum_status": i % 7 == 0,
+                "last_validated": "2026-02-17",
+                "dependencies": [f"repo-{j}" for j in range(max(0, i - 3), i)],
+                "produces": ["template_pack", "dataset"],
+                "note": f"Repository {i} notes — " + "lorem ipsum dolor sit amet " * 4,
+            })
+        organs[ORGANS[i % len(ORGANS)]]["repositories"].append(repo)
+    return {"organs": organs}
+
+
+def synthetic_template(template_id: str = "synthetic", n_vars: int = 12) -> str:
+    """Template source with a block per channel, each using ``n_vars`` variables."""
+    lines = [f"{{{{ event.field_{i} }}}} and {{{{ repo.field_{i} }}}}" for i in range(n_vars)]
+    blocks = "\n\n".join(
+        f"{{{{#channel {ch}}}}}\n{{{{ event.title }}}}\n\n"
+        + "\n".join(lines)
+        + "\n{{#if event.url}}{{ event.url }}{{/if}}\n"
+        + f"#{ch} #organvm\n{{{{/channel}}}}"
+        for ch in CHANNELS
+    )
+    return (
+        f"---\ntemplate_id: {template_id}\ncategory: synthetic\n"
+        f"channels: [{', '.join(CHANNELS)}]\n---\n\n{blocks}\n"
+    )
+
+
+def nested_template(depth: int, template_id: str = "nested") -> str:
+    """Template source whose body nests ``depth`` {{#if}}/{{#else}} blocks."""
+    opening = "".join(
+        f"{{{{#if flags.f{i}}}}}level {i} {{{{ event.title }}}} " for i in range(depth)
+    )
+    closing = "".join(f"{{{{#else}}}}not {i}{{{{/if}}}}" for i in reversed(range(depth)))
+    return (
+        f"---\ntemplate_id: {template_id}\ncategory: synthetic\nchannels: [mastodon]\n---\n\n"
+        f"{opening}core {{{{ event.summary }}}}{closing}\n"
+    )
+
+
+def digest_template(template_id: str = "digest") -> str:
+    """Long-form template source that loops over ``digest.essays``."""
+    return (
+        f"---\ntemplate_id: {template_id}\ncategory: synthetic\nchannels: [ghost]\n---\n\n"
+        "# {{ digest.title }}\n\n"
+        "{{#each digest.essays as essay}}\n"
+        "## {{ essay.title }}\n\n{{ essay.summary }}\n\n"
+        "[Read the full essay]({{ essay.url }})\n\n---\n\n"
+        "{{/each}}\n"
+        "[Browse all essays]({{ digest.site_url }})\n"
+    )
+
+
+def synthetic_digest(n_essays: int) -> dict[str, Any]:
+    """Context for digest_template() with ``n_essays`` entries."""
+    return {"digest": {
+        "title": "Synthetic digest",
+        "site_url": "https://example.org/essays",
+        "essays": [
+            {
+                "title": f"Essay {i}",
+                "summary": f"Summary of essay {i}. " * 8,
+                "url": f"https://example.org/essays/{i}",
+            }
+            for i in range(n_essays)
+        ],
+    }}
+
+
+def synthetic_patterns(n: int, seed: int = 0) -> list[str]:
+    """ANTI_PATTERNS padded with random one- and two-word phrases up to ``n``."""
+    rng = random.Random(seed)
+    extra = [
+        " ".join("".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 9)))
+                 for _ in range(rng.randint(1, 2)))
+        for _ in range(max(0, n - len(ANTI_PATTERNS)))
+    ]
+    return ANTI_PATTERNS + extra
+
+
+def synthetic_contexts(n: int, n_vars: int = 12, depth: int = 0) -> list[dict[str, Any]]:
+    """Distinct contexts for synthetic_template() and nested_template()."""
+    contexts: list[dict[str, Any]] = []
+    for c in range(n):
+        event: dict[str, Any] = {f"field_{i}": f"event value {c}.{i}" for i in range(n_vars)}
+        event.update(
+            title=f"Release {c}",
+            summary=f"Summary of synthetic event {c}, long enough to look real.",
+            url=f"https://example.com/events/{c}" if c % 4 else "",
+        )
+        repo = {f"field_{i}": f"repo-{c}-{i}" for i in range(n_vars)}
+        flags = {f"f{i}": (c + i) % 7 != 0 for i in range(depth)}
+        contexts.append({"event": event, "repo": repo, "flags": flags})
+    return contexts
+
+
+# --- Cases ---
+
+
+@dataclass(slots=True)
+class Workload:
+    """A prepared benchmark: ``run()`` performs ``ops`` operations."""
+    run: Callable[[], object]
+    ops: int
+    params: dict[str, Any] = field(default_factory=dict)
+
+
+Setup = Callable[[Path, bool], Workload]
+CASES: dict[str, Setup] = {}
+
+
+def _case(name: str) -> Callable[[Setup], Setup]:
+    def decorator(setup: Setup) -> Setup:
+        CASES[name] = setup
+        return setup
+    return decorator
+
+
+def _engine(*sources: str) -> TemplateEngine:
+    engine = TemplateEngine()
+    for source in sources:
+        engine.register(Template.from_string(source))
+    return engine
+
+
+@_case("engine.render")
+def _bench_render(workdir: Path, quick: bool) -> Workload:
+    engine = _engine(synthetic_template(n_vars=12))
+    context = synthetic_contexts(1)[0]
+
+    def run() -> None:
+        for channel in CHANNELS:
+            engine.render("synthetic", context, channel)
+    return Workload(run, len(CHANNELS), {"vars": 12})
+
+
+@_case("engine.render_nested")
+def _bench_render_nested(workdir: Path, quick: bool) -> Workload:
+    depth = 50 if quick else 500
+    engine = _engine(nested_template(depth))
+    context = synthetic_contexts(1, n_vars=0, depth=depth)[0]
+    return Workload(lambda: engine.render("nested", context, "mastodon"), 1, {"depth": depth})
+
+
+@_case("engine.render_batch")
+def _bench_render_batch(workdir: Path, quick: bool) -> Workload:
+    n = 200 if quick else 2_000
+    engine = _engine(synthetic_template(n_vars=12))
+    requests = [
+        ("synthetic", context, channel)
+        for context in synthetic_contexts(n // len(CHANNELS)) for channel in CHANNELS
+    ]
+    return Workload(lambda: engine.render_batch(requests), len(requests), {"requests": n})
+
+
+@_case("engine.render_digest")
+def _bench_render_digest(workdir: Path, quick: bool) -> Workload:
+    n = 200 if quick else 5_000
+    engine = _engine(digest_template())
+    context = synthetic_digest(n)
+    return Workload(lambda: engine.render("digest", context, "ghost"), n, {"essays": n})
+
+
+@_case("engine.render_to")
+def _bench_render_to(workdir: Path, quick: bool) -> Workload:
+    n = 200 if quick else 5_000
+    engine = _engine(digest_template())
+    context = synthetic_digest(n)
+    return Workload(
+        lambda: engine.render_to(io.StringIO(), "digest", context, "ghost"), n, {"essays": n},
+    )
+
+
+@_case("checker.check")
+def _bench_check(workdir: Path, quick: bool) -> Workload:
+    engine = _engine(synthetic_template(n_vars=4))
+    results = [
+        engine.render("synthetic", synthetic_contexts(1, n_vars=4)[0], channel)
+        for channel in CHANNELS
+    ]
+    checker = QualityChecker()
+
+    def run() -> None:
+        for result in results:
+            checker.check(result.text, result.channel, "synthetic", result.unresolved_vars)
+    return Workload(run, len(results), {"patterns": len(ANTI_PATTERNS)})
+
+
+@_case("checker.check_patterns")
+def _bench_check_patterns(workdir: Path, quick: bool) -> Workload:
+    n = 1_000 if quick else 10_000
+    engine = _engine(synthetic_template(n_vars=4))
+    result = engine.render("synthetic", synthetic_contexts(1, n_vars=4)[0], "linkedin")
+    checker = QualityChecker(anti_patterns=synthetic_patterns(n))
+
+    def run() -> None:
+        checker.check(result.text, "linkedin", "synthetic", result.unresolved_vars)
+    return Workload(run, 1, {"patterns": n})
+
+
+def _registry_file(workdir: Path, n_repos: int) -> Path:
+    path = workdir / f"registry-{n_repos}.json"
+    if not path.exists():
+        path.write_text(json.dumps(synthetic_registry(n_repos, rich=True)), encoding="utf-8")
+    return path
+
+
+@_case("registry.load")
+def _bench_registry_load(workdir: Path, quick: bool) -> Workload:
+    n = 2_000 if quick else 20_000
+    path = _registry_file(workdir, n)
+    return Workload(lambda: RegistryLoader().load(path), n, {"repos": n})
+
+
+@_case("registry.load_streaming")
+def _bench_registry_stream(workdir: Path, quick: bool) -> Workload:
+    n = 2_000 if quick else 20_000
+    path = _registry_file(workdir, n)
+    return Workload(lambda: RegistryLoader(streaming=True).load(path), n, {"repos": n})
+
+
+@_case("registry.query")
+def _bench_registry_query(workdir: Path, quick: bool) -> Workload:
+    n = 2_000 if quick else 20_000
+    loader = RegistryLoader()
+    loader.load(_registry_file(workdir, n))
+    queries = [
+        {"organ": organ, "tier": tier, "metadata": {"promotion_status": "LOCAL"}}
+        for organ in ORGANS for tier in TIERS
+    ]
+
+    def run() -> None:
+        for query in queries:
+            loader.query(**query)
+    return Workload(run, len(queries), {"repos": n})
+
+
+@_case("registry.build_context")
+def _bench_build_context(workdir: Path, quick: bool) -> Workload:
+    n = 2_000 if quick else 20_000
+    loader = RegistryLoader()
+    loader.load(_registry_file(workdir, n))
+    engine = _engine(
+        "---\ntemplate_id: short\nchannels: [bluesky]\n---\n"
+        "{{ repo.name }} is live: {{ repo.url }}"
+    )
+    events = [
+        EventContext("repo-launch", repo_name=f"repo-{i}", title=f"Launch {i}",
+                     extras={f"extra_{k}": k for k in range(10)})
+        for i in range(0, n, max(1, n // 200))
+    ]
+
+    def run() -> None:
+        for event in events:
+            engine.render("short", loader.build_context(event), "bluesky")
+    return Workload(run, len(events), {"repos": n})
+
+
+# --- Running and comparing ---
+
+
+@dataclass(slots=True)
+class CaseResult:
+    """Timings for one case, in seconds per operation."""
+    name: str
+    ops: int
+    rounds: int
+    best: float
+    median: float
+    params: dict[str, Any] = field(default_factory=dict)
+
+
+def run_case(name: str, workdir: Path, quick: bool = False, rounds: int = 5) -> CaseResult:
+    """Set up and time one case; the first call is a discarded warm-up."""
+    workload = CASES[name](workdir, quick)
+    workload.run()
+    samples: list[float] = []
+    for _ in range(max(rounds, 1)):
+        start = time.perf_counter()
+        workload.run()
+        samples.append((time.perf_counter() - start) / workload.ops)
+    return CaseResult(
+        name, workload.ops, len(samples), min(samples), statistics.median(samples),
+        workload.params,
+    )
+
+
+def run_suite(
+    names: Iterable[str] | None = None,
+    quick: bool = False,
+    rounds: int = 5,
+    on_result: Callable[[CaseResult], None] | None = None,
+) -> dict[str, Any]:
+    """Run the named cases (default: all) and return the report dict.
+
+    Raises KeyError for an unknown case name.
+    """
+    selected = list(CASES) if names is None else list(names)
+    for name in selected:
+        if name not in CASES:
+            raise KeyError(f"Unknown benchmark '{name}'")
+    results: dict[str, dict[str, Any]] = {}
+    with tempfile.TemporaryDirectory(prefix="kerygma-bench-") as tmp:
+        for name in selected:
+            result = run_case(name, Path(tmp), quick, rounds)
+            results[name] = asdict(result)
+            if on_result is not None:
+                on_result(result)
+    return {
+        "schema": SCHEMA_VERSION,
+        "version": __version__,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "quick": quick,
+        "results": results,
+    }
+
+
+@dataclass(slots=True)
+class Comparison:
+    """Median time per operation of one case against the baseline."""
+    name: str
+    baseline: float
+    current: float
+    regressed: bool
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], threshold: float = DEFAULT_THRESHOLD,
+) -> list[Comparison]:
+    """Compare the cases two reports share.
+
+    A case regresses when its median exceeds the baseline median by more
+    than ``threshold`` (0.2 = 20% slower). Cases run with different
+    parameters (e.g. one report used --quick) are skipped.
+    """
+    comparisons: list[Comparison] = []
+    old = baseline.get("results", {})
+    for name, new in current.get("results", {}).items():
+        if name not in old or old[name].get("params") != new.get("params"):
+            continue
+        before, after = old[name]["median"], new["median"]
+        comparisons.append(Comparison(name, before, after, after > before * (1 + threshold)))
+    return comparisons
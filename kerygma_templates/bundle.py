@@ -0,0 +1,130 @@
+"""Precompiled template bundles for fast startup.
+
+``write_bundle`` parses every template under a directory and writes the
+frontmatter and body of each to a single JSON file, together with the
+size, mtime and SHA-256 of each source. ``load_templates`` uses the bundle
+when it is still fresh, skipping the file reads and frontmatter parsing,
+and falls back to the sources otherwise.
+
+Bundles hold data only; loading one compiles the bundled bodies, so a
+bundle found in a checkout can at worst describe the wrong templates,
+never run code.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from kerygma_templates import __version__
+from kerygma_templates.engine import SourceStamp, Template, TemplateEngine, read_source
+
+BUNDLE_FORMAT = 6
+DEFAULT_BUNDLE_NAME = ".compiled-templates.json"
+
+
+def _sources(directory: Path) -> list[Path]:
+    return sorted(directory.rglob("*.md"))
+
+
+def write_bundle(directory: Path, bundle_path: Path | None = None) -> int:
+    """Compile all templates under ``directory`` into a bundle file.
+
+    Returns the number of templates bundled.
+    """
+    bundle_path = bundle_path or directory / DEFAULT_BUNDLE_NAME
+    stamps: dict[str, dict[str, Any]] = {}
+    templates: list[dict[str, Any]] = []
+    for path in _sources(directory):
+        text, stamp = read_source(path)
+        if text.startswith("---\n"):
+            tmpl = Template.from_string(text, path)
+            tmpl.compile()  # Don't bundle a template that fails to load
+            stamp.template_id = tmpl.template_id
+            templates.append({"metadata": tmpl.metadata, "body": tmpl.body})
+        stamps[path.relative_to(directory).as_posix()] = dataclasses.asdict(stamp)
+
+    payload: dict[str, Any] = {
+        "format": BUNDLE_FORMAT,
+        "version": __version__,
+        "sources": stamps,
+        "templates": templates,
+    }
+    tmp_path = bundle_path.with_name(bundle_path.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as fh:
+        json.dump(payload, fh, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, bundle_path)
+    return len(templates)
+
+
+def _is_fresh(directory: Path, stamps: dict[str, SourceStamp]) -> bool:
+    """Check recorded stamps against the sources: stat first, hash on mtime drift."""
+    paths = _sources(directory)
+    if len(paths) != len(stamps):
+        return False
+    for path in paths:
+        stamp = stamps.get(path.relative_to(directory).as_posix())
+        if stamp is None:
+            return False
+        stat = path.stat()
+        if stat.st_size != stamp.size:
+            return False
+        if stat.st_mtime_ns != stamp.mtime_ns:
+            if hashlib.sha256(path.read_bytes()).hexdigest() != stamp.sha256:
+                return False
+    return True
+
+
+def _read_payload(
+    bundle_path: Path, directory: Path,
+) -> tuple[list[Template], dict[str, SourceStamp]] | None:
+    """The bundled templates (compiled) and source stamps, or None if unusable."""
+    try:
+        with bundle_path.open(encoding="utf-8") as fh:
+            payload = json.load(fh)
+    except FileNotFoundError:
+        return None
+    except ValueError:  # Not JSON (or not UTF-8)
+        return None
+    if not isinstance(payload, dict):
+        return None
+    if payload.get("format") != BUNDLE_FORMAT or payload.get("version") != __version__:
+        return None
+    try:
+        stamps = {rel: SourceStamp(**stamp) for rel, stamp in payload["sources"].items()}
+        entries = [(entry["metadata"], entry["body"]) for entry in payload["templates"]]
+    except (AttributeError, KeyError, TypeError):
+        return None
+    if not _is_fresh(directory, stamps):
+        return None
+    templates = [Template.from_metadata(meta, body) for meta, body in entries]
+    for tmpl in templates:
+        tmpl.compile()
+    return templates, stamps
+
+
+def read_bundle(bundle_path: Path, directory: Path) -> list[Template] | None:
+    """Return the bundled templates, or None if the bundle is missing or stale."""
+    payload = _read_payload(bundle_path, directory)
+    return None if payload is None else payload[0]
+
+
+def load_templates(
+    engine: TemplateEngine, directory: Path, bundle_path: Path | None = None,
+) -> int:
+    """Load templates into ``engine`` from a fresh bundle, else from ``directory``.
+
+    Returns the number of templates loaded.
+    """
+    payload = _read_payload(bundle_path or directory / DEFAULT_BUNDLE_NAME, directory)
+    if payload is None:
+        return engine.load_directory(directory)
+    templates, stamps = payload
+    for tmpl in templates:
+        engine.register(tmpl)
+    engine.track_sources(directory, {directory / rel: stamp for rel, stamp in stamps.items()})
+    return len(templates)
@@ -2,19 +2,36 @@
 
 Usage:
     announce list                         — list all registered templates
-    announce render <template_id> <channel> — render a template (uses sample context)
+    announce render <template_id> <channel> [--fit] [-o FILE] — render with the sample context
     announce validate                     — validate all templates parse correctly
-    announce check <template_id> <channel> — run quality checks on rendered output
+    announce compile                      — precompile templates into a bundle for fast startup
+    announce check <template_id> <channel> [--fit] [--profile] — quality-check a sample render
+    announce render-batch [--input FILE] [--jobs N] — render + check jobs in parallel (JSONL out)
+    announce render-stream [--input FILE] [--registry FILE] — render JSONL event records
+    announce bench [CASE ...] [--quick] [--baseline FILE] — run benchmarks (JSON out)
 """
 
 from __future__ import annotations
 
 import argparse
+import json
 import sys
+from collections.abc import Iterator
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, TextIO
 
-from kerygma_templates.engine import TemplateEngine
+from kerygma_templates.bundle import DEFAULT_BUNDLE_NAME, load_templates, write_bundle
+from kerygma_templates.engine import RenderResult, TemplateEngine, TemplateSyntaxError
+from kerygma_templates.frontmatter import FrontmatterError
 from kerygma_templates.quality_checker import QualityChecker
+from kerygma_templates.registry_loader import RegistryLoader
+
+# Modules used by a single subcommand are imported in its handler, so that
+# quick commands such as `announce list` don't pay for multiprocessing,
+# statistics and the like at startup
+if TYPE_CHECKING:
+    from kerygma_templates.bench import CaseResult
+    from kerygma_templates.parallel import RenderJob
 
 
 def _find_templates_dir() -> Path:
@@ -81,12 +98,41 @@ def cmd_list(engine: TemplateEngine) -> None:
         print(f"{t.template_id:<25} {t.category:<15} {channels}")
 
 
-def cmd_render(engine: TemplateEngine, template_id: str, channel: str) -> None:
+def _render_sample(
+    engine: TemplateEngine, template_id: str, channel: str, fit: bool,
+) -> RenderResult:
     context = sample_context()
-    result = engine.render(template_id, context, channel)
-    print(result.text)
-    if result.unresolved_vars:
-        print(f"\n[WARN] Unresolved: {', '.join(result.unresolved_vars)}", file=sys.stderr)
+    if not fit:
+        return engine.render(template_id, context, channel)
+    from kerygma_templates.fit import fit_render
+
+    result = fit_render(engine, template_id, context, channel)
+    for degradation in result.degradations:
+        print(f"[FIT] {degradation}", file=sys.stderr)
+    return result
+
+
+def cmd_render(
+    engine: TemplateEngine,
+    template_id: str,
+    channel: str,
+    fit: bool = False,
+    output: Path | None = None,
+) -> None:
+    if output is not None and not fit:
+        # Stream straight to the file instead of building the text first
+        with output.open("w", encoding="utf-8") as fh:
+            unresolved = engine.render_to(fh, template_id, sample_context(), channel)
+            fh.write("\n")
+    else:
+        result = _render_sample(engine, template_id, channel, fit)
+        unresolved = result.unresolved_vars
+        if output is not None:
+            output.write_text(result.text + "\n", encoding="utf-8")
+        else:
+            print(result.text)
+    if unresolved:
+        print(f"\n[WARN] Unresolved: {', '.join(unresolved)}", file=sys.stderr)
 
 
 def cmd_validate(engine: TemplateEngine) -> None:
@@ -103,25 +149,259 @@ def cmd_validate(engine: TemplateEngine) -> None:
                 errors += 1
     total = sum(len(t.channels) for t in templates)
     print(f"\nValidated {total - errors}/{total} template-channel combinations.")
+    for report in engine.check_variables():
+        if report.undeclared:
+            print(
+                f"  FAIL {report.template_id}: reads undeclared variables "
+                f"{', '.join(report.undeclared)}",
+                file=sys.stderr,
+            )
+            errors += 1
+        if report.unused:
+            print(
+                f"  WARN {report.template_id}: declares unused variables "
+                f"{', '.join(report.unused)}",
+                file=sys.stderr,
+            )
     if errors:
         sys.exit(1)
 
 
-def cmd_check(engine: TemplateEngine, template_id: str, channel: str) -> None:
-    context = sample_context()
-    result = engine.render(template_id, context, channel)
+def cmd_compile(templates_dir: Path, bundle_path: Path) -> None:
+    count = write_bundle(templates_dir, bundle_path)
+    print(f"Compiled {count} templates into {bundle_path}")
+
+
+def cmd_check(
+    engine: TemplateEngine,
+    template_id: str,
+    channel: str,
+    profile: bool = False,
+    repeat: int = 1,
+    fit: bool = False,
+) -> None:
+    result = _render_sample(engine, template_id, channel, fit)
     checker = QualityChecker()
-    report = checker.check(result.text, channel, template_id, result.unresolved_vars)
+    for _ in range(max(repeat, 1)):
+        report = checker.check(result.text, channel, template_id, result.unresolved_vars)
     print(report.summary())
     for c in report.checks:
         status = "PASS" if c.passed else "FAIL"
         print(f"  [{status}] {c.check_name}: {c.message}")
+    if profile:
+        _print_check_stats(checker)
     if not report.passed:
         sys.exit(1)
 
 
+def _print_check_stats(checker: QualityChecker) -> None:
+    stats = checker.stats()
+    total = sum(s.total_ns for s in stats.values()) or 1
+    print(
+        f"\n{'Check':<18} {'Calls':>7} {'Total ms':>9} {'Mean µs':>8} {'Max µs':>8} "
+        f"{'Share':>6}"
+    )
+    print("-" * 61)
+    for name, s in sorted(stats.items(), key=lambda item: -item[1].total_ns):
+        print(
+            f"{name:<18} {s.calls:>7} {s.total_ns / 1e6:>9.3f} {s.mean_ns / 1e3:>8.1f} "
+            f"{s.max_ns / 1e3:>8.1f} {s.total_ns / total:>6.1%}"
+        )
+
+
+def _read_baseline(path: Path) -> dict[str, Any]:
+    """Load a bench report to compare against, exiting with an error if it is unusable."""
+    try:
+        baseline = json.loads(path.read_text(encoding="utf-8"))
+    except OSError as exc:
+        problem = f"cannot read {path}: {exc.strerror}"
+    except ValueError as exc:
+        problem = f"{path} is not valid JSON: {exc}"
+    else:
+        results = baseline.get("results") if isinstance(baseline, dict) else None
+        if isinstance(results, dict) and all(
+            isinstance(r, dict) and isinstance(r.get("median"), (int, float))
+            for r in results.values()
+        ):
+            return baseline
+        problem = f"{path} is not a bench report (expected a 'results' object with medians)"
+    print(f"Error: {problem}", file=sys.stderr)
+    sys.exit(1)
+
+
+def _open_input(path: str) -> TextIO:
+    """Open a file for reading ("-" for stdin), exiting with an error if it can't be."""
+    if path == "-":
+        return sys.stdin
+    try:
+        return open(path, encoding="utf-8")
+    except OSError as exc:
+        print(f"Error: cannot read {path}: {exc.strerror}", file=sys.stderr)
+        sys.exit(1)
+
+
+def _read_jobs(stream: TextIO | None, engine: TemplateEngine) -> Iterator[RenderJob]:
+    """Yield render jobs from a JSONL stream.
+
+    Each line is {"template_id": ..., "channel": ..., "context": {...}}; a
+    missing context uses sample_context(). Malformed lines, unknown
+    templates and non-object contexts are skipped with a warning. Without a
+    stream, every template and channel is rendered against the sample
+    context.
+    """
+    if stream is None:
+        context = sample_context()
+        for t in engine.list_templates():
+            for ch in t.channels:
+                yield t.template_id, context, ch
+        return
+
+    for lineno, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            context = record["context"] if "context" in record else sample_context()
+            job = (record["template_id"], context, record["channel"])
+        except (ValueError, KeyError, TypeError) as exc:
+            print(f"[WARN] Skipping line {lineno}: {exc!r}", file=sys.stderr)
+            continue
+        problem = _job_problem(engine, *job)
+        if problem is not None:
+            print(f"[WARN] Skipping line {lineno}: {problem}", file=sys.stderr)
+            continue
+        yield job
+
+
+def _job_problem(
+    engine: TemplateEngine, template_id: Any, context: Any, channel: Any,
+) -> str | None:
+    """Why a decoded job can't be rendered, or None if it can."""
+    if not isinstance(template_id, str) or engine.get_template(template_id) is None:
+        return f"unknown template {template_id!r}"
+    if not isinstance(channel, str):
+        return f"channel must be a string, not {type(channel).__name__}"
+    if not isinstance(context, dict):
+        return f"context must be an object, not {type(context).__name__}"
+    return None
+
+
+def cmd_render_batch(
+    engine: TemplateEngine,
+    input_path: str | None,
+    jobs: int | None,
+    chunk_size: int,
+    ordered: bool,
+) -> None:
+    from kerygma_templates.parallel import ParallelRenderer
+    from kerygma_templates.stream import result_record
+
+    stream = _open_input(input_path) if input_path is not None else None
+    renderer = ParallelRenderer(engine, workers=jobs, chunk_size=chunk_size)
+    total = failed = 0
+    try:
+        for result, report in renderer.run(_read_jobs(stream, engine), ordered=ordered):
+            print(json.dumps(result_record(result, report), ensure_ascii=False))
+            total += 1
+            failed += not report.passed
+    except KeyError as exc:
+        print(f"Error: {exc.args[0]}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if stream is not None and stream is not sys.stdin:
+            stream.close()
+    print(f"Rendered {total} announcements, {failed} failed quality checks.", file=sys.stderr)
+
+
+def cmd_render_stream(
+    engine: TemplateEngine,
+    input_path: str,
+    registry_path: str | None,
+    channels: list[str] | None,
+    check: bool,
+) -> None:
+    from kerygma_templates.stream import render_stream
+
+    loader = RegistryLoader(Path(registry_path) if registry_path else None)
+    checker = QualityChecker() if check else None
+    errors = 0
+
+    def on_error(lineno: int, message: str) -> None:
+        nonlocal errors
+        errors += 1
+        print(f"[ERROR] line {lineno}: {message}", file=sys.stderr)
+
+    stream = _open_input(input_path)
+    try:
+        for record in render_stream(stream, engine, loader, channels, checker, on_error):
+            sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    if errors:
+        print(f"Skipped {errors} malformed record(s).", file=sys.stderr)
+
+
+def cmd_bench(
+    cases: list[str],
+    quick: bool,
+    rounds: int,
+    output: Path | None,
+    baseline_path: Path | None,
+    threshold: float | None,
+) -> None:
+    from kerygma_templates.bench import CASES, DEFAULT_THRESHOLD, compare, run_suite
+
+    if threshold is None:
+        threshold = DEFAULT_THRESHOLD
+    # Read before running, so a bad path fails fast instead of after the suite
+    baseline = _read_baseline(baseline_path) if baseline_path is not None else None
+
+    def progress(result: CaseResult) -> None:
+        print(
+            f"  {result.name:<26} {result.median * 1e6:>11.2f} µs/op "
+            f"(best {result.best * 1e6:.2f}, {result.ops} ops x {result.rounds})",
+            file=sys.stderr,
+        )
+
+    try:
+        report = run_suite(cases or None, quick, rounds, progress)
+    except KeyError as exc:
+        print(f"Error: {exc.args[0]} (available: {', '.join(CASES)})", file=sys.stderr)
+        sys.exit(1)
+    text = json.dumps(report, indent=2)
+    if output is None:
+        print(text)
+    else:
+        output.write_text(text + "\n", encoding="utf-8")
+    if baseline is None:
+        return
+
+    comparisons = compare(baseline, report, threshold)
+    print(f"\n{'Case':<26} {'Baseline µs':>12} {'Current µs':>12} {'Change':>8}", file=sys.stderr)
+    print("-" * 61, file=sys.stderr)
+    for c in comparisons:
+        flag = "  REGRESSION" if c.regressed else ""
+        print(
+            f"{c.name:<26} {c.baseline * 1e6:>12.2f} {c.current * 1e6:>12.2f} "
+            f"{c.ratio - 1:>+8.1%}{flag}",
+            file=sys.stderr,
+        )
+    regressions = [c for c in comparisons if c.regressed]
+    if regressions:
+        print(
+            f"{len(regressions)} case(s) slower than baseline by more than {threshold:.0%}.",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+
 def main(argv: list[str] | None = None) -> None:
     parser = argparse.ArgumentParser(prog="announce", description="Kerygma announcement tools")
+    parser.add_argument(
+        "--bundle", type=Path, default=None,
+        help=f"Compiled template bundle (default: templates/{DEFAULT_BUNDLE_NAME})",
+    )
     sub = parser.add_subparsers(dest="command")
 
     sub.add_parser("list", help="List all templates")
@@ -129,31 +409,97 @@ def main(argv: list[str] | None = None) -> None:
     render_p = sub.add_parser("render", help="Render a template")
     render_p.add_argument("template_id")
     render_p.add_argument("channel")
+    render_p.add_argument(
+        "--fit", action="store_true", help="Degrade optional content to fit the channel limit",
+    )
+    render_p.add_argument(
+        "--output", "-o", type=Path, help="Write the render to this file instead of stdout",
+    )
 
     sub.add_parser("validate", help="Validate all templates")
 
+    sub.add_parser("compile", help="Precompile all templates into a bundle file")
+
     check_p = sub.add_parser("check", help="Quality-check a rendered template")
     check_p.add_argument("template_id")
     check_p.add_argument("channel")
+    check_p.add_argument(
+        "--fit", action="store_true", help="Degrade optional content to fit the channel limit",
+    )
+    check_p.add_argument("--profile", action="store_true", help="Print per-check timings")
+    check_p.add_argument(
+        "--repeat", type=int, default=1, help="Run the checks N times (for --profile)",
+    )
+
+    batch_p = sub.add_parser("render-batch", help="Render and check many jobs in parallel")
+    batch_p.add_argument(
+        "--input", help="JSONL jobs file, or - for stdin (default: all templates)",
+    )
+    batch_p.add_argument("--jobs", "-j", type=int, default=None, help="Worker processes")
+    batch_p.add_argument("--chunk-size", type=int, default=64, help="Jobs per worker task")
+    batch_p.add_argument(
+        "--unordered", action="store_true", help="Emit results in completion order",
+    )
+
+    stream_p = sub.add_parser("render-stream", help="Render JSONL event records")
+    stream_p.add_argument("--input", default="-", help="JSONL events file, or - for stdin")
+    stream_p.add_argument("--registry", help="registry-v2.json used to build contexts")
+    stream_p.add_argument(
+        "--channel", action="append", dest="channels",
+        help="Channel to render (repeatable; default: the template's channels)",
+    )
+    stream_p.add_argument("--check", action="store_true", help="Include quality-check results")
+
+    bench_p = sub.add_parser("bench", help="Run the benchmark suite (JSON results)")
+    bench_p.add_argument(
+        "cases", nargs="*", help="Cases to run (default: all; unknown names list them)",
+    )
+    bench_p.add_argument("--quick", action="store_true", help="Smaller inputs, for smoke runs")
+    bench_p.add_argument("--rounds", type=int, default=5, help="Timed rounds per case")
+    bench_p.add_argument("--output", "-o", type=Path, help="Write the JSON report here")
+    bench_p.add_argument("--baseline", type=Path, help="Earlier report to compare against")
+    bench_p.add_argument(
+        "--threshold", type=float, default=None,
+        help="Allowed slowdown before a case counts as a regression (default: 0.2)",
+    )
 
     args = parser.parse_args(argv)
     if not args.command:
         parser.print_help()
         return
+    if args.command == "bench":
+        cmd_bench(
+            args.cases, args.quick, args.rounds, args.output, args.baseline, args.threshold,
+        )
+        return
 
     engine = TemplateEngine()
     templates_dir = _find_templates_dir()
+    bundle_path = args.bundle or templates_dir / DEFAULT_BUNDLE_NAME
     if templates_dir.is_dir():
-        engine.load_directory(templates_dir)
+        try:
+            if args.command == "compile":
+                cmd_compile(templates_dir, bundle_path)
+                return
+            load_templates(engine, templates_dir, bundle_path)
+        except (TemplateSyntaxError, FrontmatterError) as exc:
+            print(f"Template syntax error: {exc}", file=sys.stderr)
+            sys.exit(1)
 
     if args.command == "list":
         cmd_list(engine)
     elif args.command == "render":
-        cmd_render(engine, args.template_id, args.channel)
+        cmd_render(engine, args.template_id, args.channel, args.fit, args.output)
     elif args.command == "validate":
         cmd_validate(engine)
     elif args.command == "check":
-        cmd_check(engine, args.template_id, args.channel)
+        cmd_check(
+            engine, args.template_id, args.channel, args.profile, args.repeat, args.fit,
+        )
+    elif args.command == "render-batch":
+        cmd_render_batch(engine, args.input, args.jobs, args.chunk_size, not args.unordered)
+    elif args.command == "render-stream":
+        cmd_render_stream(engine, args.input, args.registry, args.channels, args.check)
 
 
 if __name__ == "__main__":
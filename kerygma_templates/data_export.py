@@ -3,18 +3,37 @@
 Produces:
   data/template-registry.json — template inventory, quality summary, channel limits
 
+Export is incremental: quality results are cached per template in
+data/.quality-cache.json, keyed on the template's content hash, so only
+new or edited templates are re-rendered and re-checked (across worker
+processes with ``--jobs``), and template-registry.json is rewritten only
+when something other than its timestamp changed.
+
 No external dependencies required.
 """
 from __future__ import annotations
 
+import argparse
+import hashlib
 import json
+from collections.abc import Iterable
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from kerygma_templates import __version__
 from kerygma_templates.cli import sample_context
-from kerygma_templates.engine import TemplateEngine
-from kerygma_templates.quality_checker import CHANNEL_LIMITS, QualityChecker
+from kerygma_templates.engine import Template, TemplateEngine
+from kerygma_templates.parallel import ParallelRenderer, RenderJob
+from kerygma_templates.quality_checker import (
+    ANTI_PATTERNS,
+    CHANNEL_COUNTING,
+    CHANNEL_LIMITS,
+    QualityChecker,
+    QualityReport,
+)
+
+QUALITY_CACHE_NAME = ".quality-cache.json"
 
 
 def _find_templates_dir() -> Path:
@@ -28,13 +47,19 @@ def _find_templates_dir() -> Path:
     return pkg_dir
 
 
-def build_template_registry(templates_dir: Path | None = None) -> dict[str, Any]:
-    """Load all templates and build a registry with metadata."""
+def _load_engine(templates_dir: Path | None) -> TemplateEngine:
     templates_dir = templates_dir or _find_templates_dir()
     engine = TemplateEngine()
     if templates_dir.is_dir():
         engine.load_directory(templates_dir)
+    return engine
 
+
+def build_template_registry(
+    templates_dir: Path | None = None, engine: TemplateEngine | None = None,
+) -> dict[str, Any]:
+    """Build a registry with metadata from ``engine`` (or templates loaded from templates_dir)."""
+    engine = engine or _load_engine(templates_dir)
     templates = engine.list_templates()
     categories = sorted({t.category for t in templates})
     all_channels = sorted({ch for t in templates for ch in t.channels})
@@ -56,84 +81,173 @@ def build_template_registry(templates_dir: Path | None = None) -> dict[str, Any]
     }
 
 
-def build_quality_summary(templates_dir: Path | None = None) -> dict[str, Any]:
-    """Run quality checks on all templates with sample context."""
-    templates_dir = templates_dir or _find_templates_dir()
-    engine = TemplateEngine()
-    if templates_dir.is_dir():
-        engine.load_directory(templates_dir)
+def _checker_fingerprint(checker: QualityChecker, context: dict[str, Any]) -> str:
+    """Hash of everything besides the template that decides quality results."""
+    config = {
+        "version": __version__,
+        "context": context,
+        "limits": CHANNEL_LIMITS,
+        "counting": CHANNEL_COUNTING,
+        "anti_patterns": ANTI_PATTERNS,
+        "checks": {ch: checker.check_names(ch) for ch in CHANNEL_LIMITS},
+        "default_checks": checker.check_names(),
+    }
+    data = json.dumps(config, sort_keys=True, default=repr)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def _summarize(
+    template_id: str, outcomes: Iterable[tuple[str, QualityReport | Exception]],
+) -> dict[str, Any]:
+    """Quality counts and failure details for one template's channels."""
+    summary: dict[str, Any] = {
+        "total_checks": 0, "passed": 0, "failed": 0, "warnings": 0, "failure_details": [],
+    }
+    for ch, outcome in outcomes:
+        if isinstance(outcome, Exception):
+            summary["total_checks"] += 1
+            summary["failed"] += 1
+            summary["failure_details"].append({
+                "template_id": template_id,
+                "channel": ch,
+                "check": "render",
+                "severity": "error",
+                "message": str(outcome),
+            })
+            continue
+        for check in outcome.checks:
+            summary["total_checks"] += 1
+            if check.passed:
+                summary["passed"] += 1
+                continue
+            severity = "warning" if check.severity == "warning" else "error"
+            summary["warnings" if severity == "warning" else "failed"] += 1
+            summary["failure_details"].append({
+                "template_id": template_id,
+                "channel": ch,
+                "check": check.check_name,
+                "severity": severity,
+                "message": check.message,
+            })
+    return summary
 
+
+def _check_templates(
+    engine: TemplateEngine,
+    checker: QualityChecker,
+    templates: list[Template],
+    context: dict[str, Any],
+    jobs: int,
+) -> dict[str, dict[str, Any]]:
+    """Render and check every channel of ``templates``; returns summaries by id."""
+    render_jobs: list[RenderJob] = [
+        (t.template_id, context, ch) for t in templates for ch in t.channels
+    ]
+    outcomes: dict[str, list[tuple[str, QualityReport | Exception]]] = {
+        t.template_id: [] for t in templates
+    }
+    try:
+        renderer = ParallelRenderer(engine, checker, workers=jobs)
+        pairs = list(renderer.run(render_jobs))
+    except Exception:
+        # Find and record the failing renders one by one
+        for template_id, ctx, ch in render_jobs:
+            try:
+                result = engine.render(template_id, ctx, ch)
+                report = checker.check(result.text, ch, template_id, result.unresolved_vars)
+                outcomes[template_id].append((ch, report))
+            except Exception as exc:
+                outcomes[template_id].append((ch, exc))
+    else:
+        for result, report in pairs:
+            outcomes[result.template_id].append((result.channel, report))
+    return {template_id: _summarize(template_id, o) for template_id, o in outcomes.items()}
+
+
+def build_quality_summary(
+    templates_dir: Path | None = None,
+    engine: TemplateEngine | None = None,
+    jobs: int = 1,
+    cache_path: Path | None = None,
+) -> dict[str, Any]:
+    """Run quality checks on all templates with sample context.
+
+    With ``cache_path``, per-template results are read from and written
+    back to that file, and only templates whose content hash (or the
+    checker configuration) changed since are re-checked. ``jobs`` > 1
+    renders and checks across that many worker processes.
+    """
+    engine = engine or _load_engine(templates_dir)
     templates = engine.list_templates()
     context = sample_context()
     checker = QualityChecker()
 
-    total_checks = 0
-    passed = 0
-    failed = 0
-    warnings = 0
-    failure_details: list[dict[str, str]] = []
+    fingerprint = _checker_fingerprint(checker, context)
+    cached: dict[str, Any] = {}
+    if cache_path is not None and cache_path.exists():
+        try:
+            data = json.loads(cache_path.read_text(encoding="utf-8"))
+            if data.get("checker") == fingerprint:
+                cached = data["templates"]
+        except (ValueError, KeyError, TypeError):
+            cached = {}
 
-    for t in templates:
-        for ch in t.channels:
-            try:
-                result = engine.render(t.template_id, context, ch)
-                report = checker.check(
-                    result.text, ch, t.template_id, result.unresolved_vars,
-                )
-                for check in report.checks:
-                    total_checks += 1
-                    if check.passed:
-                        passed += 1
-                    elif check.severity == "warning":
-                        warnings += 1
-                        failure_details.append({
-                            "template_id": t.template_id,
-                            "channel": ch,
-                            "check": check.check_name,
-                            "severity": "warning",
-                            "message": check.message,
-                        })
-                    else:
-                        failed += 1
-                        failure_details.append({
-                            "template_id": t.template_id,
-                            "channel": ch,
-                            "check": check.check_name,
-                            "severity": "error",
-                            "message": check.message,
-                        })
-            except Exception as exc:
-                total_checks += 1
-                failed += 1
-                failure_details.append({
-                    "template_id": t.template_id,
-                    "channel": ch,
-                    "check": "render",
-                    "severity": "error",
-                    "message": str(exc),
-                })
+    hashes = {t.template_id: t.content_hash() for t in templates}
+    stale = [
+        t for t in templates
+        if cached.get(t.template_id, {}).get("hash") != hashes[t.template_id]
+    ]
+    fresh = _check_templates(engine, checker, stale, context, jobs) if stale else {}
+    entries = {
+        t.template_id: {
+            "hash": hashes[t.template_id],
+            "summary": (
+                fresh[t.template_id] if t.template_id in fresh
+                else cached[t.template_id]["summary"]
+            ),
+        }
+        for t in templates
+    }
+    if cache_path is not None and (stale or entries.keys() != cached.keys()):
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(
+            json.dumps({"checker": fingerprint, "templates": entries}, indent=1) + "\n",
+            encoding="utf-8",
+        )
 
-    return {
-        "total_checks": total_checks,
-        "passed": passed,
-        "failed": failed,
-        "warnings": warnings,
-        "failure_details": failure_details,
+    quality: dict[str, Any] = {
+        "total_checks": 0, "passed": 0, "failed": 0, "warnings": 0, "failure_details": [],
     }
+    for entry in entries.values():
+        summary = entry["summary"]
+        for key in ("total_checks", "passed", "failed", "warnings"):
+            quality[key] += summary[key]
+        quality["failure_details"].extend(summary["failure_details"])
+    return quality
 
 
 def export_all(
     templates_dir: Path | None = None,
     output_dir: Path | None = None,
+    jobs: int = 1,
+    use_cache: bool = True,
 ) -> list[Path]:
-    """Generate all data artifacts and return output paths."""
+    """Generate all data artifacts and return the paths written.
+
+    Artifacts whose content (apart from ``generated_at``) is unchanged are
+    left alone and not returned. ``use_cache=False`` re-checks every template.
+    """
     templates_dir = templates_dir or _find_templates_dir()
     output_dir = output_dir or Path(__file__).parent.parent / "data"
     output_dir.mkdir(parents=True, exist_ok=True)
     outputs: list[Path] = []
 
-    registry = build_template_registry(templates_dir)
-    quality = build_quality_summary(templates_dir)
+    engine = _load_engine(templates_dir)
+    registry = build_template_registry(engine=engine)
+    cache_path = output_dir / QUALITY_CACHE_NAME
+    if not use_cache and cache_path.exists():
+        cache_path.unlink()
+    quality = build_quality_summary(engine=engine, jobs=jobs, cache_path=cache_path)
 
     data = {
         "generated_at": datetime.now(timezone.utc).isoformat(),
@@ -146,17 +260,42 @@ def export_all(
     }
 
     registry_path = output_dir / "template-registry.json"
-    registry_path.write_text(json.dumps(data, indent=2) + "\n")
-    outputs.append(registry_path)
+    if not _same_content(registry_path, data):
+        registry_path.write_text(json.dumps(data, indent=2) + "\n")
+        outputs.append(registry_path)
 
     return outputs
 
 
-def main() -> None:
+def _same_content(path: Path, data: dict[str, Any]) -> bool:
+    """Whether ``path`` already holds ``data``, ignoring generated_at."""
+    try:
+        existing = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return False
+    if not isinstance(existing, dict):
+        return False
+    existing.pop("generated_at", None)
+    return existing == {k: v for k, v in data.items() if k != "generated_at"}
+
+
+def main(argv: list[str] | None = None) -> None:
     """CLI entry point for data export."""
-    paths = export_all()
+    parser = argparse.ArgumentParser(
+        prog="announce-export", description="Generate data/template-registry.json",
+    )
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=1, help="Worker processes for rendering and checks",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Re-check every template, ignoring the cache",
+    )
+    args = parser.parse_args(argv)
+    paths = export_all(jobs=args.jobs, use_cache=not args.no_cache)
     for p in paths:
         print(f"Written: {p}")
+    if not paths:
+        print("Up to date: no artifacts changed.")
 
 
 if __name__ == "__main__":
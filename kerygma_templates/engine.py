@@ -1,86 +1,51 @@
-"""Regex-based template engine for announcement rendering.
+"""Compiled template engine for announcement rendering.
+
+Template bodies are compiled once, on registration, into per-channel trees
+of literal, variable and conditional nodes; rendering walks the cached tree.
 
 Supports:
-- Variable interpolation: {{ var }} and {{ var.path }}
-- Conditionals: {{#if condition}} ... {{/if}} and {{#if condition}} ... {{#else}} ... {{/if}}
+- Variable interpolation: {{ var }} and {{ var.path }}, with filters:
+  {{ var.path | truncate:200 | upper }} (see kerygma_templates.filters)
+- Conditionals: {{#if condition}} ... {{/if}} and {{#if condition}} ... {{#else}} ... {{/if}},
+  nested to any depth; unbalanced tags raise TemplateSyntaxError
+- Loops: {{#each list}} ... {{/each}}, with {{ this }} (or an ``as name``
+  alias), {{ @index }}, {{ @first }} and {{ @last }} in scope for each item,
+  an optional ``limit=N`` and an optional {{#else}} for empty lists
 - Channel blocks: {{#channel mastodon}} ... {{/channel}}
 - No external dependencies — stdlib only.
 """
 
 from __future__ import annotations
 
+import hashlib
+import inspect
 import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
-
-# --- YAML frontmatter parser (minimal, no pyyaml dependency) ---
-
-_FRONTMATTER_RE = re.compile(r"\A---\n(.*?)\n---\n", re.DOTALL)
-
+from typing import Any, TextIO
 
-def parse_frontmatter(text: str) -> tuple[dict[str, Any], str]:
-    """Parse YAML-like frontmatter from template text.
+from kerygma_templates.filters import resolve_filter
+from kerygma_templates.frontmatter import parse_frontmatter
 
-    Returns (metadata_dict, body_text). Handles simple key: value,
-    lists (- item), and comma-separated inline lists [a, b].
-    """
-    match = _FRONTMATTER_RE.match(text)
-    if not match:
-        return {}, text
-
-    raw = match.group(1)
-    body = text[match.end():]
-    meta: dict[str, Any] = {}
-    current_key: str | None = None
-    current_list: list[str] | None = None
-
-    for line in raw.split("\n"):
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-
-        # List continuation (indented "- item")
-        if stripped.startswith("- ") and current_key is not None and current_list is not None:
-            current_list.append(stripped[2:].strip())
-            meta[current_key] = current_list
-            continue
+# --- Template compiler ---
 
-        # Key-value line
-        if ":" in stripped:
-            # Flush any pending list
-            current_list = None
-
-            key, _, value = stripped.partition(":")
-            key = key.strip()
-            value = value.strip()
-            current_key = key
-
-            if not value:
-                # Next lines might be a list
-                current_list = []
-                meta[key] = current_list
-            elif value.startswith("[") and value.endswith("]"):
-                # Inline list: [a, b, c]
-                items = [v.strip().strip("'\"") for v in value[1:-1].split(",") if v.strip()]
-                meta[key] = items
-            elif value.lower() in ("true", "false"):
-                meta[key] = value.lower() == "true"
-            elif value.isdigit():
-                meta[key] = int(value)
-            else:
-                meta[key] = value.strip("'\"")
-
-    return meta, body
-
-
-# --- Template engine ---
-
-_VAR_RE = re.compile(r"\{\{\s*([\w.]+)\s*\}\}")
-_IF_RE = re.compile(
-    r"\{\{#if\s+([\w.]+)\s*\}\}(.*?)(?:\{\{#else\}\}(.*?))?\{\{/if\}\}",
-    re.DOTALL,
+_FILTER_ARG = r"(?:\"[^\"]*\"|'[^']*'|[^\s|,}\"']+)"
+_TOKEN_RE = re.compile(
+    r"\{\{#if\s+(?P<if>@?[\w.]+)\s*\}\}"
+    r"|(?P<each>\{\{#each\s+(?P<each_path>@?[\w.]+)"
+    r"(?:\s+as\s+(?P<each_as>\w+))?(?:\s+limit=(?P<each_limit>\d+))?\s*\}\})"
+    r"|(?P<else>\{\{#else\}\})"
+    r"|(?P<endif>\{\{/if\}\})"
+    r"|(?P<endeach>\{\{/each\}\})"
+    r"|(?P<var>\{\{\s*(?P<var_path>@?[\w.]+)"
+    rf"(?P<var_filters>(?:\s*\|\s*\w+(?::\s*{_FILTER_ARG}(?:\s*,\s*{_FILTER_ARG})*)?)*)"
+    r"\s*\}\})"
 )
+_FILTER_RE = re.compile(rf"\|\s*(\w+)(?::\s*((?:{_FILTER_ARG}(?:\s*,\s*)?)+))?")
+_FILTER_ARG_RE = re.compile(_FILTER_ARG)
 _CHANNEL_RE = re.compile(
     r"\{\{#channel\s+([\w]+)\s*\}\}(.*?)\{\{/channel\}\}",
     re.DOTALL,
@@ -112,7 +77,575 @@ def _is_truthy(value: Any) -> bool:
     return bool(value)
 
 
+class TemplateSyntaxError(ValueError):
+    """Raised when a template body has unbalanced or misplaced block tags.
+
+    ``lineno`` counts from the first line of the template body.
+    """
+
+    def __init__(self, message: str, lineno: int, template_id: str = "", channel: str = ""):
+        super().__init__(message)
+        self.message = message
+        self.lineno = lineno
+        self.template_id = template_id
+        self.channel = channel
+
+    def __str__(self) -> str:
+        where = f"line {self.lineno}"
+        if self.channel:
+            where = f"channel {self.channel}, {where}"
+        if self.template_id:
+            where = f"{self.template_id}: {where}"
+        return f"{where}: {self.message}"
+
+
+@dataclass(slots=True)
+class _Text:
+    """Literal text, emitted as-is."""
+    text: str
+
+
+@dataclass(slots=True)
+class _Filter:
+    """A filter bound to its arguments at compile time."""
+    name: str
+    func: Callable[..., Any]
+    args: tuple[Any, ...] = ()
+
+
+@dataclass(slots=True)
+class _Var:
+    """A {{ var.path | filter }} slot. Unresolved paths emit the original tag."""
+    path: str
+    raw: str
+    filters: tuple[_Filter, ...] = ()
+
+
+@dataclass(slots=True)
+class _If:
+    """A {{#if path}} ... {{#else}} ... {{/if}} block."""
+    path: str
+    then: list[_Node] = field(default_factory=list)
+    otherwise: list[_Node] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class _Each:
+    """A {{#each path [as alias] [limit=N]}} ... {{#else}} ... {{/each}} block."""
+    path: str
+    alias: str | None = None
+    limit: int | None = None
+    body: list[_Node] = field(default_factory=list)
+    otherwise: list[_Node] = field(default_factory=list)
+
+    @property
+    def item_name(self) -> str:
+        return self.alias or "this"
+
+
+_Node = _Text | _Var | _If | _Each
+
+# Names bound for each item of a loop, besides the item itself
+_LOOP_NAMES = ("@index", "@first", "@last")
+
+
+def _apply_filters(value: Any, filters: tuple[_Filter, ...]) -> Any:
+    for f in filters:
+        value = f.func(value, *f.args)
+    return value
+
+
+def _filter_arg(token: str) -> Any:
+    if token[0] in "\"'":
+        return token[1:-1]
+    return int(token) if token.lstrip("-").isdigit() else token
+
+
+def _compile_filters(spec: str) -> tuple[_Filter, ...]:
+    """Resolve a ``| name:arg, ...`` chain to bound filters.
+
+    Raises ValueError for an unknown filter or arguments it does not accept.
+    """
+    filters: list[_Filter] = []
+    for match in _FILTER_RE.finditer(spec):
+        name, arg_text = match.groups()
+        args = tuple(_filter_arg(a) for a in _FILTER_ARG_RE.findall(arg_text or ""))
+        try:
+            func = resolve_filter(name)
+        except KeyError:
+            raise ValueError(f"unknown filter '{name}'") from None
+        try:
+            inspect.signature(func).bind(None, *args)
+        except TypeError:
+            raise ValueError(f"filter '{name}' does not take {len(args)} argument(s)") from None
+        except ValueError:
+            pass  # No signature to check, as for some builtins
+        filters.append(_Filter(name, func, args))
+    return tuple(filters)
+
+
+def _tag(node: _If | _Each) -> str:
+    kind = "if" if isinstance(node, _If) else "each"
+    return f"{{{{#{kind} {node.path}}}}}"
+
+
+def _strip_nodes(nodes: list[_Node]) -> None:
+    """Strip whitespace from the literal edges of a branch, like str.strip()."""
+    if nodes and isinstance(nodes[0], _Text):
+        nodes[0] = _Text(nodes[0].text.lstrip())
+        if not nodes[0].text:
+            nodes.pop(0)
+    if nodes and isinstance(nodes[-1], _Text):
+        nodes[-1] = _Text(nodes[-1].text.rstrip())
+        if not nodes[-1].text:
+            nodes.pop()
+
+
+def compile_block(text: str, first_line: int = 1) -> list[_Node]:
+    """Compile block text into a tree of literal, variable, conditional and loop nodes.
+
+    One left-to-right pass with an explicit stack of open {{#if}}/{{#each}}
+    blocks, so nesting depth is unbounded and every {{#else}}, {{/if}} and
+    {{/each}} pairs with the innermost open block. Conditional branches are
+    stripped of surrounding whitespace; a loop body keeps its whitespace,
+    except that a line break right after {{#each}}, and one after a
+    {{/each}} that starts a line, are dropped so a loop written on its own
+    lines emits one copy of its body per item. Raises TemplateSyntaxError
+    for unbalanced or misplaced tags; ``first_line`` is the line number of
+    ``text`` within its template.
+    """
+    def lineno(pos: int) -> int:
+        return first_line + text.count("\n", 0, pos)
+
+    root: list[_Node] = []
+    # Open blocks: (offset of opening tag, node, enclosing branch)
+    stack: list[tuple[int, _If | _Each, list[_Node]]] = []
+    current = root
+    pos = 0
+
+    for match in _TOKEN_RE.finditer(text):
+        if match.start() > pos:
+            current.append(_Text(text[pos:match.start()]))
+        pos = match.end()
+        kind = match.lastgroup
+        if kind == "var":
+            spec = match.group("var_filters")
+            try:
+                filters = _compile_filters(spec) if spec else ()
+            except ValueError as exc:
+                raise TemplateSyntaxError(str(exc), lineno(match.start())) from None
+            current.append(_Var(match.group("var_path"), match.group(0), filters))
+        elif kind == "if":
+            node = _If(match.group("if"))
+            current.append(node)
+            stack.append((match.start(), node, current))
+            current = node.then
+        elif kind == "each":
+            limit = match.group("each_limit")
+            node = _Each(
+                match.group("each_path"), match.group("each_as"),
+                int(limit) if limit is not None else None,
+            )
+            current.append(node)
+            stack.append((match.start(), node, current))
+            current = node.body
+            if text.startswith("\n", pos):
+                pos += 1
+        elif kind == "else":
+            if not stack:
+                raise TemplateSyntaxError(
+                    "{{#else}} outside of an {{#if}} or {{#each}} block", lineno(match.start()),
+                )
+            node = stack[-1][1]
+            if current is node.otherwise:
+                raise TemplateSyntaxError(
+                    f"duplicate {{{{#else}}}} in {_tag(node)}", lineno(match.start()),
+                )
+            current = node.otherwise
+        else:
+            block = "if" if kind == "endif" else "each"
+            if not stack:
+                raise TemplateSyntaxError(
+                    f"{{{{/{block}}}}} without a matching {{{{#{block}}}}}", lineno(match.start()),
+                )
+            node = stack[-1][1]
+            if isinstance(node, _If) is (block != "if"):
+                raise TemplateSyntaxError(
+                    f"{{{{/{block}}}}} closes {_tag(node)}", lineno(match.start()),
+                )
+            _, node, current = stack.pop()
+            if isinstance(node, _If):
+                _strip_nodes(node.then)
+            elif text.startswith("\n", pos) and (
+                match.start() == 0 or text[match.start() - 1] == "\n"
+            ):
+                pos += 1
+            _strip_nodes(node.otherwise)
+    if pos < len(text):
+        current.append(_Text(text[pos:]))
+
+    if stack:
+        start, node, _ = stack[-1]
+        raise TemplateSyntaxError(f"unclosed {_tag(node)}", lineno(start))
+    return root
+
+
+def render_nodes(
+    nodes: list[_Node],
+    context: dict[str, Any],
+    resolved: dict[str, Any] | None = None,
+) -> tuple[str, list[str]]:
+    """Walk a compiled node tree. Returns (text, unresolved_vars).
+
+    ``resolved`` memoizes variable lookups and may be shared between
+    renders of the same context. See iter_nodes for the walk itself.
+    """
+    unresolved: list[str] = []
+    return "".join(iter_nodes(nodes, context, unresolved, resolved)), unresolved
+
+
+def _iter_items(
+    node: _Each, items: list[Any] | tuple[Any, ...], scope: dict[str, Any], memo: dict[str, Any],
+) -> Iterator[_Node]:
+    """Yield a loop body once per item, rebinding the loop names in ``scope`` between items."""
+    name = node.item_name
+    last = len(items) - 1
+    for index, item in enumerate(items):
+        memo.clear()
+        scope[name] = item
+        scope["@index"] = index
+        scope["@first"] = index == 0
+        scope["@last"] = index == last
+        yield from node.body
+
+
+def iter_nodes(
+    nodes: list[_Node],
+    context: dict[str, Any],
+    unresolved: list[str],
+    resolved: dict[str, Any] | None = None,
+) -> Iterator[str]:
+    """Walk a compiled node tree, yielding output pieces as it goes.
+
+    Iterative, so deeply nested conditionals and loops do not hit the
+    recursion limit. Unresolved paths are appended to ``unresolved`` and
+    ``resolved`` memoizes variable lookups as in render_nodes. Nothing is
+    buffered, and loop items are yielded in turn like everything else, so
+    a loop renders in time linear in its output and memory does not grow
+    with it.
+    """
+    return _walk(nodes, context, unresolved, resolved, False)
+
+
+@dataclass(frozen=True, slots=True)
+class WalkMark:
+    """Where a piece yielded by walk_nodes comes from.
+
+    ``kind`` is one of:
+
+    - ``"var"``: the next piece is the value of the variable at ``path``
+    - ``"missing"``: the next piece is the tag of an unresolved variable
+    - ``"section"``: a truthy ``{{#if path}}`` without ``{{#else}}`` opens
+    - ``"loop"``: an ``{{#each path}}`` opens, with its ``{{#else}}`` if empty
+    - ``"end"``: the innermost open section or loop closes
+    """
+    kind: str
+    path: str
+
+
+def walk_nodes(
+    nodes: list[_Node],
+    context: dict[str, Any],
+    unresolved: list[str],
+    resolved: dict[str, Any] | None = None,
+) -> Iterator[str | WalkMark]:
+    """Walk a node tree like iter_nodes, with WalkMarks between the pieces.
+
+    The strings alone are exactly iter_nodes' output.
+    """
+    return _walk(nodes, context, unresolved, resolved, True)
+
+
+def _walk(
+    nodes: list[_Node],
+    context: dict[str, Any],
+    unresolved: list[str],
+    resolved: dict[str, Any] | None,
+    marks: bool,
+) -> Iterator[Any]:
+    if resolved is None:
+        resolved = {}
+    stack = [iter(nodes)]
+    # Enclosing (context, resolved) of each open loop, by its stack depth
+    scopes: list[tuple[int, dict[str, Any], dict[str, Any]]] = []
+    # Marked sections and loops still open, by stack depth
+    opened: list[tuple[int, str]] = []
+    while stack:
+        for node in stack[-1]:
+            if isinstance(node, _Text):
+                yield node.text
+                continue
+            path = node.path
+            if path in resolved:
+                value = resolved[path]
+            else:
+                value = resolved[path] = _resolve_var(context, path)
+            if isinstance(node, _Var):
+                if value is None:
+                    unresolved.append(path)
+                    if marks:
+                        yield WalkMark("missing", path)
+                    yield node.raw  # Leave unresolved vars as-is
+                    continue
+                if marks:
+                    yield WalkMark("var", path)
+                if node.filters:
+                    yield str(_apply_filters(value, node.filters))
+                else:
+                    yield str(value)
+            elif isinstance(node, _If):
+                if not _is_truthy(value):
+                    stack.append(iter(node.otherwise))
+                    break
+                if marks and not node.otherwise:
+                    opened.append((len(stack), path))
+                    yield WalkMark("section", path)
+                stack.append(iter(node.then))
+                break
+            else:
+                if marks:
+                    opened.append((len(stack), path))
+                    yield WalkMark("loop", path)
+                items = value if isinstance(value, (list, tuple)) else ()
+                if node.limit is not None:
+                    items = items[:node.limit]
+                if not items:
+                    stack.append(iter(node.otherwise))
+                    break
+                scopes.append((len(stack), context, resolved))
+                context, resolved = dict(context), {}
+                stack.append(_iter_items(node, items, context, resolved))
+                break
+        else:
+            stack.pop()
+            if scopes and scopes[-1][0] == len(stack):
+                _, context, resolved = scopes.pop()
+            if opened and opened[-1][0] == len(stack):
+                yield WalkMark("end", opened.pop()[1])
+
+
+def clean_text(text: str) -> str:
+    """Collapse runs of blank lines to one and strip the text, as renders do."""
+    lines = text.split("\n")
+    cleaned: list[str] = []
+    prev_blank = False
+    for line in lines:
+        is_blank = line.strip() == ""
+        if is_blank and prev_blank:
+            continue
+        cleaned.append(line)
+        prev_blank = is_blank
+    return "\n".join(cleaned).strip()
+
+
+def clean_chunks(chunks: Iterable[str]) -> Iterator[str]:
+    """Apply clean_text to text arriving in pieces.
+
+    Joining the output equals cleaning the joined input: runs of blank
+    lines collapse to one and the text is stripped. Complete lines are
+    cleaned as they arrive; only the unfinished last line and whitespace
+    that may still turn out to be trailing are held back.
+    """
+    partial: list[str] = []  # Pieces of the unfinished last line
+    held = ""  # Whitespace after the last text yielded
+    prev_blank = False
+    first = True  # No line kept yet
+    started = False  # Leading whitespace already stripped
+
+    def clean(lines: list[str]) -> str:
+        nonlocal prev_blank, first
+        kept: list[str] = []
+        for line in lines:
+            is_blank = line.strip() == ""
+            if is_blank and prev_blank:
+                continue
+            kept.append(line)
+            prev_blank = is_blank
+        if not kept:
+            return ""
+        text = "\n".join(kept)
+        if first:
+            first = False
+            return text
+        return "\n" + text
+
+    def strip_edges(text: str) -> str:
+        nonlocal held, started
+        if not started:
+            text = text.lstrip()
+            if not text:
+                return ""
+            started = True
+        body = text.rstrip()
+        if not body:
+            held += text
+            return ""
+        ready = held + body
+        held = text[len(body):]
+        return ready
+
+    for chunk in chunks:
+        partial.append(chunk)
+        if "\n" not in chunk:
+            continue
+        lines = "".join(partial).split("\n")
+        partial = [lines.pop()]
+        text = strip_edges(clean(lines))
+        if text:
+            yield text
+    text = strip_edges(clean(["".join(partial)]))
+    if text:
+        yield text
+
+
+def _gather(pieces: Iterable[str], size: int) -> Iterator[str]:
+    """Join consecutive pieces into chunks of at least ``size`` characters (except the last)."""
+    pending: list[str] = []
+    total = 0
+    for piece in pieces:
+        pending.append(piece)
+        total += len(piece)
+        if total >= size:
+            yield "".join(pending)
+            pending.clear()
+            total = 0
+    if pending:
+        yield "".join(pending)
+
+
+def referenced_paths(nodes: list[_Node]) -> tuple[str, ...]:
+    """Context paths read by a node tree (variables, conditions and loops), in first-use order.
+
+    Paths inside a loop body that start at the loop's own names (the item,
+    ``@index`` and so on) are read from the loop, not the context, and are
+    left out.
+    """
+    paths: dict[str, None] = {}
+    stack: list[tuple[list[_Node], frozenset[str]]] = [(nodes, frozenset())]
+    while stack:
+        branch, local = stack.pop()
+        for node in branch:
+            if isinstance(node, _Text):
+                continue
+            if node.path.split(".", 1)[0] not in local:
+                paths[node.path] = None
+            if isinstance(node, _If):
+                stack.append((node.otherwise, local))
+                stack.append((node.then, local))
+            elif isinstance(node, _Each):
+                stack.append((node.otherwise, local))
+                stack.append((node.body, local.union(_LOOP_NAMES, (node.item_name,))))
+    return tuple(paths)
+
+
+def project_context(context: dict[str, Any], paths: Iterable[str]) -> dict[str, Any]:
+    """Copy only the given dotted paths of ``context`` into a new nested dict.
+
+    Rendering with the result gives the same output as with ``context`` for
+    a template that reads nothing but ``paths``. Paths that do not resolve
+    are left out; a path whose parent is also listed is covered by it. Leaf
+    values are shared, not copied.
+    """
+    projected: dict[str, Any] = {}
+    kept: set[str] = set()
+    for path in sorted(set(paths), key=lambda p: p.count(".")):
+        parts = path.split(".")
+        if any(".".join(parts[:i]) in kept for i in range(1, len(parts))):
+            continue
+        value = _resolve_var(context, path)
+        if value is None:
+            continue
+        kept.add(path)
+        target = projected
+        for part in parts[:-1]:
+            target = target.setdefault(part, {})
+        target[parts[-1]] = value
+    return projected
+
+
 @dataclass
+class RenderPlan:
+    """Compiled node trees for each channel block of a template body.
+
+    The context paths each block reads are computed once, on construction.
+    """
+    channels: dict[str, list[_Node]] = field(default_factory=dict)
+    default: list[_Node] = field(default_factory=list)
+    dependencies: dict[str, tuple[str, ...]] = field(init=False, repr=False, compare=False)
+    default_dependencies: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    # Top-level context keys of the dependencies
+    roots: dict[str, tuple[str, ...]] = field(init=False, repr=False, compare=False)
+    default_roots: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.dependencies = {
+            name: referenced_paths(nodes) for name, nodes in self.channels.items()
+        }
+        self.default_dependencies = referenced_paths(self.default)
+        self.roots = {name: _roots(paths) for name, paths in self.dependencies.items()}
+        self.default_roots = _roots(self.default_dependencies)
+
+    @classmethod
+    def compile(cls, body: str) -> RenderPlan:
+        """Compile a template body into per-channel node trees.
+
+        Raises TemplateSyntaxError if any block has unbalanced tags.
+        """
+        matches = list(_CHANNEL_RE.finditer(body))
+        if not matches:
+            return cls(default=compile_block(body))
+
+        channels: dict[str, list[_Node]] = {}
+        for match in matches:
+            name, content = match.group(1), match.group(2)
+            # First block wins when a channel is declared twice
+            if name in channels:
+                continue
+            start = match.start(2) + len(content) - len(content.lstrip())
+            try:
+                channels[name] = compile_block(content.strip(), body.count("\n", 0, start) + 1)
+            except TemplateSyntaxError as exc:
+                exc.channel = name
+                raise
+        # Channel not found — render the text outside channel blocks
+        outside = _CHANNEL_RE.sub("", body).strip()
+        try:
+            default = compile_block(outside)
+        except TemplateSyntaxError as exc:
+            exc.channel = "(outside channel blocks)"
+            raise
+        return cls(channels=channels, default=default)
+
+    def for_channel(self, channel: str) -> list[_Node]:
+        return self.channels.get(channel, self.default)
+
+    def dependencies_for(self, channel: str) -> tuple[str, ...]:
+        """Context paths (variables and conditions) read when rendering ``channel``."""
+        return self.dependencies.get(channel, self.default_dependencies)
+
+    def roots_for(self, channel: str) -> tuple[str, ...]:
+        """Top-level context keys read when rendering ``channel``."""
+        return self.roots.get(channel, self.default_roots)
+
+
+def _roots(paths: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(dict.fromkeys(path.split(".", 1)[0] for path in paths))
+
+
+# --- Template engine ---
+
+
+@dataclass(slots=True)
 class RenderResult:
     """Result of rendering a template."""
     template_id: str
@@ -120,6 +653,7 @@ class RenderResult:
     text: str
     metadata: dict[str, Any] = field(default_factory=dict)
     unresolved_vars: list[str] = field(default_factory=list)
+    degradations: list[str] = field(default_factory=list)  # Set by fit_render
 
 
 @dataclass
@@ -131,17 +665,27 @@ class Template:
     variables: list[str]
     body: str
     metadata: dict[str, Any] = field(default_factory=dict)
+    plan: RenderPlan | None = field(default=None, repr=False, compare=False)
 
     @classmethod
     def from_file(cls, path: Path) -> Template:
         """Load and parse a template from a file."""
         text = path.read_text(encoding="utf-8")
-        return cls.from_string(text)
+        return cls.from_string(text, path)
+
+    @classmethod
+    def from_string(cls, text: str, path: Path | None = None) -> Template:
+        """Parse a template from a string.
+
+        Raises FrontmatterError (naming ``path``, if given) for malformed
+        frontmatter.
+        """
+        meta, body = parse_frontmatter(text, path)
+        return cls.from_metadata(meta, body)
 
     @classmethod
-    def from_string(cls, text: str) -> Template:
-        """Parse a template from a string."""
-        meta, body = parse_frontmatter(text)
+    def from_metadata(cls, meta: dict[str, Any], body: str) -> Template:
+        """Build a template from already-parsed frontmatter and its body."""
         return cls(
             template_id=meta.get("template_id", "unknown"),
             category=meta.get("category", "general"),
@@ -151,117 +695,625 @@ def from_string(cls, text: str) -> Template:
             metadata=meta,
         )
 
+    def compile(self) -> RenderPlan:
+        """Compile the body into a render plan and cache it on the template.
+
+        Raises TemplateSyntaxError if the body has unbalanced block tags.
+        """
+        try:
+            self.plan = RenderPlan.compile(self.body)
+        except TemplateSyntaxError as exc:
+            exc.template_id = self.template_id
+            raise
+        return self.plan
+
+    def dependencies(self, channel: str | None = None) -> tuple[str, ...]:
+        """Context paths the template reads for ``channel``, in first-use order.
+
+        With no channel, the union over the declared channels (or the text
+        outside channel blocks if none are declared).
+        """
+        plan = self.plan or self.compile()
+        if channel is not None:
+            return plan.dependencies_for(channel)
+        if not self.channels:
+            return plan.default_dependencies
+        paths: dict[str, None] = {}
+        for ch in self.channels:
+            paths.update(dict.fromkeys(plan.dependencies_for(ch)))
+        return tuple(paths)
+
+    def check_variables(self) -> VariableReport:
+        """Compare the declared ``variables`` with the paths the template reads.
+
+        A declared path also covers the paths below it (``event`` covers
+        ``event.title``).
+        """
+        declared = set(self.variables)
+        used = self.dependencies()
+        return VariableReport(
+            template_id=self.template_id,
+            undeclared=[path for path in used if not _covered(path, declared)],
+            unused=[var for var in self.variables if not any(
+                path == var or path.startswith(var + ".") for path in used
+            )],
+        )
+
+    def content_hash(self) -> str:
+        """SHA-256 of the body and frontmatter; changes whenever rendering could."""
+        digest = hashlib.sha256(self.body.encode("utf-8"))
+        digest.update(repr(self.metadata).encode("utf-8"))
+        return digest.hexdigest()
+
+
+def _covered(path: str, declared: set[str]) -> bool:
+    parts = path.split(".")
+    return any(".".join(parts[:i]) in declared for i in range(1, len(parts) + 1))
+
+
+@dataclass(slots=True)
+class VariableReport:
+    """Declared template variables checked against the paths actually read."""
+    template_id: str
+    undeclared: list[str] = field(default_factory=list)  # Read but not declared
+    unused: list[str] = field(default_factory=list)  # Declared but never read
+
+    @property
+    def ok(self) -> bool:
+        return not self.undeclared and not self.unused
+
+
+@dataclass
+class SourceStamp:
+    """Identity of a template source file when it was last loaded."""
+    size: int
+    mtime_ns: int
+    sha256: str
+    template_id: str | None = None  # None for .md files without frontmatter
+
+
+@dataclass
+class RefreshReport:
+    """Template ids changed by TemplateEngine.refresh()."""
+    added: list[str] = field(default_factory=list)
+    updated: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.updated or self.removed)
+
+
+def read_source(path: Path) -> tuple[str, SourceStamp]:
+    """Read a template source file. Returns (text, stamp without template_id)."""
+    data = path.read_bytes()
+    stat = path.stat()
+    stamp = SourceStamp(stat.st_size, stat.st_mtime_ns, hashlib.sha256(data).hexdigest())
+    # Universal newlines, as Path.read_text() would give
+    text = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    return text, stamp
+
+
+_CacheKey = tuple[str, str, str, tuple[Any, ...]]
+
+
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _fingerprint(value: Any) -> Any:
+    """Hashable key for a context value, or None if it has no reliable one.
+
+    The type keeps 1, 1.0 and True (equal, same hash) apart; lists, tuples
+    and dicts are keyed by their items. Any other object may render
+    differently under the same repr() (the default repr is a memory
+    address, and addresses are reused), so it gets no key.
+    """
+    cls = value.__class__
+    if cls in _SCALAR_TYPES:
+        return cls, value
+    if cls is list or cls is tuple:
+        items = tuple(_fingerprint(item) for item in value)
+    elif cls is dict:
+        items = tuple(_fingerprint(part) for pair in value.items() for part in pair)
+    else:
+        return None
+    return None if None in items else (cls, items)
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """Counters of a RenderCache."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+    maxsize: int = 0
+
+
+class RenderCache:
+    """Bounded LRU cache of render results.
+
+    Entries are keyed on the template id, a hash of the template's content,
+    the channel, and a fingerprint of only the context values the channel's
+    plan reads, so contexts differing elsewhere share an entry. Values are
+    fingerprinted by type and value, recursing into lists, tuples and
+    dicts; renders reading any other kind of object are not cached.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._entries: OrderedDict[_CacheKey, RenderResult] = OrderedDict()
+        # template_id -> (template object, content hash)
+        self._templates: dict[str, tuple[Template, str]] = {}
+        self._stats = CacheStats(maxsize=maxsize)
+        self._lock = threading.Lock()
+
+    def key(
+        self, tmpl: Template, channel: str, context: dict[str, Any], resolved: dict[str, Any],
+    ) -> _CacheKey | None:
+        """Build the cache key for a render, resolving referenced paths into ``resolved``.
+
+        Returns None if a value read has no fingerprint; such renders are
+        neither looked up nor stored.
+        """
+        info = self._templates.get(tmpl.template_id)
+        if info is None or info[0] is not tmpl:
+            info = self._templates[tmpl.template_id] = (tmpl, tmpl.content_hash())
+        plan = tmpl.plan or tmpl.compile()
+        values: list[Any] = []
+        for path in plan.dependencies_for(channel):
+            if path in resolved:
+                value = resolved[path]
+            else:
+                value = resolved[path] = _resolve_var(context, path)
+            fingerprint = _fingerprint(value)
+            if fingerprint is None:
+                return None
+            values.append(fingerprint)
+        return tmpl.template_id, info[1], channel, tuple(values)
+
+    def get(self, key: _CacheKey) -> RenderResult | None:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+        return _copy_result(result)
+
+    def put(self, key: _CacheKey, result: RenderResult) -> None:
+        with self._lock:
+            self._entries[key] = _copy_result(result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def invalidate(self, template_id: str | None = None) -> int:
+        """Drop entries for ``template_id`` (all entries if None). Returns count dropped."""
+        with self._lock:
+            if template_id is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+                self._templates.clear()
+                return dropped
+            self._templates.pop(template_id, None)
+            stale = [key for key in self._entries if key[0] == template_id]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            s = self._stats
+            return CacheStats(s.hits, s.misses, s.evictions, len(self._entries), self.maxsize)
+
+
+def _copy_result(result: RenderResult) -> RenderResult:
+    # Callers may mutate what they get back; the cached entry must not change
+    return RenderResult(
+        result.template_id, result.channel, result.text,
+        result.metadata, list(result.unresolved_vars), list(result.degradations),
+    )
+
 
 class TemplateEngine:
-    """Renders templates with variable interpolation, conditionals, and channel blocks."""
+    """Renders templates with variable interpolation, conditionals, and channel blocks.
+
+    Templates are compiled into a RenderPlan when registered, so rendering
+    only walks the cached node tree for the requested channel.
 
-    def __init__(self) -> None:
+    The template table is replaced, never mutated, when it changes, so a
+    render or batch that has looked templates up keeps a consistent snapshot
+    while refresh() swaps in edited templates.
+
+    With ``cache_size`` > 0, render results are memoized in a RenderCache;
+    entries of a template are dropped whenever it is registered or reloaded.
+
+    An engine with a ``parent`` (see overlay()) is a namespace layered on
+    top of it: it stores only the templates registered or loaded into it,
+    and looks up every other template in the parent chain, so the parent's
+    parsed templates and compiled plans are shared rather than copied.
+    Changes to the parent are seen by its overlays straight away.
+    """
+
+    def __init__(self, cache_size: int = 0, parent: TemplateEngine | None = None) -> None:
         self._templates: dict[str, Template] = {}
+        self._sources: dict[Path, SourceStamp] = {}
+        self._owners: dict[str, Path] = {}  # template_id -> source it was loaded from
+        self._directories: list[Path] = []
+        self._lock = threading.Lock()
+        self.cache: RenderCache | None = RenderCache(cache_size) if cache_size > 0 else None
+        self.parent = parent
+
+    def overlay(self, cache_size: int = 0) -> TemplateEngine:
+        """Return an empty engine layered on this one, for per-project overrides.
+
+        Templates registered or loaded into the overlay shadow this engine's
+        templates of the same id; the rest resolve here. An override whose
+        body matches the template it shadows (one that only changes the
+        frontmatter, say) shares that template's body and plan.
+        """
+        return TemplateEngine(cache_size, parent=self)
 
     def register(self, template: Template) -> None:
-        self._templates[template.template_id] = template
+        """Register a template, compiling it unless it already carries a plan."""
+        template = self._prepare(template)
+        with self._lock:
+            self._templates = {**self._templates, template.template_id: template}
+        self._invalidate([template.template_id])
 
     def load_directory(self, directory: Path) -> int:
-        """Load all .md templates from a directory tree. Returns count loaded."""
-        count = 0
+        """Load all .md templates from a directory tree. Returns count loaded.
+
+        The directory is remembered so that refresh() can pick up edits.
+        """
+        loaded: dict[str, Template] = {}
+        stamps: dict[Path, SourceStamp] = {}
         for path in sorted(directory.rglob("*.md")):
-            text = path.read_text(encoding="utf-8")
+            text, stamp = read_source(path)
             if text.startswith("---\n"):
-                tmpl = Template.from_file(path)
-                self.register(tmpl)
-                count += 1
-        return count
+                tmpl = self._prepare(Template.from_string(text, path))
+                loaded[tmpl.template_id] = tmpl
+                stamp.template_id = tmpl.template_id
+            stamps[path] = stamp
+        with self._lock:
+            self._templates = {**self._templates, **loaded}
+        self._invalidate(loaded)
+        self.track_sources(directory, stamps)
+        return sum(1 for stamp in stamps.values() if stamp.template_id is not None)
+
+    def track_sources(self, directory: Path, stamps: dict[Path, SourceStamp]) -> None:
+        """Record the source stamps of templates loaded from ``directory``.
+
+        load_directory() does this itself; other loaders (such as bundles)
+        call it so that refresh() can compare against what they loaded.
+        """
+        with self._lock:
+            if directory not in self._directories:
+                self._directories.append(directory)
+            self._sources.update(stamps)
+            for path, stamp in stamps.items():
+                if stamp.template_id is not None:
+                    self._owners[stamp.template_id] = path
+
+    def refresh(self) -> RefreshReport:
+        """Re-parse only the template files that changed since they were loaded.
+
+        Files are compared by size and mtime first, then by content hash.
+        New files are added. A template whose file was deleted (or now
+        declares another id) is dropped, unless another file still
+        provides its id, which is then loaded instead; so renaming a file
+        reports an update rather than a removal. All
+        changes are parsed and compiled before the template table is
+        swapped, so a FrontmatterError or TemplateSyntaxError leaves the
+        engine unchanged. In an overlay, only the overlay's own directories
+        are scanned, and a removed override falls back to the parent's
+        template.
+        """
+        with self._lock:
+            templates = dict(self._templates)
+            owners = dict(self._owners)
+            sources: dict[Path, SourceStamp] = {}
+            changed: dict[str, None] = {}
+            for directory in self._directories:
+                for path in sorted(directory.rglob("*.md")):
+                    old = self._sources.get(path)
+                    stat = path.stat()
+                    if old and (old.size, old.mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+                        sources[path] = old
+                        continue
+                    text, stamp = read_source(path)
+                    if old and old.sha256 == stamp.sha256:
+                        stamp.template_id = old.template_id
+                        sources[path] = stamp
+                        continue
+                    if text.startswith("---\n"):
+                        tmpl = self._prepare(Template.from_string(text, path))
+                        stamp.template_id = tmpl.template_id
+                        templates[tmpl.template_id] = tmpl
+                        owners[tmpl.template_id] = path
+                        changed[tmpl.template_id] = None
+                    sources[path] = stamp
+
+            # Templates whose source is gone or now declares another id
+            # fall back to another file with the same id, if there is one
+            providers = {
+                stamp.template_id: path
+                for path, stamp in sources.items() if stamp.template_id is not None
+            }
+            removed: list[str] = []
+            for template_id, path in list(owners.items()):
+                stamp = sources.get(path)
+                if stamp is not None and stamp.template_id == template_id:
+                    continue
+                provider = providers.get(template_id)
+                if provider is not None:
+                    templates[template_id] = self._prepare(Template.from_file(provider))
+                    owners[template_id] = provider
+                    changed[template_id] = None
+                else:
+                    del owners[template_id]
+                    changed.pop(template_id, None)
+                    if templates.pop(template_id, None) is not None:
+                        removed.append(template_id)
+
+            report = RefreshReport(removed=removed)
+            for template_id in changed:
+                existed = template_id in self._templates
+                (report.updated if existed else report.added).append(template_id)
+            self._templates = templates
+            self._sources = sources
+            self._owners = owners
+        self._invalidate(report.added + report.updated + report.removed)
+        return report
+
+    def watch(
+        self,
+        interval: float = 2.0,
+        on_change: Callable[[RefreshReport], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+    ) -> TemplateWatcher:
+        """Start a daemon thread that calls refresh() every ``interval`` seconds."""
+        watcher = TemplateWatcher(self, interval, on_change, on_error)
+        watcher.start()
+        return watcher
 
     def get_template(self, template_id: str) -> Template | None:
-        return self._templates.get(template_id)
+        tmpl = self._templates.get(template_id)
+        if tmpl is None and self.parent is not None:
+            return self.parent.get_template(template_id)
+        return tmpl
 
     def list_templates(self) -> list[Template]:
-        return list(self._templates.values())
+        return list(self._visible().values())
+
+    def dependencies(self, template_id: str, channel: str | None = None) -> tuple[str, ...]:
+        """Context paths a template reads (see Template.dependencies)."""
+        return self._lookup(template_id).dependencies(channel)
+
+    def minimal_context(
+        self, template_id: str, context: dict[str, Any], channel: str | None = None,
+    ) -> dict[str, Any]:
+        """The part of ``context`` a template reads; renders identically to ``context``."""
+        return project_context(context, self.dependencies(template_id, channel))
+
+    def check_variables(self) -> list[VariableReport]:
+        """Reports for templates whose declared ``variables`` differ from what they read.
+
+        Templates that declare no variables are not checked.
+        """
+        reports = [t.check_variables() for t in self._visible().values() if t.variables]
+        return [report for report in reports if not report.ok]
 
     def render(self, template_id: str, context: dict[str, Any], channel: str) -> RenderResult:
         """Render a template for a specific channel with the given context."""
-        tmpl = self._templates.get(template_id)
+        return self._render(self._lookup(template_id), context, channel, {})
+
+    def render_batch(
+        self, requests: Iterable[tuple[str, dict[str, Any], str]],
+    ) -> list[RenderResult]:
+        """Render many (template_id, context, channel) requests in one call.
+
+        Results are returned in input order. Template lookups are cached for
+        the whole batch, and variable lookups are shared between consecutive
+        requests that pass the same context object.
+        """
+        results: list[RenderResult] = []
+        snapshot = self._templates
+        templates: dict[str, Template] = {}
+        last_context: dict[str, Any] | None = None
+        resolved: dict[str, Any] = {}
+        for template_id, context, channel in requests:
+            tmpl = templates.get(template_id)
+            if tmpl is None:
+                tmpl = templates[template_id] = self._lookup(template_id, snapshot)
+            if context is not last_context:
+                last_context, resolved = context, {}
+            results.append(self._render(tmpl, context, channel, resolved))
+        return results
+
+    def render_all_channels(
+        self, template_id: str, contexts: Iterable[dict[str, Any]],
+    ) -> list[RenderResult]:
+        """Render every declared channel of a template for each context.
+
+        Results are ordered by context, then by the template's channel order.
+        """
+        tmpl = self._lookup(template_id)
+        results: list[RenderResult] = []
+        for context in contexts:
+            resolved: dict[str, Any] = {}
+            for channel in tmpl.channels:
+                results.append(self._render(tmpl, context, channel, resolved))
+        return results
+
+    def iter_render(
+        self, template_id: str, context: dict[str, Any], channel: str, chunk_size: int = 8192,
+    ) -> Iterator[str]:
+        """Render a template piece by piece; the pieces join to render(...).text.
+
+        Blank lines are cleaned up as the text is produced, and pieces are
+        gathered to at least ``chunk_size`` characters (except the last), so
+        large renders can be passed on without building the whole string.
+        Unresolved variables are not reported; see render_to. A cached
+        result is used if the render cache holds one, but streamed renders
+        are not added to it.
+        """
+        yield from self._iter_render(self._lookup(template_id), context, channel, chunk_size, [])
+
+    def render_to(
+        self,
+        stream: TextIO,
+        template_id: str,
+        context: dict[str, Any],
+        channel: str,
+        chunk_size: int = 8192,
+    ) -> list[str]:
+        """Write a render to a text stream as it is produced; only ``write`` is called.
+
+        Writes the same text as render(...).text, in pieces of at least
+        ``chunk_size`` characters. Returns the unresolved variable paths.
+        """
+        unresolved: list[str] = []
+        for piece in self._iter_render(
+            self._lookup(template_id), context, channel, chunk_size, unresolved,
+        ):
+            stream.write(piece)
+        return unresolved
+
+    def _iter_render(
+        self,
+        tmpl: Template,
+        context: dict[str, Any],
+        channel: str,
+        chunk_size: int,
+        unresolved: list[str],
+    ) -> Iterator[str]:
+        resolved: dict[str, Any] = {}
+        nodes, context, key, cached = self._start(tmpl, context, channel, resolved)
+        if cached is not None:
+            unresolved.extend(cached.unresolved_vars)
+            if cached.text:
+                yield cached.text
+            return
+        pieces = iter_nodes(nodes, context, unresolved, resolved)
+        # Cleaning joined batches rather than single pieces keeps the
+        # per-piece cost down to an append
+        yield from _gather(clean_chunks(_gather(pieces, chunk_size)), chunk_size)
+
+    def cache_stats(self) -> CacheStats | None:
+        """Render cache counters, or None when caching is off."""
+        return None if self.cache is None else self.cache.stats()
+
+    def _invalidate(self, template_ids: Iterable[str]) -> None:
+        if self.cache is not None:
+            for template_id in template_ids:
+                self.cache.invalidate(template_id)
+
+    def _lookup(self, template_id: str, templates: dict[str, Template] | None = None) -> Template:
+        tmpl = (self._templates if templates is None else templates).get(template_id)
         if tmpl is None:
+            if self.parent is not None:
+                return self.parent._lookup(template_id)
             raise KeyError(f"Template '{template_id}' not found")
+        return tmpl
+
+    def _visible(self) -> dict[str, Template]:
+        # Overrides keep the position of the template they shadow
+        if self.parent is None:
+            return self._templates
+        return {**self.parent._visible(), **self._templates}
+
+    def _prepare(self, tmpl: Template) -> Template:
+        """Compile ``tmpl``, sharing the plan of the parent's version if the body matches."""
+        base = self.parent.get_template(tmpl.template_id) if self.parent is not None else None
+        if base is not None and base.plan is not None and base.body == tmpl.body:
+            # The plan depends only on the body; keep one copy of both
+            tmpl.body = base.body
+            if tmpl.plan is None:
+                tmpl.plan = base.plan
+        if tmpl.plan is None:
+            tmpl.compile()
+        return tmpl
+
+    def _render(
+        self, tmpl: Template, context: dict[str, Any], channel: str, resolved: dict[str, Any],
+    ) -> RenderResult:
+        nodes, context, key, cached = self._start(tmpl, context, channel, resolved)
+        if cached is not None:
+            return cached
+        text, unresolved = render_nodes(nodes, context, resolved)
+        result = self._result(tmpl, channel, text, unresolved)
+        if self.cache is not None and key is not None:
+            self.cache.put(key, result)
+        return result
+
+    def _start(
+        self, tmpl: Template, context: dict[str, Any], channel: str, resolved: dict[str, Any],
+    ) -> tuple[list[_Node], dict[str, Any], _CacheKey | None, RenderResult | None]:
+        """Set up a render: (nodes, context, cache key, cached result).
 
-        text = tmpl.body
-        # 1. Extract channel block (or use full body if no channel blocks)
-        text = self._extract_channel(text, channel)
-        # 2. Process conditionals
-        text = self._process_conditionals(text, context)
-        # 3. Interpolate variables
-        text, unresolved = self._interpolate(text, context)
-        # 4. Clean up whitespace
-        text = self._clean(text)
+        The key is None when caching is off or the context cannot be keyed.
+        """
+        plan = tmpl.plan or tmpl.compile()
+        if type(context) is not dict:
+            # Dict subclasses (such as a lazy context) may override lookups;
+            # read the top-level keys this channel uses into a plain dict once
+            context = {k: context[k] for k in plan.roots_for(channel) if k in context}
+        cache = self.cache
+        key = cache.key(tmpl, channel, context, resolved) if cache is not None else None
+        cached = cache.get(key) if cache is not None and key is not None else None
+        return plan.for_channel(channel), context, key, cached
 
+    def _result(
+        self, tmpl: Template, channel: str, text: str, unresolved: list[str],
+    ) -> RenderResult:
         return RenderResult(
-            template_id=template_id,
+            template_id=tmpl.template_id,
             channel=channel,
-            text=text,
+            text=clean_text(text),
             metadata=tmpl.metadata,
             unresolved_vars=unresolved,
         )
 
-    def _extract_channel(self, text: str, channel: str) -> str:
-        """Extract the content for the specified channel block."""
-        matches = list(_CHANNEL_RE.finditer(text))
-        if not matches:
-            return text
+    @property
+    def template_count(self) -> int:
+        return len(self._visible())
 
-        for match in matches:
-            if match.group(1) == channel:
-                return match.group(2).strip()
-
-        # Channel not found — return text outside channel blocks
-        result = _CHANNEL_RE.sub("", text)
-        return result.strip()
-
-    def _process_conditionals(self, text: str, context: dict[str, Any]) -> str:
-        """Process {{#if}} ... {{/if}} blocks."""
-        def replacer(match: re.Match[str]) -> str:
-            var_path = match.group(1)
-            true_block = match.group(2)
-            false_block = match.group(3) or ""
-            value = _resolve_var(context, var_path)
-            if _is_truthy(value):
-                return true_block.strip()
-            return false_block.strip()
-
-        # Repeatedly process until no more conditionals (handles nesting)
-        prev = ""
-        while prev != text:
-            prev = text
-            text = _IF_RE.sub(replacer, text)
-        return text
-
-    def _interpolate(self, text: str, context: dict[str, Any]) -> tuple[str, list[str]]:
-        """Replace {{ var.path }} with values from context. Returns (text, unresolved_vars)."""
-        unresolved: list[str] = []
 
-        def replacer(match: re.Match[str]) -> str:
-            path = match.group(1)
-            value = _resolve_var(context, path)
-            if value is None:
-                unresolved.append(path)
-                return match.group(0)  # Leave unresolved vars as-is
-            return str(value)
-
-        result = _VAR_RE.sub(replacer, text)
-        return result, unresolved
-
-    def _clean(self, text: str) -> str:
-        """Clean up excess blank lines."""
-        lines = text.split("\n")
-        cleaned: list[str] = []
-        prev_blank = False
-        for line in lines:
-            is_blank = line.strip() == ""
-            if is_blank and prev_blank:
+class TemplateWatcher(threading.Thread):
+    """Daemon thread that polls TemplateEngine.refresh() on an interval."""
+
+    def __init__(
+        self,
+        engine: TemplateEngine,
+        interval: float = 2.0,
+        on_change: Callable[[RefreshReport], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+    ) -> None:
+        super().__init__(name="template-watcher", daemon=True)
+        self._engine = engine
+        self._interval = interval
+        self._on_change = on_change
+        self._on_error = on_error
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            try:
+                report = self._engine.refresh()
+            except (OSError, ValueError) as exc:  # includes Frontmatter/TemplateSyntaxError
+                if self._on_error is not None:
+                    self._on_error(exc)
                 continue
-            cleaned.append(line)
-            prev_blank = is_blank
-        return "\n".join(cleaned).strip()
+            if report.changed and self._on_change is not None:
+                self._on_change(report)
 
-    @property
-    def template_count(self) -> int:
-        return len(self._templates)
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop polling and wait for the thread to exit."""
+        self._stopped.set()
+        self.join(timeout)
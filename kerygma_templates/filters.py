@@ -0,0 +1,137 @@
+"""Filters for interpolated variables: ``{{ path | name:arg, arg | name }}``.
+
+A filter is a callable taking the resolved value and the tag's arguments
+and returning the value to emit (or to pass to the next filter). Filters
+come from register_filter(), the ``kerygma_templates.filters`` entry-point
+group, or the built-ins below; the compiler resolves names to callables
+once, so rendering only calls them. Arguments are integers or strings
+(quoted if they contain spaces, commas or ``|``).
+
+Built-ins:
+
+- ``upper``, ``lower``, ``title``, ``strip``: string case and whitespace
+- ``truncate:N[,end]``: at most N characters (graphemes), cut on a word
+  boundary, ending in ``end`` (an ellipsis by default)
+- ``join[:sep]``: list items joined by ``sep`` (", " by default)
+- ``hashtags[:N]``: a list (or a space/comma-separated string) of tags as
+  ``#tag`` words, at most N, with characters hashtags cannot hold removed
+- ``date[:format]``: a date, datetime or ISO 8601 string through
+  ``strftime`` ("%B %d, %Y" by default); other strings are left as-is
+
+Unresolved variables are never passed to filters.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterable
+from datetime import date, datetime
+from typing import Any
+
+from kerygma_templates.length import split_graphemes
+from kerygma_templates.plugins import PluginRegistry
+
+Filter = Callable[..., Any]
+
+ENTRY_POINT_GROUP = "kerygma_templates.filters"
+ELLIPSIS = "\u2026"
+
+_FILTERS: PluginRegistry[Filter] = PluginRegistry("filter", ENTRY_POINT_GROUP)
+
+_TRAILING_WORD_RE = re.compile(r"\s+\S*\Z")
+_WORD_CHAR_RE = re.compile(r"\w")
+_NON_TAG_RE = re.compile(r"\W+")
+
+
+def register_filter(name: str, func: Filter | None = None) -> Any:
+    """Register a filter under ``name``; usable as a decorator.
+
+    Registering an existing name replaces that filter for templates
+    compiled afterwards.
+    """
+    return _FILTERS.register(name, func)
+
+
+def available_filters() -> dict[str, Filter]:
+    """Return all registered filters, loading entry-point filters on first use."""
+    return _FILTERS.available()
+
+
+def resolve_filter(name: str) -> Filter:
+    """Return the filter registered under ``name``; raises KeyError if there is none."""
+    func = _FILTERS.lookup(name)
+    if func is None:
+        raise KeyError(f"Filter '{name}' not found")
+    return func
+
+
+@register_filter("upper")
+def upper(value: Any) -> str:
+    return str(value).upper()
+
+
+@register_filter("lower")
+def lower(value: Any) -> str:
+    return str(value).lower()
+
+
+@register_filter("title")
+def title(value: Any) -> str:
+    return str(value).title()
+
+
+@register_filter("strip")
+def strip(value: Any) -> str:
+    return str(value).strip()
+
+
+@register_filter("truncate")
+def truncate(value: Any, length: int = 100, end: str = ELLIPSIS) -> str:
+    text = str(value)
+    clusters = split_graphemes(text)
+    if len(clusters) <= length:
+        return text
+    keep = max(0, length - len(end))
+    cut = "".join(clusters[:keep])
+    if _WORD_CHAR_RE.match(clusters[keep]):
+        # Mid-word: back up to the end of the previous word
+        match = _TRAILING_WORD_RE.search(cut)
+        if match is not None and match.start() > 0:
+            cut = cut[:match.start()]
+    return cut.rstrip().rstrip(",;:-\u2013\u2014") + end
+
+
+@register_filter("join")
+def join(value: Any, sep: str = ", ") -> str:
+    if not isinstance(value, (list, tuple)):
+        return str(value)
+    return sep.join(str(item) for item in value)
+
+
+@register_filter("hashtags")
+def hashtags(value: Any, limit: int | None = None) -> str:
+    items: Iterable[Any]
+    if isinstance(value, str):
+        items = value.replace(",", " ").split()
+    elif isinstance(value, (list, tuple)):
+        items = value
+    else:
+        items = [value]
+    tags: dict[str, None] = {}
+    for item in items:
+        tag = _NON_TAG_RE.sub("", str(item))
+        if tag:
+            tags.setdefault(f"#{tag}")
+    return " ".join(list(tags)[:limit])
+
+
+@register_filter("date")
+def format_date(value: Any, fmt: str = "%B %d, %Y") -> Any:
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return value
+    if isinstance(value, (date, datetime)):
+        return value.strftime(fmt)
+    return value
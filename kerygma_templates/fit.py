@@ -0,0 +1,226 @@
+"""Fit-to-limit rendering for length-limited channels.
+
+``fit_render`` renders a template once into segments (literal text,
+variable values, and the optional ``{{#if}}`` sections that produced them),
+then degrades the content step by step until it fits the channel budget:
+
+1. ``sections``: drop optional ``{{#if}}`` sections, last first. A template
+   can name them with an ``optional`` frontmatter list of condition paths;
+   otherwise every truthy ``{{#if}}`` without an ``{{#else}}`` is optional.
+2. ``truncate``: cut long variables (``truncatable`` frontmatter list,
+   default ``event.summary``) on a word boundary, adding an ellipsis.
+3. ``hashtags``: remove hashtags, last first.
+
+Each attempt only re-joins the segments and re-measures; nothing is
+re-rendered. The applied degradations are listed in
+``RenderResult.degradations``.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from kerygma_templates.engine import (
+    RenderPlan,
+    RenderResult,
+    TemplateEngine,
+    WalkMark,
+    clean_text,
+    walk_nodes,
+)
+from kerygma_templates.filters import ELLIPSIS, truncate
+from kerygma_templates.length import length_counter, split_graphemes
+from kerygma_templates.quality_checker import CHANNEL_COUNTING, CHANNEL_LIMITS
+
+DEFAULT_STEPS = ("sections", "truncate", "hashtags")
+DEFAULT_TRUNCATABLE = ("event.summary",)
+
+_HASHTAG_RE = re.compile(r"[ \t]*(?<!\S)#\w+")
+_WORD_BREAK_RE = re.compile(r"\s+")
+
+
+@dataclass(slots=True)
+class _Segment:
+    """A piece of rendered output and the optional sections it belongs to."""
+    text: str
+    sections: tuple[int, ...] = ()
+    truncatable: str | None = None
+    unresolved: str | None = None
+
+
+def _segments(
+    plan: RenderPlan,
+    channel: str,
+    context: dict[str, Any],
+    optional: set[str] | None,
+    truncatable: set[str],
+) -> tuple[list[_Segment], list[str]]:
+    """Render a channel into segments. Returns (segments, section paths).
+
+    Joining every segment's text gives the render_nodes output.
+    """
+    segments: list[_Segment] = []
+    sections: list[str] = []
+    owners: tuple[int, ...] = ()
+    # Owners outside each open section or loop, and whether it is a loop
+    opened: list[tuple[tuple[int, ...], bool]] = []
+    loops = 0
+    mark: WalkMark | None = None
+    for piece in walk_nodes(plan.for_channel(channel), context, []):
+        if isinstance(piece, str):
+            if mark is None:
+                segments.append(_Segment(piece, owners))
+            elif mark.kind == "missing":
+                segments.append(_Segment(piece, owners, unresolved=mark.path))
+            else:
+                var = mark.path if not loops and mark.path in truncatable else None
+                segments.append(_Segment(piece, owners, truncatable=var))
+            mark = None
+        elif piece.kind in ("var", "missing"):
+            mark = piece
+        elif piece.kind == "end":
+            owners, is_loop = opened.pop()
+            loops -= is_loop
+        else:
+            is_loop = piece.kind == "loop"
+            opened.append((owners, is_loop))
+            loops += is_loop
+            # A loop is kept or dropped whole, with the section around it
+            if not is_loop and not loops and (optional is None or piece.path in optional):
+                sections.append(piece.path)
+                owners = owners + (len(sections) - 1,)
+    return segments, sections
+
+
+def _word_cuts(text: str) -> list[int]:
+    """Offsets at which ``text`` can be cut after its first 1, 2, ... words."""
+    return [m.start() for m in _WORD_BREAK_RE.finditer(text.rstrip()) if m.start() > 0]
+
+
+def fit_render(
+    engine: TemplateEngine,
+    template_id: str,
+    context: dict[str, Any],
+    channel: str,
+    limit: int | None = None,
+    count: Callable[[str], int] | None = None,
+    steps: Sequence[str] = DEFAULT_STEPS,
+) -> RenderResult:
+    """Render a template, degrading optional content until it fits ``limit``.
+
+    ``limit`` defaults to CHANNEL_LIMITS and ``count`` to the channel's
+    CHANNEL_COUNTING strategy. If the full render fits, the result equals
+    engine.render(); if no combination of ``steps`` fits, the most degraded
+    render is returned.
+    """
+    if limit is None:
+        limit = CHANNEL_LIMITS.get(channel, 0)
+    if count is None:
+        count = length_counter(CHANNEL_COUNTING.get(channel, "chars"))
+    result = engine.render(template_id, context, channel)
+    if limit <= 0 or count(result.text) <= limit:
+        return result
+
+    tmpl = engine.get_template(template_id)
+    assert tmpl is not None  # render() above raises for unknown ids
+    plan = tmpl.plan or tmpl.compile()
+    meta = tmpl.metadata
+    optional = set(meta["optional"]) if "optional" in meta else None
+    truncatable = set(meta.get("truncatable", DEFAULT_TRUNCATABLE))
+    segments, sections = _segments(plan, channel, context, optional, truncatable)
+
+    dropped: set[int] = set()
+    texts = [seg.text for seg in segments]
+    degradations: list[str] = []
+    hashtags_removed = 0
+
+    def build(texts: list[str]) -> str:
+        joined = "".join(
+            text for seg, text in zip(segments, texts) if dropped.isdisjoint(seg.sections)
+        )
+        text = clean_text(joined)
+        if hashtags_removed:
+            for _ in range(hashtags_removed):
+                text = _strip_last_hashtag(text)
+            text = clean_text(text)
+        return text
+
+    def fits(texts: list[str]) -> bool:
+        return count(build(texts)) <= limit
+
+    for step in steps:
+        if step == "sections":
+            for index in reversed(range(len(sections))):
+                if fits(texts):
+                    break
+                dropped.add(index)
+                degradations.append(f"dropped section {sections[index]}")
+        elif step == "truncate":
+            for i in reversed(range(len(segments))):
+                seg = segments[i]
+                if seg.truncatable is None or not dropped.isdisjoint(seg.sections):
+                    continue
+                if fits(texts):
+                    break
+                cuts = _word_cuts(seg.text)
+                if not cuts:
+                    continue
+                # Longest prefix that fits, by binary search; at least one word
+                lo, hi = 0, len(cuts) - 1
+                while lo < hi:
+                    mid = (lo + hi + 1) // 2
+                    texts[i] = _truncate(seg.text, cuts[mid])
+                    if fits(texts):
+                        lo = mid
+                    else:
+                        hi = mid - 1
+                texts[i] = _truncate(seg.text, cuts[lo])
+                words = len(cuts) + 1
+                degradations.append(f"truncated {seg.truncatable} to {lo + 1} of {words} words")
+        elif step == "hashtags":
+            while not fits(texts):
+                text = build(texts)
+                match = _last_hashtag(text)
+                if match is None:
+                    break
+                hashtags_removed += 1
+                degradations.append(f"removed hashtag {match.group().strip()}")
+        else:
+            raise ValueError(f"Unknown fit step '{step}'")
+        if fits(texts):
+            break
+
+    unresolved = [
+        seg.unresolved for seg in segments
+        if seg.unresolved is not None and dropped.isdisjoint(seg.sections)
+    ]
+    return RenderResult(
+        template_id=result.template_id,
+        channel=channel,
+        text=build(texts),
+        metadata=result.metadata,
+        unresolved_vars=unresolved,
+        degradations=degradations,
+    )
+
+
+def _truncate(text: str, cut: int) -> str:
+    """``text`` cut after the word ending at offset ``cut``, with an ellipsis."""
+    return truncate(text, len(split_graphemes(text[:cut])) + len(ELLIPSIS))
+
+
+def _last_hashtag(text: str) -> re.Match[str] | None:
+    match = None
+    for match in _HASHTAG_RE.finditer(text):
+        pass
+    return match
+
+
+def _strip_last_hashtag(text: str) -> str:
+    match = _last_hashtag(text)
+    if match is None:
+        return text
+    return text[:match.start()] + text[match.end():]
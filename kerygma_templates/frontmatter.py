@@ -0,0 +1,381 @@
+"""Frontmatter parser: the YAML subset templates use, stdlib only.
+
+A template may start with a ``---`` line, YAML, and a closing ``---``
+line. Supported YAML:
+
+- block mappings, nested by indentation (spaces only)
+- block sequences (``- item``), at the key's indentation or deeper, whose
+  items may be scalars, flow lists or mappings (``- name: x``)
+- flow lists ``[a, "b, c", [d]]`` on one line
+- plain, ``"double"`` (JSON escapes) and ``'single'`` (``''`` escape)
+  quoted scalars; ``#`` comments on their own line or after a space
+- ``|`` literal and ``>`` folded block scalars, with ``-``/``+`` chomping
+
+Plain scalars are typed as before: ``true``/``false`` (any case) are
+booleans and digit-only values integers; everything else, including
+``-5``, ``3.14`` and anything quoted, is a string. A key with nothing
+under it is an empty list. Anything else, such as a missing ``:``, bad
+indentation, an unterminated quote, a duplicate key, or a schema field
+of the wrong type, raises FrontmatterError with the line number in the
+file.
+
+Parses are memoized by frontmatter content, so loading the same
+template again (in another engine, or after a refresh that found only
+the body changed) skips parsing. Compiled bundles carry the parsed
+metadata across processes.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+# Expected type of each known field; other keys are free-form
+SCHEMA: dict[str, type] = {
+    "template_id": str,
+    "category": str,
+    "channels": list,
+    "variables": list,
+    "checklist_items": list,
+}
+
+CACHE_SIZE = 1024
+
+_KEY_RE = re.compile(r"(?P<key>[^\s#:\"'\[\]{},][^:]*?|\"(?:[^\"\\]|\\.)*\"|'(?:[^']|'')*')"
+                     r"\s*:(?:\s+|\Z)")
+_DOUBLE_RE = re.compile(r"\"(?:[^\"\\]|\\.)*\"")
+_SINGLE_RE = re.compile(r"'(?:[^']|'')*'")
+_COMMENT_RE = re.compile(r"\s+#.*\Z|\A#.*\Z")
+_BLOCK_SCALAR_RE = re.compile(r"([|>])([-+]?)\Z")
+_FLOW_SPECIAL_RE = re.compile(r"[\"'\[{]")
+
+
+class FrontmatterError(ValueError):
+    """Raised for frontmatter that cannot be parsed or breaks the schema.
+
+    ``lineno`` counts from the first line of the file (the opening ``---``).
+    """
+
+    def __init__(self, message: str, lineno: int, path: Path | None = None):
+        super().__init__(message)
+        self.message = message
+        self.lineno = lineno
+        self.path = path
+
+    def __str__(self) -> str:
+        where = f"line {self.lineno}"
+        if self.path is not None:
+            where = f"{self.path}: {where}"
+        return f"{where}: frontmatter: {self.message}"
+
+
+@dataclass(slots=True)
+class _Parser:
+    lines: list[str]
+    pos: int = 0
+    # Line number (in the file) of each top-level key
+    key_lines: dict[str, int] = field(default_factory=dict)
+
+    def error(self, message: str, index: int | None = None) -> FrontmatterError:
+        return FrontmatterError(message, (self.pos if index is None else index) + 2)
+
+    def next_line(self) -> tuple[int, str] | None:
+        """Skip blank and comment lines; return (indent, text) of the next one."""
+        while self.pos < len(self.lines):
+            line = self.lines[self.pos]
+            stripped = line.strip()
+            if stripped and not stripped.startswith("#"):
+                indent = len(line) - len(line.lstrip(" "))
+                if line[indent] == "\t":
+                    raise self.error("tabs are not allowed in indentation")
+                return indent, line[indent:].rstrip()
+            self.pos += 1
+        return None
+
+    def block(self, indent: int, text: str) -> Any:
+        """Parse the mapping or sequence whose first line, at ``indent``, is ``text``."""
+        return self.sequence(indent) if _is_item(text) else self.mapping(indent)
+
+    def mapping(self, indent: int, top: bool = False, first: str | None = None) -> dict[str, Any]:
+        result: dict[str, Any] = {}
+        while (nxt := self.next_line()) is not None:
+            line_indent, text = nxt
+            if first is not None:
+                line_indent, text, first = indent, first, None
+            if line_indent < indent:
+                break
+            if line_indent > indent:
+                raise self.error("unexpected indentation")
+            if _is_item(text):
+                if top:
+                    raise self.error("expected 'key: value', found a list item")
+                break
+            match = _KEY_RE.match(text)
+            if match is None:
+                raise self.error(f"expected 'key: value', found {text!r}")
+            key = _unquote(match.group("key"), self)
+            if key in result:
+                raise self.error(f"duplicate key '{key}'")
+            if top:
+                self.key_lines[key] = self.pos + 2
+            rest = text[match.end():]
+            self.pos += 1
+            result[key] = self.value(rest, indent, in_mapping=True)
+        return result
+
+    def sequence(self, indent: int) -> list[Any]:
+        result: list[Any] = []
+        while (nxt := self.next_line()) is not None:
+            line_indent, text = nxt
+            if line_indent != indent or not _is_item(text):
+                if line_indent > indent:
+                    raise self.error("unexpected indentation")
+                break
+            rest = text[1:].lstrip(" ")
+            offset = indent + len(text) - len(rest)
+            if rest and not rest.startswith("#") and _KEY_RE.match(rest) and rest[0] not in "\"'[":
+                # "- key: value" starts a mapping indented to the key
+                result.append(self.mapping(offset, first=rest))
+                continue
+            self.pos += 1
+            result.append(self.value(rest, indent, in_mapping=False))
+        return result
+
+    def value(self, rest: str, indent: int, in_mapping: bool) -> Any:
+        """Parse what follows ``key:`` or ``-`` on a line just consumed."""
+        index = self.pos - 1
+        rest = _strip_comment(rest)
+        if not rest:
+            nxt = self.next_line()
+            if nxt is None:
+                return []
+            line_indent, text = nxt
+            # A sequence may sit at its key's indentation
+            if line_indent > indent or (in_mapping and line_indent == indent and _is_item(text)):
+                return self.block(line_indent, text)
+            return []
+        block = _BLOCK_SCALAR_RE.match(rest)
+        if block is not None:
+            return self.block_scalar(indent, block.group(1), block.group(2))
+        value, end = _scalar(rest, 0, index, self, flow=False)
+        if rest[end:].strip():
+            raise self.error(f"unexpected text after value: {rest[end:].strip()!r}", index)
+        return value
+
+    def block_scalar(self, indent: int, style: str, chomp: str) -> str:
+        body: list[str] = []
+        block_indent: int | None = None
+        while self.pos < len(self.lines):
+            line = self.lines[self.pos]
+            if line.strip():
+                line_indent = len(line) - len(line.lstrip(" "))
+                if line_indent <= indent:
+                    break
+                if block_indent is None:
+                    block_indent = line_indent
+                elif line_indent < block_indent:
+                    raise self.error("block scalar line is less indented than its first line")
+                body.append(line[block_indent:])
+            else:
+                body.append("")
+            self.pos += 1
+        lines = _rstrip_blank(body)
+        trailing = len(body) - len(lines)
+        text = "\n".join(lines) if style == "|" else _fold(lines)
+        if chomp == "-" or not lines:
+            return text
+        return text + "\n" * (trailing + 1 if chomp == "+" else 1)
+
+
+def _rstrip_blank(lines: list[str]) -> list[str]:
+    end = len(lines)
+    while end and not lines[end - 1]:
+        end -= 1
+    return lines[:end]
+
+
+def _fold(lines: list[str]) -> str:
+    # Folded style: single line breaks become spaces and each blank line a
+    # newline; breaks around more-indented lines are kept
+    out: list[str] = []
+    for i, line in enumerate(lines):
+        prev = lines[i - 1] if i else None
+        if prev is None or (line and not prev):
+            out.append(line)
+        elif not line:
+            out.append("\n")
+        elif line.startswith(" ") or prev.startswith(" "):
+            out.append("\n" + line)
+        else:
+            out.append(" " + line)
+    return "".join(out)
+
+
+def _is_item(text: str) -> bool:
+    return text == "-" or text.startswith("- ")
+
+
+def _strip_comment(text: str) -> str:
+    if text[:1] in ("\"", "'", "["):
+        return text.strip()  # Comments after these are handled by _scalar
+    return _COMMENT_RE.sub("", text).strip()
+
+
+def _unquote(token: str, parser: _Parser) -> str:
+    if token[:1] == "\"":
+        try:
+            return json.loads(token)
+        except ValueError:
+            raise parser.error(f"invalid escape in {token}") from None
+    if token[:1] == "'":
+        return token[1:-1].replace("''", "'")
+    return token.strip()
+
+
+def _plain(text: str) -> Any:
+    if text.lower() in ("true", "false"):
+        return text.lower() == "true"
+    if text.isdigit():
+        return int(text)
+    return text
+
+
+def _scalar(text: str, pos: int, index: int, parser: _Parser, flow: bool) -> tuple[Any, int]:
+    """Parse a scalar or flow list at ``text[pos:]``. Returns (value, end offset)."""
+    while pos < len(text) and text[pos] == " ":
+        pos += 1
+    if pos >= len(text):
+        return "", pos
+    char = text[pos]
+    if char in "\"'":
+        match = (_DOUBLE_RE if char == "\"" else _SINGLE_RE).match(text, pos)
+        if match is None:
+            raise parser.error("unterminated quoted string", index)
+        end = match.end()
+        rest = text[end:]
+        if not flow and rest.strip() and not _COMMENT_RE.fullmatch(rest):
+            raise parser.error(f"unexpected text after quoted string: {rest.strip()!r}", index)
+        return _unquote(match.group(), parser), end if flow else len(text)
+    if char == "[":
+        return _flow_list(text, pos + 1, index, parser)
+    if char == "{":
+        raise parser.error("flow mappings ({...}) are not supported", index)
+    if flow:
+        end = pos
+        while end < len(text) and text[end] not in ",]":
+            end += 1
+        return _plain(text[pos:end].strip()), end
+    return _plain(_COMMENT_RE.sub("", text[pos:]).strip()), len(text)
+
+
+def _flow_list(text: str, pos: int, index: int, parser: _Parser) -> tuple[list[Any], int]:
+    close = text.find("]", pos)
+    if close >= 0 and not _FLOW_SPECIAL_RE.search(text, pos, close):
+        # Plain items only, as in most templates: split on commas
+        items = [_plain(item.strip()) for item in text[pos:close].split(",")]
+        if items[-1] == "":
+            items.pop()
+        end = close + 1
+    else:
+        items, end = _flow_items(text, pos, index, parser)
+    rest = text[end:]
+    if rest.strip() and not _COMMENT_RE.fullmatch(rest):
+        return items, end  # Caller reports the trailing text
+    return items, len(text)
+
+
+def _flow_items(text: str, pos: int, index: int, parser: _Parser) -> tuple[list[Any], int]:
+    items: list[Any] = []
+    while True:
+        while pos < len(text) and text[pos] == " ":
+            pos += 1
+        if pos >= len(text):
+            raise parser.error("unterminated flow list: missing ']'", index)
+        if text[pos] == "]":
+            end = pos + 1
+            break
+        value, pos = _scalar(text, pos, index, parser, flow=True)
+        while pos < len(text) and text[pos] == " ":
+            pos += 1
+        if value != "" or (pos < len(text) and text[pos] == ","):
+            items.append(value)
+        if pos < len(text) and text[pos] == ",":
+            pos += 1
+        elif pos < len(text) and text[pos] != "]":
+            raise parser.error(f"expected ',' or ']' in flow list, found {text[pos]!r}", index)
+    return items, end
+
+
+def _validate(meta: dict[str, Any], key_lines: dict[str, int]) -> None:
+    for key, expected in SCHEMA.items():
+        if key not in meta:
+            continue
+        value = meta[key]
+        if expected is str and not isinstance(value, str):
+            raise FrontmatterError(
+                f"'{key}' must be a string, not {_describe(value)}", key_lines[key],
+            )
+        if expected is list and not (
+            isinstance(value, list) and all(isinstance(item, str) for item in value)
+        ):
+            raise FrontmatterError(
+                f"'{key}' must be a list of strings, not {_describe(value)}", key_lines[key],
+            )
+
+
+def _describe(value: Any) -> str:
+    if isinstance(value, list):
+        kinds = sorted({type(item).__name__ for item in value if not isinstance(item, str)})
+        return f"a list containing {', '.join(kinds)}" if kinds else "a list"
+    return type(value).__name__
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse_block(raw: str) -> dict[str, Any]:
+    parser = _Parser(raw.split("\n"))
+    meta = parser.mapping(0, top=True)
+    _validate(meta, parser.key_lines)
+    return meta
+
+
+def _copy(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _copy(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy(v) for v in value]
+    return value
+
+
+def parse_frontmatter(text: str, path: Path | None = None) -> tuple[dict[str, Any], str]:
+    """Parse the frontmatter of template text. Returns (metadata, body).
+
+    Text without frontmatter gives ({}, text). Raises FrontmatterError,
+    naming ``path`` if given, for unterminated or malformed frontmatter.
+    """
+    if not text.startswith("---\n"):
+        return {}, text
+    raw, body_start = _split(text, path)
+    try:
+        meta = _parse_block(raw)
+    except FrontmatterError as exc:
+        exc.path = path
+        raise
+    # The cached parse is shared; callers get their own lists and dicts
+    return _copy(meta), text[body_start:]
+
+
+def _split(text: str, path: Path | None) -> tuple[str, int]:
+    """Find the closing ``---`` line. Returns (frontmatter text, body offset)."""
+    pos = 3
+    while (start := text.find("\n---", pos)) >= 0:
+        end = text.find("\n", start + 4)
+        if end < 0:
+            end = len(text)
+        if not text[start + 4:end].strip(" \t"):
+            return text[4:start], min(end + 1, len(text))
+        pos = start + 4
+    raise FrontmatterError("no closing '---' line", 1, path)
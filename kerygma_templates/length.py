@@ -0,0 +1,177 @@
+"""Platform-accurate text length for channel limits.
+
+Platforms do not count characters the same way:
+
+- ``chars``: code points, ``len(text)`` (Discord, LinkedIn, Ghost)
+- ``graphemes``: user-perceived characters, so an emoji ZWJ sequence, a
+  flag or a letter with combining accents counts once (Bluesky)
+- ``mastodon``: graphemes, with every http(s) URL counted as 23 and remote
+  mentions (``@user@domain``) counted as their ``@user`` part
+- ``twitter``: twitter-text weighted length: NFC code points weigh 1 in the
+  Latin/general-punctuation ranges and 2 elsewhere, emoji sequences weigh
+  2, and URLs count as 23
+
+Grapheme segmentation follows the UAX #29 rules that matter for
+announcements (CRLF, combining marks, ZWJ emoji sequences, emoji modifiers,
+regional-indicator flags, Hangul jamo; combining marks of the historic
+scripts outside the BMP are not joined). Counting only looks at the code
+points that join a preceding cluster, which most text has few of, found by
+a single character-class search; the table of combining marks is built
+from ``unicodedata`` on first use. ASCII text never touches a regex.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from collections.abc import Callable
+from functools import cache
+
+URL_LENGTH = 23
+
+_URL = r"https?://\S*[^\s.,:;!?'\")\]}>]"
+_URL_RE = re.compile(_URL)
+_REMOTE_MENTION_RE = re.compile(r"(?<![\w@/])@\w+(@[\w.-]*\w)", re.ASCII)
+
+# Extended_Pictographic, approximately: the emoji blocks plus BMP symbols
+_PICTO_SYMBOLS = (
+    r"\u203c\u2049\u2122\u2139\u2194-\u2199\u21a9\u21aa\u231a-\u23ff"
+    r"\u24c2\u25aa-\u27bf\u2934\u2935\u2b05-\u2b55\u3030\u303d\u3297\u3299"
+    r"\U0001F000-\U0001FAFF"
+)
+_PICTO = r"\u00a9\u00ae" + _PICTO_SYMBOLS
+# Emoji modifiers (skin tones), VS16, keycap and tag characters
+_EMOJI_MODS = r"\U0001F3FB-\U0001F3FF\ufe0f\u20e3\U000E0020-\U000E007F"
+_RI = r"\U0001F1E6-\U0001F1FF"
+_HANGUL_L = r"\u1100-\u115f\ua960-\ua97c"
+_HANGUL_V = r"\u1160-\u11a7\ud7b0-\ud7c6"
+_HANGUL_T = r"\u11a8-\u11ff\ud7cb-\ud7fb"
+_HANGUL_SYLLABLE = r"\uac00-\ud7a3"
+
+# twitter-text v3: code points in these ranges weigh 1, all others 2
+_TWITTER_LIGHT = r"\x00-\u10ff\u2000-\u200d\u2010-\u201f\u2032-\u2037"
+_TWITTER_LIGHT_RE = re.compile(rf"[{_TWITTER_LIGHT}]+")
+_TWITTER_EMOJI_RE = re.compile(
+    rf"[{_RI}][{_RI}]|[0-9#*]\ufe0f?\u20e3|[\u00a9\u00ae]\ufe0f"
+    rf"|[{_PICTO_SYMBOLS}][{_EMOJI_MODS}]*(?:\u200d[{_PICTO}][{_EMOJI_MODS}]*)*"
+)
+
+
+_CONTROLS = frozenset(map(chr, [*range(0x20), 0x7F]))
+
+
+@cache
+def _segmenter() -> tuple[re.Pattern[str], re.Pattern[str]]:
+    """Regexes for code points that join the cluster before them.
+
+    ``gate`` finds candidate code points, which most text has few of, with a
+    single character-class search; ``joiner`` is then matched only there.
+    """
+    ranges: list[tuple[int, int]] = []
+    # BMP marks only: a long list of astral ranges makes every charset test
+    # slow, and the astral marks belong to historic scripts
+    for cp in range(0x300, 0x10000):
+        if unicodedata.category(chr(cp))[0] != "M":
+            continue
+        if ranges and ranges[-1][1] == cp - 1:
+            ranges[-1] = (ranges[-1][0], cp)
+        else:
+            ranges.append((cp, cp))
+    marks = "".join(f"\\u{a:04x}" if a == b else f"\\u{a:04x}-\\u{b:04x}" for a, b in ranges)
+    extend = rf"{marks}{_EMOJI_MODS}\U000E0100-\U000E01EF"
+    hangul = "".join((_HANGUL_L, _HANGUL_V, _HANGUL_T, _HANGUL_SYLLABLE))
+    gate = re.compile(rf"[\r{_RI}{hangul}{extend}\u200d]")
+    joiner = re.compile(
+        rf"(?P<crlf>\r\n)|(?P<ri>[{_RI}][{_RI}])"
+        rf"|(?P<hangul>[{_HANGUL_L}]+(?:[{_HANGUL_SYLLABLE}{_HANGUL_V}])?[{_HANGUL_V}]*[{_HANGUL_T}]*"
+        rf"|[{_HANGUL_SYLLABLE}][{_HANGUL_V}]*[{_HANGUL_T}]*|[{_HANGUL_V}]+[{_HANGUL_T}]*)"
+        rf"|(?P<extend>(?:[{extend}]|\u200d[{_PICTO}]?)+)"
+    )
+    return gate, joiner
+
+
+def _joined(text: str) -> list[tuple[int, int]]:
+    """Spans of code points that continue the cluster before them."""
+    gate, joiner = _segmenter()
+    spans: list[tuple[int, int]] = []
+    pos = 0
+    while (hit := gate.search(text, pos)) is not None:
+        match = joiner.match(text, hit.start())
+        if match is None:  # A lone CR or regional indicator
+            pos = hit.start() + 1
+            continue
+        start, end = match.span()
+        # The first code point starts the cluster, except for marks after a
+        # non-control character, which all attach to it
+        if match.lastgroup != "extend" or start == 0 or text[start - 1] in _CONTROLS:
+            start += 1
+        if start < end:
+            spans.append((start, end))
+        pos = end
+    return spans
+
+
+def count_chars(text: str) -> int:
+    """Length in code points."""
+    return len(text)
+
+
+def count_graphemes(text: str) -> int:
+    """Length in user-perceived characters (extended grapheme clusters)."""
+    if text.isascii():
+        return len(text) - text.count("\r\n")
+    return len(text) - sum(end - start for start, end in _joined(text))
+
+
+def split_graphemes(text: str) -> list[str]:
+    """Split text into grapheme clusters, so cuts never break a character."""
+    if text.isascii() and "\r\n" not in text:
+        return list(text)
+    clusters: list[str] = []
+    pos = 0
+    for start, end in _joined(text):
+        clusters.extend(text[pos:start - 1])
+        clusters.append(text[start - 1:end])
+        pos = end
+    clusters.extend(text[pos:])
+    return clusters
+
+
+def count_mastodon(text: str) -> int:
+    """Mastodon status length: graphemes, URLs as 23, remote mentions as @user."""
+    length = count_graphemes(text)
+    if "://" in text:
+        length += sum(URL_LENGTH - count_graphemes(url) for url in _URL_RE.findall(text))
+    if "@" in text:
+        length -= sum(len(domain) for domain in _REMOTE_MENTION_RE.findall(text))
+    return length
+
+
+def count_twitter(text: str) -> int:
+    """twitter-text weighted length (v3 configuration)."""
+    length = 0
+    if "://" in text:
+        text, urls = _URL_RE.subn("", text)
+        length += URL_LENGTH * urls
+    if text.isascii():
+        return length + len(text)
+    text = unicodedata.normalize("NFC", text)
+    text, emoji = _TWITTER_EMOJI_RE.subn("", text)
+    heavy = len(_TWITTER_LIGHT_RE.sub("", text))
+    return length + 2 * emoji + len(text) + heavy
+
+
+COUNTERS: dict[str, Callable[[str], int]] = {
+    "chars": count_chars,
+    "graphemes": count_graphemes,
+    "mastodon": count_mastodon,
+    "twitter": count_twitter,
+}
+
+
+def length_counter(strategy: str) -> Callable[[str], int]:
+    """Return the counting function for a strategy name."""
+    try:
+        return COUNTERS[strategy]
+    except KeyError:
+        raise KeyError(f"Unknown length counting strategy '{strategy}'") from None
@@ -0,0 +1,133 @@
+"""Parallel rendering and quality checking across a process pool.
+
+Compiled templates and the quality checker are shipped to each worker once,
+through the pool initializer; jobs are then submitted in chunks and the
+(RenderResult, QualityReport) pairs streamed back as chunks complete.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    as_completed,
+    wait,
+)
+from itertools import islice
+from typing import Any
+
+from kerygma_templates.engine import RenderResult, Template, TemplateEngine
+from kerygma_templates.quality_checker import QualityChecker, QualityReport
+
+RenderJob = tuple[str, dict[str, Any], str]
+RenderPair = tuple[RenderResult, QualityReport]
+
+# Per-process state, set up once by _init_worker
+_worker_engine: TemplateEngine | None = None
+_worker_checker: QualityChecker | None = None
+
+
+def _init_worker(
+    templates: list[Template], checker: QualityChecker, cache_size: int = 0,
+) -> None:
+    global _worker_engine, _worker_checker
+    _worker_engine = TemplateEngine(cache_size)
+    for tmpl in templates:
+        _worker_engine.register(tmpl)
+    _worker_checker = checker
+
+
+def _render_and_check(
+    engine: TemplateEngine, checker: QualityChecker, jobs: list[RenderJob],
+) -> list[RenderPair]:
+    pairs: list[RenderPair] = []
+    for result in engine.render_batch(jobs):
+        report = checker.check(
+            result.text, result.channel, result.template_id, result.unresolved_vars,
+        )
+        pairs.append((result, report))
+    return pairs
+
+
+def _run_chunk(jobs: list[RenderJob]) -> list[RenderPair]:
+    assert _worker_engine is not None and _worker_checker is not None
+    return _render_and_check(_worker_engine, _worker_checker, jobs)
+
+
+class ParallelRenderer:
+    """Renders and quality-checks jobs across a pool of worker processes.
+
+    Args:
+        engine: Engine whose (compiled) templates are shipped to the workers.
+        checker: Quality checker to run on every render; defaults to QualityChecker().
+        workers: Number of worker processes; defaults to os.cpu_count().
+            With one worker, jobs run in the calling process.
+        chunk_size: Number of jobs sent to a worker per task.
+    """
+
+    def __init__(
+        self,
+        engine: TemplateEngine,
+        checker: QualityChecker | None = None,
+        workers: int | None = None,
+        chunk_size: int = 64,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self._engine = engine
+        self._checker = checker or QualityChecker()
+        self._workers = max(1, workers or os.cpu_count() or 1)
+        self._chunk_size = chunk_size
+
+    def run(self, jobs: Iterable[RenderJob], ordered: bool = True) -> Iterator[RenderPair]:
+        """Render and check (template_id, context, channel) jobs.
+
+        Yields (RenderResult, QualityReport) pairs as chunks complete. With
+        ``ordered=True`` pairs come back in job order; otherwise in completion
+        order. Jobs are consumed lazily, with at most two chunks per worker
+        in flight.
+        """
+        chunks = self._chunks(jobs)
+        if self._workers == 1:
+            for chunk in chunks:
+                yield from _render_and_check(self._engine, self._checker, chunk)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=self._workers,
+            initializer=_init_worker,
+            initargs=(
+                self._engine.list_templates(),
+                self._checker,
+                self._engine.cache.maxsize if self._engine.cache else 0,
+            ),
+        ) as pool:
+            max_pending = self._workers * 2
+            if ordered:
+                pending: deque[Future[list[RenderPair]]] = deque()
+                for chunk in chunks:
+                    pending.append(pool.submit(_run_chunk, chunk))
+                    if len(pending) >= max_pending:
+                        yield from pending.popleft().result()
+                while pending:
+                    yield from pending.popleft().result()
+            else:
+                in_flight: set[Future[list[RenderPair]]] = set()
+                for chunk in chunks:
+                    in_flight.add(pool.submit(_run_chunk, chunk))
+                    if len(in_flight) >= max_pending:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield from future.result()
+                for future in as_completed(in_flight):
+                    yield from future.result()
+
+    def _chunks(self, jobs: Iterable[RenderJob]) -> Iterator[list[RenderJob]]:
+        it = iter(jobs)
+        while chunk := list(islice(it, self._chunk_size)):
+            yield chunk
+
@@ -0,0 +1,65 @@
+"""Name registries for plugins: filters, quality checks.
+
+A registry maps names to callables registered in code (usually with its
+``register`` decorator) or advertised by installed packages under an
+entry-point group. Entry points are only looked at the first time a name
+is missing or the full set is asked for, and are never loaded over a name
+registered in code. A plugin that fails to load is skipped with a
+RuntimeWarning instead of breaking every lookup.
+"""
+
+from __future__ import annotations
+
+import warnings
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T", bound=Callable[..., Any])
+
+
+class PluginRegistry(dict[str, T]):
+    """Registered plugins of one ``kind`` ("filter", "check"), in registration order."""
+
+    def __init__(self, kind: str, group: str) -> None:
+        super().__init__()
+        self.kind = kind
+        self.group = group
+        self.entry_points_loaded = False
+
+    def register(self, name: str, func: T | None = None) -> Any:
+        """Register ``func`` under ``name``; usable as a decorator.
+
+        Registering an existing name replaces that plugin.
+        """
+        def add(f: T) -> T:
+            self[name] = f
+            return f
+
+        return add(func) if func is not None else add
+
+    def available(self) -> dict[str, T]:
+        """Return all plugins, loading the entry-point group on first use."""
+        if not self.entry_points_loaded:
+            # Imported here: importlib.metadata is slow to import, and most
+            # runs only use built-in plugins
+            from importlib.metadata import entry_points
+
+            self.entry_points_loaded = True
+            for ep in entry_points(group=self.group):
+                if ep.name in self:
+                    continue
+                try:
+                    self[ep.name] = ep.load()
+                except Exception as exc:  # A broken plugin must not break every lookup
+                    warnings.warn(
+                        f"Skipping {self.kind} entry point {ep.name!r} ({ep.value}): {exc!r}",
+                        RuntimeWarning, stacklevel=2,
+                    )
+        return dict(self)
+
+    def lookup(self, name: str) -> T | None:
+        """The plugin registered under ``name``; entry points are loaded only if it is missing."""
+        func = self.get(name)
+        if func is None:
+            func = self.available().get(name)
+        return func
@@ -2,14 +2,25 @@
 
 Validates character limits, unresolved variables, anti-patterns,
 hashtag counts, and link presence before distribution.
+
+Checks are plain callables taking a CheckInput and returning a CheckResult,
+kept in a name-keyed registry: the built-ins are registered here, extra
+checks come from register_check(), the ``kerygma_templates.checks`` entry
+point group, or "module:function" specs passed to QualityChecker.
 """
 
 from __future__ import annotations
 
+import importlib
 import re
+import time
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass, field
 from typing import Any
 
+from kerygma_templates.length import length_counter
+from kerygma_templates.plugins import PluginRegistry
+
 # Platform character limits
 CHANNEL_LIMITS: dict[str, int] = {
     "mastodon": 500,
@@ -20,6 +31,14 @@
     "twitter": 280,
 }
 
+# How each channel measures length against its limit (strategies in
+# kerygma_templates.length); unlisted channels count code points
+CHANNEL_COUNTING: dict[str, str] = {
+    "mastodon": "mastodon",
+    "bluesky": "graphemes",
+    "twitter": "twitter",
+}
+
 # Words to flag in announcements
 ANTI_PATTERNS: list[str] = [
     "todo",
@@ -35,7 +54,7 @@
 ]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CheckResult:
     """Result of a single quality check."""
     check_name: str
@@ -44,7 +63,7 @@ class CheckResult:
     severity: str = "error"  # "error", "warning", "info"
 
 
-@dataclass
+@dataclass(slots=True)
 class QualityReport:
     """Aggregated quality report for a rendered announcement."""
     template_id: str
@@ -70,16 +89,325 @@ def summary(self) -> str:
         return f"[{status}] {self.template_id}/{self.channel}: {passed}/{total} checks passed"
 
 
+def _trie_regex(words: list[str]) -> str:
+    """Build a regex matching the longest of ``words`` at a position.
+
+    Words are arranged in a prefix trie, so matching cost depends on the
+    text, not on how many words there are.
+    """
+    trie: dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def build(node: dict[str, Any]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # A word ending here makes the longer continuations optional (greedy: longest first)
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+# Below this many anti-patterns, per-pattern substring search is faster
+TRIE_MIN_PATTERNS = 64
+
+_PLACEHOLDER_RE = re.compile(r"\{\{.*?\}\}")
+_HASHTAG_RE = re.compile(r"#\w+")
+
+_SCAN_PATTERNS = (
+    r"\{(?=(?P<ph>\{.*?\}\}))",
+    r"#(?=\w)",
+    r"h(?=ttps?://)",
+)
+
+
+@dataclass(slots=True)
+class TextScan:
+    """Metrics gathered from one pass over the rendered text."""
+    placeholders: list[str] = field(default_factory=list)
+    hashtags: int = 0
+    has_link: bool = False
+    anti_patterns: list[str] = field(default_factory=list)
+
+
+class _Scanner:
+    """Single-pass scanner for placeholders, links, hashtags and anti-patterns.
+
+    With ``TRIE_MIN_PATTERNS`` or more anti-patterns, every metric comes from
+    one regex run over ``text.lower()``: anti-patterns as a prefix trie in a
+    lookahead, the rest as alternatives that consume one character each, so
+    anti-patterns are still found inside hashtags, links and placeholders.
+    Shorter lists are cheaper to search pattern by pattern.
+    """
+
+    def __init__(self, anti_patterns: list[str]) -> None:
+        self._patterns = list(anti_patterns)
+        unique = list(dict.fromkeys(self._patterns))
+        self._order = {p: i for i, p in enumerate(unique)}
+        self._has_duplicates = len(unique) != len(self._patterns)
+        self._fused: re.Pattern[str] | None = None
+
+        # Patterns with uppercase letters can never occur in lowercased text
+        usable = [p for p in unique if p and p == p.lower()]
+        if len(usable) >= TRIE_MIN_PATTERNS:
+            # The longest match at a position implies every pattern prefixing it
+            words = set(usable)
+            self._implied = {
+                p: [p[:k] for k in range(1, len(p)) if p[:k] in words] for p in usable
+            }
+            self._fused = re.compile(
+                "|".join((f"(?=(?P<anti>{_trie_regex(usable)}))",) + _SCAN_PATTERNS)
+            )
+
+    def scan(self, text: str) -> TextScan:
+        result = TextScan()
+        lower = text.lower()
+        # lower() may change the length of exotic text; offsets must line up
+        if self._fused is not None and len(lower) == len(text):
+            hits = self._walk(lower, text, result)
+            if "" in self._order:
+                hits.add("")
+        else:
+            result.placeholders = _PLACEHOLDER_RE.findall(text)
+            result.hashtags = len(_HASHTAG_RE.findall(text))
+            result.has_link = "http://" in text or "https://" in text
+            hits = {p for p in self._order if p in lower}
+
+        if hits:
+            if self._has_duplicates:
+                result.anti_patterns = [p for p in self._patterns if p in hits]
+            else:
+                result.anti_patterns = sorted(hits, key=self._order.__getitem__)
+        return result
+
+    def _walk(self, subject: str, text: str, result: TextScan) -> set[str]:
+        assert self._fused is not None
+        hits: set[str] = set()
+        placeholder_end = 0
+        for match in self._fused.finditer(subject):
+            if match.lastgroup == "anti":
+                word = match.group("anti")
+                if word not in hits:
+                    hits.add(word)
+                    hits.update(self._implied[word])
+                continue
+            start = match.start()
+            char = subject[start]
+            if char == "{":
+                # findall semantics: placeholders never overlap
+                if start >= placeholder_end:
+                    placeholder_end = start + 1 + len(match.group("ph"))
+                    result.placeholders.append(text[start:placeholder_end])
+            elif char == "#":
+                result.hashtags += 1
+            elif text.startswith(("http://", "https://"), start):
+                result.has_link = True
+        return hits
+
+
+@dataclass(slots=True)
+class CheckInput:
+    """Everything a check sees about one rendered announcement.
+
+    ``scan`` is computed on first access and shared by every check.
+    """
+    text: str
+    channel: str
+    template_id: str = ""
+    unresolved_vars: list[str] | None = None
+    metadata: dict[str, Any] | None = None
+    limit: int = 0
+    count: Callable[[str], int] = field(default=len, repr=False)
+    scanner: _Scanner | None = field(default=None, repr=False)
+    scan_ns: int = field(default=0, repr=False)
+    _scan: TextScan | None = field(default=None, repr=False)
+
+    @property
+    def scan(self) -> TextScan:
+        if self._scan is None:
+            start = time.perf_counter_ns()
+            self._scan = (self.scanner or _Scanner(ANTI_PATTERNS)).scan(self.text)
+            self.scan_ns += time.perf_counter_ns() - start
+        return self._scan
+
+
+Check = Callable[[CheckInput], CheckResult]
+
+ENTRY_POINT_GROUP = "kerygma_templates.checks"
+
+_CHECKS: PluginRegistry[Check] = PluginRegistry("check", ENTRY_POINT_GROUP)
+
+
+def register_check(name: str, check: Check | None = None) -> Any:
+    """Register a check under ``name``; usable as a decorator.
+
+    Registering an existing name replaces that check.
+    """
+    return _CHECKS.register(name, check)
+
+
+def available_checks() -> dict[str, Check]:
+    """Return all registered checks, loading entry-point checks on first use."""
+    return _CHECKS.available()
+
+
+def resolve_check(spec: str | Check) -> tuple[str, Check]:
+    """Resolve a registered name, a "module:function" spec, or a callable."""
+    if callable(spec):
+        return getattr(spec, "__name__", repr(spec)), spec
+    check = _CHECKS.lookup(spec)
+    if check is not None:
+        return spec, check
+    if ":" in spec:
+        module_name, _, attr = spec.partition(":")
+        try:
+            return attr, getattr(importlib.import_module(module_name), attr)
+        except (ImportError, AttributeError) as exc:
+            raise KeyError(f"Check '{spec}' could not be imported: {exc}") from exc
+    raise KeyError(f"Check '{spec}' not found")
+
+
+@dataclass(slots=True)
+class CheckStats:
+    """Accumulated timing for one check."""
+    calls: int = 0
+    failures: int = 0
+    total_ns: int = 0
+    max_ns: int = 0
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.calls if self.calls else 0.0
+
+
+# Name under which the shared text scan is timed
+SCAN_STATS_KEY = "(scan)"
+
+
+@register_check("char_limit")
+def check_char_limit(inp: CheckInput) -> CheckResult:
+    limit, channel = inp.limit, inp.channel
+    if limit == 0:
+        return CheckResult("char_limit", True, f"No limit defined for {channel}", "info")
+
+    length = inp.count(inp.text)
+    if length <= limit:
+        return CheckResult("char_limit", True, f"{length}/{limit} characters")
+    return CheckResult(
+        "char_limit", False,
+        f"Exceeds {channel} limit: {length}/{limit} characters ({length - limit} over)",
+    )
+
+
+@register_check("not_empty")
+def check_not_empty(inp: CheckInput) -> CheckResult:
+    if inp.text and not inp.text.isspace():
+        return CheckResult("not_empty", True, "Content is not empty")
+    return CheckResult("not_empty", False, "Rendered content is empty")
+
+
+@register_check("unresolved_vars")
+def check_unresolved_vars(inp: CheckInput) -> CheckResult:
+    if inp.unresolved_vars:
+        return CheckResult(
+            "unresolved_vars", False,
+            f"Unresolved variables: {', '.join(inp.unresolved_vars)}",
+        )
+    # Also check for leftover {{ }} patterns in text
+    leftover = inp.scan.placeholders
+    if leftover:
+        return CheckResult(
+            "unresolved_vars", False,
+            f"Found unresolved template syntax: {', '.join(leftover)}",
+        )
+    return CheckResult("unresolved_vars", True, "All variables resolved")
+
+
+@register_check("anti_patterns")
+def check_anti_patterns(inp: CheckInput) -> CheckResult:
+    found = inp.scan.anti_patterns
+    if found:
+        return CheckResult(
+            "anti_patterns", False,
+            f"Anti-patterns found: {', '.join(found)}",
+            severity="warning",
+        )
+    return CheckResult("anti_patterns", True, "No anti-patterns found")
+
+
+@register_check("has_link")
+def check_has_link(inp: CheckInput) -> CheckResult:
+    if inp.scan.has_link:
+        return CheckResult("has_link", True, "Contains at least one link")
+    return CheckResult(
+        "has_link", False,
+        "No links found — announcements should link to canonical content",
+        severity="warning",
+    )
+
+
+@register_check("hashtag_count")
+def check_hashtag_count(inp: CheckInput) -> CheckResult:
+    count, channel = inp.scan.hashtags, inp.channel
+
+    if channel == "mastodon" and count > 10:
+        return CheckResult(
+            "hashtag_count", False,
+            f"Too many hashtags for Mastodon: {count} (max 10)",
+            severity="warning",
+        )
+    if channel == "linkedin" and count > 5:
+        return CheckResult(
+            "hashtag_count", False,
+            f"Too many hashtags for LinkedIn: {count} (max 5)",
+            severity="warning",
+        )
+    return CheckResult("hashtag_count", True, f"{count} hashtags — acceptable for {channel}")
+
+
 class QualityChecker:
-    """Runs quality checks on rendered announcement text."""
+    """Runs quality checks on rendered announcement text.
+
+    Args:
+        channel_limits: Character limit per channel (0 means no limit).
+        channel_counting: Length counting strategy per channel (see
+            kerygma_templates.length); unlisted channels count code points.
+        anti_patterns: Phrases to warn about, matched case-insensitively.
+        checks: Checks to run, as registered names, "module:function" specs
+            or callables; defaults to every registered check.
+        channel_checks: Per-channel replacement for ``checks``.
+
+    Every check run is timed; see stats().
+    """
 
     def __init__(
         self,
         channel_limits: dict[str, int] | None = None,
         anti_patterns: list[str] | None = None,
+        checks: Sequence[str | Check] | None = None,
+        channel_checks: Mapping[str, Sequence[str | Check]] | None = None,
+        channel_counting: dict[str, str] | None = None,
     ) -> None:
         self._limits = channel_limits or CHANNEL_LIMITS
+        self._counters = {
+            channel: length_counter(strategy)
+            for channel, strategy in (channel_counting or CHANNEL_COUNTING).items()
+        }
         self._anti_patterns = anti_patterns or ANTI_PATTERNS
+        self._scanner = _Scanner(self._anti_patterns)
+        self._checks = [
+            resolve_check(c) for c in (available_checks() if checks is None else checks)
+        ]
+        self._channel_checks = {
+            channel: [resolve_check(c) for c in specs]
+            for channel, specs in (channel_checks or {}).items()
+        }
+        self._stats: dict[str, CheckStats] = {}
 
     def check(
         self,
@@ -89,87 +417,51 @@ def check(
         unresolved_vars: list[str] | None = None,
         metadata: dict[str, Any] | None = None,
     ) -> QualityReport:
-        """Run all quality checks on rendered text."""
+        """Run the channel's checks on rendered text.
+
+        The text is scanned at most once, on behalf of every check; the scan
+        is timed separately from the checks.
+        """
         report = QualityReport(template_id=template_id, channel=channel)
+        inp = CheckInput(
+            text, channel, template_id, unresolved_vars, metadata,
+            limit=self._limits.get(channel, 0),
+            count=self._counters.get(channel, len),
+            scanner=self._scanner,
+        )
 
-        report.checks.append(self._check_char_limit(text, channel))
-        report.checks.append(self._check_not_empty(text))
-        report.checks.append(self._check_unresolved_vars(text, unresolved_vars))
-        report.checks.append(self._check_anti_patterns(text))
-        report.checks.append(self._check_has_link(text))
-        report.checks.append(self._check_hashtag_count(text, channel))
+        for name, func in self._channel_checks.get(channel, self._checks):
+            scanned = inp.scan_ns
+            start = time.perf_counter_ns()
+            result = func(inp)
+            elapsed = time.perf_counter_ns() - start - (inp.scan_ns - scanned)
+            self._record(name, elapsed, result.passed)
+            report.checks.append(result)
+        if inp.scan_ns:
+            self._record(SCAN_STATS_KEY, inp.scan_ns, True)
 
         return report
 
-    def _check_char_limit(self, text: str, channel: str) -> CheckResult:
-        limit = self._limits.get(channel, 0)
-        if limit == 0:
-            return CheckResult("char_limit", True, f"No limit defined for {channel}", "info")
+    def check_names(self, channel: str | None = None) -> list[str]:
+        """Names of the checks run for ``channel`` (default: the common set)."""
+        return [name for name, _ in self._channel_checks.get(channel or "", self._checks)]
 
-        length = len(text)
-        if length <= limit:
-            return CheckResult("char_limit", True, f"{length}/{limit} characters")
-        return CheckResult(
-            "char_limit", False,
-            f"Exceeds {channel} limit: {length}/{limit} characters ({length - limit} over)",
-        )
+    def stats(self) -> dict[str, CheckStats]:
+        """Return a snapshot of per-check timings since creation or reset_stats()."""
+        return {
+            name: CheckStats(s.calls, s.failures, s.total_ns, s.max_ns)
+            for name, s in self._stats.items()
+        }
 
-    def _check_not_empty(self, text: str) -> CheckResult:
-        if text.strip():
-            return CheckResult("not_empty", True, "Content is not empty")
-        return CheckResult("not_empty", False, "Rendered content is empty")
-
-    def _check_unresolved_vars(
-        self, text: str, unresolved: list[str] | None,
-    ) -> CheckResult:
-        if unresolved:
-            return CheckResult(
-                "unresolved_vars", False,
-                f"Unresolved variables: {', '.join(unresolved)}",
-            )
-        # Also check for leftover {{ }} patterns in text
-        leftover = re.findall(r"\{\{.*?\}\}", text)
-        if leftover:
-            return CheckResult(
-                "unresolved_vars", False,
-                f"Found unresolved template syntax: {', '.join(leftover)}",
-            )
-        return CheckResult("unresolved_vars", True, "All variables resolved")
-
-    def _check_anti_patterns(self, text: str) -> CheckResult:
-        lower = text.lower()
-        found = [p for p in self._anti_patterns if p in lower]
-        if found:
-            return CheckResult(
-                "anti_patterns", False,
-                f"Anti-patterns found: {', '.join(found)}",
-                severity="warning",
-            )
-        return CheckResult("anti_patterns", True, "No anti-patterns found")
+    def reset_stats(self) -> None:
+        self._stats.clear()
 
-    def _check_has_link(self, text: str) -> CheckResult:
-        if "http://" in text or "https://" in text:
-            return CheckResult("has_link", True, "Contains at least one link")
-        return CheckResult(
-            "has_link", False,
-            "No links found — announcements should link to canonical content",
-            severity="warning",
-        )
-
-    def _check_hashtag_count(self, text: str, channel: str) -> CheckResult:
-        hashtags = re.findall(r"#\w+", text)
-        count = len(hashtags)
-
-        if channel == "mastodon" and count > 10:
-            return CheckResult(
-                "hashtag_count", False,
-                f"Too many hashtags for Mastodon: {count} (max 10)",
-                severity="warning",
-            )
-        if channel == "linkedin" and count > 5:
-            return CheckResult(
-                "hashtag_count", False,
-                f"Too many hashtags for LinkedIn: {count} (max 5)",
-                severity="warning",
-            )
-        return CheckResult("hashtag_count", True, f"{count} hashtags — acceptable for {channel}")
+    def _record(self, name: str, elapsed_ns: int, passed: bool) -> None:
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = CheckStats()
+        stats.calls += 1
+        stats.failures += not passed
+        stats.total_ns += elapsed_ns
+        if elapsed_ns > stats.max_ns:
+            stats.max_ns = elapsed_ns
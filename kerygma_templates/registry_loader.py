@@ -6,11 +6,14 @@
 
 from __future__ import annotations
 
+import codecs
 import json
+import re
+from collections.abc import Callable, Iterator, Mapping
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 try:
     from organvm_engine.registry.loader import load_registry as _engine_load_registry
@@ -20,7 +23,7 @@
     _HAS_ENGINE_REGISTRY = False
 
 
-@dataclass
+@dataclass(slots=True)
 class RepoContext:
     """Context extracted from a single registry entry."""
     name: str
@@ -29,10 +32,10 @@ class RepoContext:
     tier: str
     url: str
     implementation_status: str = ""
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: Mapping[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class EventContext:
     """Context for an announcement event."""
     event_type: str
@@ -47,26 +50,376 @@ class EventContext:
     extras: dict[str, Any] = field(default_factory=dict)
 
 
+# Repo fields read when building a RepoContext
+_CONTEXT_KEYS: tuple[str, ...] = ("name", "description", "tier", "url", "implementation_status")
+
+
+def _repo_context(repo: dict[str, Any], organ: str, metadata: Mapping[str, Any]) -> RepoContext:
+    return RepoContext(
+        name=repo["name"],
+        organ=organ,
+        description=repo.get("description", ""),
+        tier=repo.get("tier", "standard"),
+        url=repo.get("url", ""),
+        implementation_status=repo.get("implementation_status", ""),
+        metadata=metadata,
+    )
+
+
+class LazyMetadata(Mapping[str, Any]):
+    """Read-only mapping over one repo object, decoded from disk on first access.
+
+    Holds only the registry path and the object's byte range until a key is
+    read; the decoded dict is then cached. The registry file must not change
+    while the loader is in use.
+    """
+
+    __slots__ = ("_path", "_start", "_end", "_data")
+
+    def __init__(self, path: Path, start: int, end: int) -> None:
+        self._path = path
+        self._start = start
+        self._end = end
+        self._data: dict[str, Any] | None = None
+
+    def _decode(self) -> dict[str, Any]:
+        with self._path.open("rb") as fh:
+            fh.seek(self._start)
+            return json.loads(fh.read(self._end - self._start))
+
+    def _load(self) -> dict[str, Any]:
+        if self._data is None:
+            self._data = self._decode()
+        return self._data
+
+    def peek(self, key: str, default: Any = None) -> Any:
+        """Like get(), but an object not yet decoded is decoded without being cached."""
+        data = self._data if self._data is not None else self._decode()
+        return data.get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._load()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __repr__(self) -> str:
+        if self._data is None:
+            return f"LazyMetadata({str(self._path)!r}, {self._start}, {self._end})"
+        return repr(self._data)
+
+
+_PENDING: Any = object()
+
+
+class LazyContext(dict[str, Any]):
+    """Template context whose top-level sections are built on first access.
+
+    A real dict holding every section key from the start, so the engine
+    resolves paths through it unchanged and ``in``/``len``/iteration never
+    build anything: reading ``ctx["repo"]`` builds only that section and
+    stores it. Reading all values (``values()``, ``items()``, equality,
+    copying, pickling, JSON encoding) builds every pending section first.
+    """
+
+    __slots__ = ("_factories",)
+
+    @classmethod
+    def from_sections(cls, sections: dict[str, Callable[[], Any]]) -> LazyContext:
+        """Context with one pending entry per section, built by calling its factory."""
+        # fromkeys() avoids a Python-level __init__, which costs more than
+        # the sections it defers
+        ctx = cls.fromkeys(sections, _PENDING)
+        ctx._factories = sections
+        return ctx
+
+    def __getitem__(self, key: str) -> Any:
+        value = dict.__getitem__(self, key)
+        if value is _PENDING:
+            value = self._factories[key]()
+            dict.__setitem__(self, key, value)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self else default
+
+    @property
+    def pending(self) -> tuple[str, ...]:
+        """Sections not built yet."""
+        return tuple(key for key, value in dict.items(self) if value is _PENDING)
+
+    def materialize(self) -> LazyContext:
+        """Build every pending section; returns self."""
+        for key in self.pending:
+            self[key]
+        return self
+
+    def __iter__(self) -> Iterator[str]:
+        # Overridden so dict(ctx) and {**ctx} read values through __getitem__
+        return dict.__iter__(self)
+
+    def values(self):  # type: ignore[override]
+        return dict.values(self.materialize())
+
+    def items(self):  # type: ignore[override]
+        return dict.items(self.materialize())
+
+    def copy(self) -> dict[str, Any]:  # type: ignore[override]
+        return dict(self.items())
+
+    def pop(self, key: str, *default: Any) -> Any:  # type: ignore[override]
+        if key in self:
+            self[key]
+        return dict.pop(self, key, *default)
+
+    def popitem(self) -> tuple[str, Any]:
+        return dict.popitem(self.materialize())
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self else dict.setdefault(self, key, default)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyContext):
+            other.materialize()
+        return dict.__eq__(self.materialize(), other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __or__(self, other: Any) -> dict[str, Any]:  # type: ignore[override]
+        return self.copy() | other
+
+    def __ror__(self, other: Any) -> dict[str, Any]:  # type: ignore[override]
+        return other | self.copy()
+
+    def __repr__(self) -> str:
+        return dict.__repr__(self.materialize())
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Section factories are closures; pickle as the plain dict
+        return dict, (self.copy(),)
+
+
+class _JsonStream:
+    """Minimal pull parser over a binary JSON file.
+
+    Navigates objects and arrays key by key and decodes individual values
+    with json.JSONDecoder.raw_decode, reading the file in chunks. Byte
+    offsets of decoded values are tracked for LazyMetadata.
+    """
+
+    _WHITESPACE = " \t\n\r"
+    _NUMBER_TAIL_RE = re.compile(r"[0-9.eE+-]*\Z")
+
+    def __init__(self, fh: BinaryIO, chunk_size: int = 1 << 16) -> None:
+        self._fh = fh
+        self._chunk_size = chunk_size
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._byte_pos = 0  # file offset of self._buf[self._pos]
+        self._eof = False
+
+    def _fill(self, min_size: int = 0) -> bool:
+        """Read more input, compacting consumed text. Returns False at EOF."""
+        if self._eof:
+            return False
+        data = self._fh.read(max(self._chunk_size, min_size))
+        self._eof = not data
+        self._buf = self._buf[self._pos:] + self._utf8.decode(data, final=self._eof)
+        self._pos = 0
+        return not self._eof
+
+    def _advance(self, pos: int) -> None:
+        self._byte_pos += len(self._buf[self._pos:pos].encode("utf-8"))
+        self._pos = pos
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            buf, pos = self._buf, self._pos
+            while pos < len(buf) and buf[pos] in self._WHITESPACE:
+                pos += 1
+            self._byte_pos += pos - self._pos  # whitespace is single-byte
+            self._pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of registry JSON")
+
+    def _expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at byte {self._byte_pos} of registry JSON")
+        self._advance(self._pos + 1)
+
+    def decode(self) -> tuple[Any, int, int]:
+        """Decode the next value. Returns (value, start byte, end byte)."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+                # A number cut at the buffer edge decodes short ("12." as 12,
+                # "1e" as 1); if everything left could continue it, read on
+                if self._eof or not self._NUMBER_TAIL_RE.match(self._buf, end):
+                    break
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._fill(len(self._buf))
+        start = self._byte_pos
+        self._advance(end)
+        return value, start, self._byte_pos
+
+    def iter_object(self) -> Iterator[str]:
+        """Yield each key of the next object; the caller consumes each value."""
+        self._expect("{")
+        if self.peek() == "}":
+            self._advance(self._pos + 1)
+            return
+        while True:
+            key = self.decode()[0]
+            self._expect(":")
+            yield key
+            if self.peek() == "}":
+                self._advance(self._pos + 1)
+                return
+            self._expect(",")
+
+    def iter_array(self) -> Iterator[None]:
+        """Yield once per element of the next array; the caller consumes each value."""
+        self._expect("[")
+        if self.peek() == "]":
+            self._advance(self._pos + 1)
+            return
+        while True:
+            yield None
+            if self.peek() == "]":
+                self._advance(self._pos + 1)
+                return
+            self._expect(",")
+
+
+# Fields indexed for every registry load
+INDEXED_FIELDS: tuple[str, ...] = ("organ", "tier", "implementation_status")
+
+
+def _hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _index_metadata(
+    index: dict[Any, dict[str, RepoContext]],
+    key: str,
+    ctx: RepoContext,
+    raw: Mapping[str, Any] | None = None,
+) -> None:
+    value = _metadata_value(ctx.metadata if raw is None else raw, key)
+    if value is not None and _hashable(value):
+        index.setdefault(value, {})[ctx.name] = ctx
+
+
+def _metadata_value(metadata: Mapping[str, Any], key: str) -> Any:
+    # Indexing reads one key of every repo; keeping every streamed repo
+    # decoded for that would undo streaming
+    if isinstance(metadata, LazyMetadata):
+        return metadata.peek(key)
+    return metadata.get(key)
+
+
+# System-level metadata
+_SYSTEM_CONTEXT: dict[str, Any] = {
+    "name": "organvm",
+    "total_organs": 8,
+    "site_url": "https://organvm-v-logos.github.io/public-process/",
+    "org_prefix": "organvm",
+}
+
+
+def _event_section(event: EventContext) -> dict[str, Any]:
+    section = {
+        "type": event.event_type,
+        "title": event.title or f"New {event.event_type}",
+        "summary": event.summary,
+        "url": event.url,
+        "version": event.version,
+        "date": event.date or date.today().isoformat(),
+        "tags": event.tags,
+    }
+    section.update(event.extras)
+    return section
+
+
+def _project_section(profile: Any) -> dict[str, Any]:
+    voice = getattr(profile, "voice", {}) or {}
+    return {
+        "name": getattr(profile, "display_name", ""),
+        "tagline": voice.get("tagline", ""),
+        "hashtags": " ".join(voice.get("hashtags", [])),
+        "tone": voice.get("tone", "neutral"),
+    }
+
+
 class RegistryLoader:
-    """Loads organ registry JSON and builds template context dicts."""
+    """Loads organ registry JSON and builds template context dicts.
+
+    With ``streaming=True`` large registries are parsed incrementally and
+    each repo's raw metadata is materialized lazily (see LazyMetadata).
+
+    Repos are indexed by organ, tier and implementation_status as they are
+    loaded, plus any raw metadata keys named in ``index_keys``, so
+    list_repos() and query() look up buckets instead of scanning. Other
+    metadata keys are indexed on first query.
+    """
 
-    def __init__(self, registry_path: Path | None = None) -> None:
+    def __init__(
+        self,
+        registry_path: Path | None = None,
+        index_keys: tuple[str, ...] = (),
+        streaming: bool = False,
+    ) -> None:
+        self._streaming = streaming
+        self._kept_keys = _CONTEXT_KEYS + tuple(k for k in index_keys if k not in _CONTEXT_KEYS)
         self._registry: dict[str, Any] = {}
         self._repos: dict[str, RepoContext] = {}
+        # field -> value -> {repo name: repo}; inner dicts keep load order
+        self._indexes: dict[str, dict[Any, dict[str, RepoContext]]] = {
+            f: {} for f in INDEXED_FIELDS
+        }
+        self._metadata_indexes: dict[str, dict[Any, dict[str, RepoContext]]] = {
+            k: {} for k in index_keys
+        }
         if registry_path and registry_path.exists():
             self.load(registry_path)
 
-    def load(self, path: Path) -> int:
-        """Load registry JSON. Returns number of repo entries parsed."""
+    def load(self, path: Path, streaming: bool | None = None) -> int:
+        """Load registry JSON. Returns number of repo entries parsed.
+
+        With ``streaming`` (defaulting to the loader's setting), the file is
+        parsed incrementally and only the context fields are kept per repo;
+        see _load_streaming().
+        """
+        if self._streaming if streaming is None else streaming:
+            return self._load_streaming(path)
         if _HAS_ENGINE_REGISTRY:
             raw = _engine_load_registry(path)
         else:
             raw = json.loads(path.read_text(encoding="utf-8"))
         self._registry = raw
+        return self._load_organs(raw.get("organs", raw))
 
-        # Parse repos from each organ section
+    def _load_organs(self, organs: Any) -> int:
+        """Parse repos from each organ section of a decoded registry."""
         count = 0
-        organs = raw.get("organs", raw)
         if isinstance(organs, dict):
             for organ_key, organ_data in organs.items():
                 repos: list[Any] = []
@@ -76,58 +429,167 @@ def load(self, path: Path) -> int:
                         repos = organ_data.get("repos", [])
                 for repo in repos:
                     if isinstance(repo, dict) and "name" in repo:
-                        ctx = RepoContext(
-                            name=repo["name"],
-                            organ=organ_key,
-                            description=repo.get("description", ""),
-                            tier=repo.get("tier", "standard"),
-                            url=repo.get("url", ""),
-                            implementation_status=repo.get("implementation_status", ""),
-                            metadata=repo,
-                        )
-                        self._repos[repo["name"]] = ctx
+                        self._add_repo(_repo_context(repo, organ_key, repo))
                         count += 1
         return count
 
+    def _load_streaming(self, path: Path) -> int:
+        """Incrementally parse a registry, one repository object at a time.
+
+        Each repo's raw metadata is replaced by a LazyMetadata handle that
+        re-reads its byte range from ``path`` on first access. Top-level keys
+        other than ``organs`` are kept in raw_registry; the organ sections
+        are not. Registries without an ``organs`` key are decoded in full.
+        """
+        top: dict[str, Any] = {}
+        count = 0
+        found_organs = False
+        with path.open("rb") as fh:
+            stream = _JsonStream(fh)
+            for key in stream.iter_object():
+                if key != "organs" or stream.peek() != "{":
+                    top[key] = stream.decode()[0]
+                    continue
+                found_organs = True
+                for organ_key in stream.iter_object():
+                    if stream.peek() != "{":
+                        stream.decode()
+                        continue
+                    # "repositories" wins over "repos", so only the latter is buffered
+                    has_repositories = False
+                    legacy: list[tuple[Any, int, int]] = []
+                    for organ_field in stream.iter_object():
+                        if organ_field in ("repositories", "repos") and stream.peek() == "[":
+                            canonical = organ_field == "repositories"
+                            has_repositories |= canonical
+                            for _ in stream.iter_array():
+                                repo, start, end = stream.decode()
+                                if canonical:
+                                    count += self._add_streamed(path, organ_key, repo, start, end)
+                                elif not has_repositories:
+                                    legacy.append((self._trim(repo), start, end))
+                        else:
+                            stream.decode()
+                    if not has_repositories:
+                        for repo, start, end in legacy:
+                            count += self._add_streamed(path, organ_key, repo, start, end)
+        if not found_organs:
+            count = self._load_organs(top)
+        self._registry = top
+        return count
+
+    def _trim(self, repo: Any) -> Any:
+        """Keep only the repo fields needed for contexts and indexes."""
+        if isinstance(repo, dict):
+            return {k: repo[k] for k in self._kept_keys if k in repo}
+        return repo
+
+    def _add_streamed(self, path: Path, organ: str, repo: Any, start: int, end: int) -> int:
+        if not (isinstance(repo, dict) and "name" in repo):
+            return 0
+        self._add_repo(_repo_context(repo, organ, LazyMetadata(path, start, end)), raw=repo)
+        return 1
+
+    def _add_repo(self, ctx: RepoContext, raw: Mapping[str, Any] | None = None) -> None:
+        previous = self._repos.get(ctx.name)
+        if previous is not None:
+            self._unindex(previous)
+        self._repos[ctx.name] = ctx
+        for f, index in self._indexes.items():
+            index.setdefault(getattr(ctx, f), {})[ctx.name] = ctx
+        for key, index in self._metadata_indexes.items():
+            _index_metadata(index, key, ctx, raw)
+
+    def _unindex(self, ctx: RepoContext) -> None:
+        for f, index in self._indexes.items():
+            index.get(getattr(ctx, f), {}).pop(ctx.name, None)
+        for key, index in self._metadata_indexes.items():
+            value = _metadata_value(ctx.metadata, key)
+            if value is not None and _hashable(value):
+                index.get(value, {}).pop(ctx.name, None)
+
+    def _metadata_index(self, key: str) -> dict[Any, dict[str, RepoContext]]:
+        index = self._metadata_indexes.get(key)
+        if index is None:
+            index = self._metadata_indexes[key] = {}
+            for ctx in self._repos.values():
+                _index_metadata(index, key, ctx)
+        return index
+
     def get_repo(self, name: str) -> RepoContext | None:
         return self._repos.get(name)
 
     def list_repos(self, organ: str | None = None) -> list[RepoContext]:
         if organ:
-            return [r for r in self._repos.values() if r.organ == organ]
+            return list(self._indexes["organ"].get(organ, {}).values())
         return list(self._repos.values())
 
+    def query(
+        self,
+        organ: str | None = None,
+        tier: str | None = None,
+        implementation_status: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> list[RepoContext]:
+        """Return repos matching every given criterion, in load order.
+
+        ``metadata`` matches raw registry keys by equality (hashable values
+        only). Criteria left as None are ignored; with none, all repos match.
+        """
+        buckets: list[dict[str, RepoContext]] = []
+        for f, value in (
+            ("organ", organ), ("tier", tier), ("implementation_status", implementation_status),
+        ):
+            if value is not None:
+                buckets.append(self._indexes[f].get(value, {}))
+        for key, value in (metadata or {}).items():
+            buckets.append(self._metadata_index(key).get(value, {}) if _hashable(value) else {})
+        if not buckets:
+            return list(self._repos.values())
+
+        # Walk the smallest bucket and probe the others
+        buckets.sort(key=len)
+        smallest, rest = buckets[0], buckets[1:]
+        return [
+            ctx for name, ctx in smallest.items() if all(name in bucket for bucket in rest)
+        ]
+
+    def distinct_values(self, field_name: str) -> list[Any]:
+        """Distinct values of an indexed field (or metadata key) across all repos."""
+        index = self._indexes.get(field_name) or self._metadata_index(field_name)
+        return [value for value, bucket in index.items() if bucket]
+
     def build_context(
         self,
         event: EventContext,
         repo_name: str | None = None,
         profile: Any | None = None,
-    ) -> dict[str, Any]:
-        """Build a full template context dict from event + registry data.
+    ) -> LazyContext:
+        """Build a template context from event + registry data.
+
+        The ``event``, ``repo``, ``system`` and ``project`` (with a profile)
+        sections are built when a template first reads them; see LazyContext.
 
         Args:
             event: Event context with type, title, summary, etc.
             repo_name: Repository name for registry lookup.
             profile: Optional ProjectProfile for per-project voice variables.
         """
-        ctx: dict[str, Any] = {
-            "event": {
-                "type": event.event_type,
-                "title": event.title or f"New {event.event_type}",
-                "summary": event.summary,
-                "url": event.url,
-                "version": event.version,
-                "date": event.date or datetime.now().strftime("%Y-%m-%d"),
-                "tags": event.tags,
-            },
+        target = repo_name or event.repo_name
+        sections: dict[str, Callable[[], Any]] = {
+            "event": lambda: _event_section(event),
+            "repo": lambda: self._repo_section(event, target),
+            "system": lambda: dict(_SYSTEM_CONTEXT),
         }
-        ctx["event"].update(event.extras)
+        # Per-project voice variables from profile
+        if profile:
+            sections["project"] = lambda: _project_section(profile)
+        return LazyContext.from_sections(sections)
 
-        # Add repo context if available
-        target = repo_name or event.repo_name
+    def _repo_section(self, event: EventContext, target: str | None) -> dict[str, Any]:
         repo = self._repos.get(target) if target else None
         if repo:
-            ctx["repo"] = {
+            return {
                 "name": repo.name,
                 "organ": repo.organ,
                 "description": repo.description,
@@ -135,35 +597,14 @@ def build_context(
                 "url": repo.url,
                 "implementation_status": repo.implementation_status,
             }
-        else:
-            ctx["repo"] = {
-                "name": target or "",
-                "organ": event.organ,
-                "description": "",
-                "tier": "",
-                "url": event.url,
-            }
-
-        # System-level metadata
-        ctx["system"] = {
-            "name": "organvm",
-            "total_organs": 8,
-            "site_url": "https://organvm-v-logos.github.io/public-process/",
-            "org_prefix": "organvm",
+        return {
+            "name": target or "",
+            "organ": event.organ,
+            "description": "",
+            "tier": "",
+            "url": event.url,
         }
 
-        # Per-project voice variables from profile
-        if profile:
-            voice = getattr(profile, "voice", {}) or {}
-            ctx["project"] = {
-                "name": getattr(profile, "display_name", ""),
-                "tagline": voice.get("tagline", ""),
-                "hashtags": " ".join(voice.get("hashtags", [])),
-                "tone": voice.get("tone", "neutral"),
-            }
-
-        return ctx
-
     @property
     def repo_count(self) -> int:
         return len(self._repos)
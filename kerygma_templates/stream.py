@@ -0,0 +1,116 @@
+"""Streaming JSONL render pipeline.
+
+Reads event records one line at a time, builds each context through
+RegistryLoader.build_context, renders the requested channels and yields
+JSON-ready result records, so arbitrarily long inputs run in constant memory.
+
+Input record (one JSON object per line):
+    {"event_type": "repo-launch", "repo_name": "...", "title": "...", ...,
+     "template_id": "repo-launch", "channels": ["mastodon"]}
+
+``event_type`` is required. ``template_id`` defaults to the event type and
+``channels`` to the template's declared channels. Keys matching EventContext
+fields populate it; any other keys are passed through as event extras.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import fields
+from typing import Any
+
+from kerygma_templates.engine import RenderResult, TemplateEngine
+from kerygma_templates.quality_checker import QualityChecker, QualityReport
+from kerygma_templates.registry_loader import EventContext, RegistryLoader
+
+_EVENT_FIELDS = {f.name for f in fields(EventContext)}
+_CONTROL_KEYS = {"template_id", "channels"}
+
+
+def result_record(
+    result: RenderResult, report: QualityReport | None = None,
+) -> dict[str, Any]:
+    """Serialize a render (and optionally its quality report) as a JSON-ready dict."""
+    record: dict[str, Any] = {
+        "template_id": result.template_id,
+        "channel": result.channel,
+        "text": result.text,
+        "unresolved_vars": result.unresolved_vars,
+    }
+    if result.degradations:
+        record["degradations"] = result.degradations
+    if report is not None:
+        record["passed"] = report.passed
+        record["failures"] = [
+            {"check": c.check_name, "severity": c.severity, "message": c.message}
+            for c in report.checks if not c.passed
+        ]
+    return record
+
+
+def event_from_record(record: dict[str, Any]) -> EventContext:
+    """Build an EventContext from a decoded input record."""
+    if not isinstance(record, dict):
+        raise ValueError("record must be a JSON object")
+    if not record.get("event_type"):
+        raise ValueError("record is missing 'event_type'")
+    kwargs: dict[str, Any] = {}
+    extras: dict[str, Any] = dict(record.get("extras") or {})
+    for key, value in record.items():
+        if key in _CONTROL_KEYS or key == "extras":
+            continue
+        if key in _EVENT_FIELDS:
+            kwargs[key] = value
+        else:
+            extras[key] = value
+    return EventContext(**kwargs, extras=extras)
+
+
+def render_stream(
+    lines: Iterable[str],
+    engine: TemplateEngine,
+    loader: RegistryLoader,
+    channels: list[str] | None = None,
+    checker: QualityChecker | None = None,
+    on_error: Callable[[int, str], None] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Render every event record in ``lines``, yielding one result per channel.
+
+    Args:
+        lines: JSONL input, consumed lazily.
+        engine: Engine holding the templates to render.
+        loader: Registry used to build each context.
+        channels: Channels to render when a record does not name its own;
+            defaults to the template's declared channels.
+        checker: If given, each result also carries ``passed`` and ``failures``.
+        on_error: Called with (line number, message) for records that cannot
+            be rendered; they are skipped and the stream continues.
+    """
+    for lineno, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            event = event_from_record(record)
+            template_id = record.get("template_id") or event.event_type
+            tmpl = engine.get_template(template_id)
+            if tmpl is None:
+                raise KeyError(f"Template '{template_id}' not found")
+            context = loader.build_context(event)
+            wanted = record.get("channels") or channels or tmpl.channels
+            if not isinstance(wanted, list) or not all(isinstance(c, str) for c in wanted):
+                raise ValueError("'channels' must be a list of channel names")
+            results = engine.render_batch((template_id, context, ch) for ch in wanted)
+        except (ValueError, KeyError, TypeError) as exc:
+            if on_error is not None:
+                on_error(lineno, exc.args[0] if exc.args else repr(exc))
+            continue
+
+        for result in results:
+            report = None
+            if checker is not None:
+                report = checker.check(
+                    result.text, result.channel, result.template_id, result.unresolved_vars,
+                )
+            yield {"line": lineno, **result_record(result, report)}
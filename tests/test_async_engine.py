@@ -0,0 +1,136 @@
+"""Tests for the asyncio engine façade."""
+
+import asyncio
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from kerygma_templates.async_engine import AsyncTemplateEngine
+from kerygma_templates.cli import sample_context
+from kerygma_templates.engine import TemplateEngine
+
+TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def engine():
+    engine = TemplateEngine()
+    engine.load_directory(TEMPLATES_DIR)
+    return engine
+
+
+def _jobs(engine, repeat=1):
+    context = sample_context()
+    return [
+        (t.template_id, context, ch) for t in engine.list_templates() for ch in t.channels
+    ] * repeat
+
+
+class TestAsyncTemplateEngine:
+    def test_load_and_render(self):
+        async def main():
+            aengine = AsyncTemplateEngine()
+            count = await aengine.load_directory(TEMPLATES_DIR)
+            result = await aengine.render("repo-launch", sample_context(), "mastodon")
+            return count, result
+
+        count, result = asyncio.run(main())
+        assert count > 0
+        assert "sample-repo" in result.text
+
+    def test_render_batch_matches_sync(self, engine):
+        jobs = _jobs(engine, repeat=3)
+        aengine = AsyncTemplateEngine(engine, chunk_size=7)
+        assert asyncio.run(aengine.render_batch(jobs)) == engine.render_batch(jobs)
+
+    def test_stream_async_source_unordered(self, engine):
+        jobs = _jobs(engine)
+
+        async def source():
+            for job in jobs:
+                await asyncio.sleep(0)
+                yield job
+
+        async def main():
+            aengine = AsyncTemplateEngine(engine, chunk_size=5)
+            return [r async for r in aengine.stream(source(), ordered=False)]
+
+        results = asyncio.run(main())
+        key = lambda r: (r.template_id, r.channel)  # noqa: E731
+        assert sorted(results, key=key) == sorted(engine.render_batch(jobs), key=key)
+
+    def test_unknown_template_raises(self, engine):
+        aengine = AsyncTemplateEngine(engine)
+        with pytest.raises(KeyError):
+            asyncio.run(aengine.render_batch([("nope", {}, "mastodon")]))
+
+    def test_loop_stays_responsive(self, engine):
+        jobs = _jobs(engine, repeat=20)
+
+        async def main():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0)
+
+            task = asyncio.create_task(ticker())
+            await AsyncTemplateEngine(engine, chunk_size=16).render_batch(jobs)
+            task.cancel()
+            return ticks
+
+        assert asyncio.run(main()) > 10
+
+    def test_concurrency_is_bounded(self, engine):
+        active = peak = 0
+        lock = threading.Lock()
+        render_batch = engine.render_batch
+
+        def slow_batch(requests):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.005)
+            with lock:
+                active -= 1
+            return render_batch(requests)
+
+        engine.render_batch = slow_batch
+        aengine = AsyncTemplateEngine(engine, max_concurrency=2, chunk_size=4)
+        jobs = _jobs(engine)
+
+        async def main():
+            return await asyncio.gather(aengine.render_batch(jobs), aengine.render_batch(jobs))
+
+        first, second = asyncio.run(main())
+        assert len(first) == len(second) == len(jobs)
+        assert peak == 2
+
+    def test_load_registry(self):
+        aengine = AsyncTemplateEngine()
+        loader = asyncio.run(aengine.load_registry(FIXTURES / "sample_registry.json"))
+        assert loader.get_repo("recursive-engine") is not None
+
+    def test_rejects_bad_limits(self):
+        with pytest.raises(ValueError):
+            AsyncTemplateEngine(max_concurrency=0)
+        with pytest.raises(ValueError):
+            AsyncTemplateEngine(chunk_size=0)
+
+    def test_package_imports_asyncio_on_first_use(self):
+        code = (
+            "import sys, kerygma_templates.cli\n"
+            "slow = {'asyncio', 'multiprocessing', 'statistics', 'importlib.metadata'}\n"
+            "assert not slow & set(sys.modules), slow & set(sys.modules)\n"
+            "from kerygma_templates import AsyncTemplateEngine\n"
+            "assert 'asyncio' in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,72 @@
+"""Tests for the benchmark suite."""
+
+import pytest
+
+from kerygma_templates.bench import (
+    CASES,
+    compare,
+    nested_template,
+    run_suite,
+    synthetic_contexts,
+    synthetic_patterns,
+    synthetic_registry,
+)
+from kerygma_templates.engine import Template, TemplateEngine
+
+
+def _report(**medians):
+    return {"results": {
+        name: {"name": name, "median": median, "params": {}} for name, median in medians.items()
+    }}
+
+
+class TestGenerators:
+    def test_registry_size(self):
+        registry = synthetic_registry(100)
+        assert sum(len(o["repositories"]) for o in registry["organs"].values()) == 100
+
+    def test_nested_template_renders(self):
+        engine = TemplateEngine()
+        engine.register(Template.from_string(nested_template(300)))
+        context = synthetic_contexts(1, depth=300)[0]
+        context["flags"] = {f"f{i}": True for i in range(300)}
+        text = engine.render("nested", context, "mastodon").text
+        assert text.startswith("level 0 Release 0") and "level 299" in text
+        assert "core Summary" in text
+
+    def test_patterns_extend_defaults(self):
+        patterns = synthetic_patterns(500)
+        assert len(patterns) == 500
+        assert patterns == synthetic_patterns(500)
+
+
+class TestSuite:
+    def test_quick_run(self):
+        report = run_suite(["engine.render", "registry.load"], quick=True, rounds=1)
+        assert set(report["results"]) == {"engine.render", "registry.load"}
+        result = report["results"]["registry.load"]
+        assert result["ops"] == result["params"]["repos"]
+        assert 0 < result["best"] <= result["median"]
+
+    def test_every_case_runs(self):
+        report = run_suite(quick=True, rounds=1)
+        assert list(report["results"]) == list(CASES)
+
+    def test_unknown_case(self):
+        with pytest.raises(KeyError, match="nope"):
+            run_suite(["nope"])
+
+
+class TestCompare:
+    def test_flags_regressions_over_threshold(self):
+        baseline = _report(fast=1.0, slow=1.0, gone=1.0)
+        current = _report(fast=1.1, slow=1.5, new=1.0)
+        by_name = {c.name: c for c in compare(baseline, current, threshold=0.2)}
+        assert set(by_name) == {"fast", "slow"}
+        assert not by_name["fast"].regressed
+        assert by_name["slow"].regressed and by_name["slow"].ratio == pytest.approx(1.5)
+
+    def test_skips_cases_with_other_params(self):
+        baseline = _report(case=1.0)
+        baseline["results"]["case"]["params"] = {"repos": 20_000}
+        assert compare(baseline, _report(case=5.0)) == []
@@ -0,0 +1,90 @@
+"""Tests for precompiled template bundles."""
+
+import json
+import os
+import pickle
+
+import pytest
+
+from kerygma_templates.bundle import BUNDLE_FORMAT, load_templates, read_bundle, write_bundle
+from kerygma_templates.engine import TemplateEngine
+
+
+@pytest.fixture
+def tmpl_dir(tmp_path):
+    d = tmp_path / "templates"
+    (d / "launch").mkdir(parents=True)
+    (d / "launch" / "a.md").write_text(
+        "---\ntemplate_id: a\nchannels: [mastodon]\n---\nA {{ x }}"
+    )
+    (d / "notes.md").write_text("No frontmatter here")
+    return d
+
+
+class TestBundle:
+    def test_roundtrip(self, tmpl_dir, tmp_path):
+        bundle = tmp_path / "bundle.json"
+        assert write_bundle(tmpl_dir, bundle) == 1
+        templates = read_bundle(bundle, tmpl_dir)
+        assert [t.template_id for t in templates] == ["a"]
+        assert templates[0].plan is not None
+
+    def test_load_templates_uses_fresh_bundle(self, tmpl_dir, tmp_path, monkeypatch):
+        bundle = tmp_path / "bundle.json"
+        write_bundle(tmpl_dir, bundle)
+        engine = TemplateEngine()
+        monkeypatch.setattr(engine, "load_directory", lambda d: pytest.fail("read sources"))
+        assert load_templates(engine, tmpl_dir, bundle) == 1
+        assert engine.render("a", {"x": 1}, "mastodon").text == "A 1"
+
+    def test_edited_source_invalidates(self, tmpl_dir, tmp_path):
+        bundle = tmp_path / "bundle.json"
+        write_bundle(tmpl_dir, bundle)
+        (tmpl_dir / "launch" / "a.md").write_text(
+            "---\ntemplate_id: a\nchannels: [mastodon]\n---\nB {{ x }}"
+        )
+        assert read_bundle(bundle, tmpl_dir) is None
+        engine = TemplateEngine()
+        load_templates(engine, tmpl_dir, bundle)
+        assert engine.render("a", {"x": 1}, "mastodon").text == "B 1"
+
+    def test_added_source_invalidates(self, tmpl_dir, tmp_path):
+        bundle = tmp_path / "bundle.json"
+        write_bundle(tmpl_dir, bundle)
+        (tmpl_dir / "b.md").write_text("---\ntemplate_id: b\n---\nB")
+        assert read_bundle(bundle, tmpl_dir) is None
+
+    def test_touched_but_unchanged_source_stays_fresh(self, tmpl_dir, tmp_path):
+        bundle = tmp_path / "bundle.json"
+        write_bundle(tmpl_dir, bundle)
+        path = tmpl_dir / "launch" / "a.md"
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+        assert read_bundle(bundle, tmpl_dir) is not None
+
+    def test_missing_or_corrupt_bundle(self, tmpl_dir, tmp_path):
+        assert read_bundle(tmp_path / "missing.json", tmpl_dir) is None
+        corrupt = tmp_path / "corrupt.json"
+        corrupt.write_bytes(b"not json {")
+        assert read_bundle(corrupt, tmpl_dir) is None
+
+    def test_bundle_is_data_only(self, tmpl_dir, tmp_path):
+        bundle = tmp_path / "bundle.json"
+        write_bundle(tmpl_dir, bundle)
+        payload = json.loads(bundle.read_text(encoding="utf-8"))
+        assert payload["format"] == BUNDLE_FORMAT
+        assert payload["templates"] == [{
+            "metadata": {"template_id": "a", "channels": ["mastodon"]}, "body": "A {{ x }}",
+        }]
+        # A pickle (from an older release, or planted in a checkout) is never unpickled
+        bundle.write_bytes(pickle.dumps(payload))
+        assert read_bundle(bundle, tmpl_dir) is None
+
+    def test_bundle_sources_are_tracked_for_refresh(self, tmpl_dir, tmp_path):
+        bundle = tmp_path / "bundle.json"
+        write_bundle(tmpl_dir, bundle)
+        engine = TemplateEngine()
+        load_templates(engine, tmpl_dir, bundle)
+        assert not engine.refresh().changed
+        (tmpl_dir / "launch" / "a.md").write_text("---\ntemplate_id: a\n---\nedited")
+        assert engine.refresh().updated == ["a"]
@@ -1,5 +1,8 @@
 """Tests for the CLI module."""
 
+import json
+
+import pytest
 
 from kerygma_templates.cli import main
 
@@ -26,7 +29,117 @@ def test_check_command(self, capsys):
         captured = capsys.readouterr()
         assert "repo-launch" in captured.out
 
+    def test_render_fit(self, capsys):
+        main(["render", "repo-launch", "mastodon", "--fit"])
+        captured = capsys.readouterr()
+        assert "sample-repo" in captured.out
+        assert "[FIT]" not in captured.err  # The sample already fits
+
+    def test_render_output_file(self, capsys, tmp_path):
+        out = tmp_path / "post.md"
+        main(["render", "repo-launch", "ghost", "--output", str(out)])
+        main(["render", "repo-launch", "ghost"])
+        assert out.read_text(encoding="utf-8") == capsys.readouterr().out
+
+    def test_check_profile(self, capsys):
+        main(["check", "repo-launch", "mastodon", "--profile", "--repeat", "5"])
+        out = capsys.readouterr().out
+        assert "Mean µs" in out
+        assert "anti_patterns" in out and "(scan)" in out
+
+    def test_bench_baseline(self, capsys, tmp_path):
+        out = tmp_path / "bench.json"
+        main(["bench", "engine.render", "--quick", "--rounds", "1", "--output", str(out)])
+        report = json.loads(out.read_text())
+        assert "engine.render" in report["results"]
+
+        # A baseline ten times faster than this run is a regression
+        report["results"]["engine.render"]["median"] /= 10
+        out.write_text(json.dumps(report))
+        with pytest.raises(SystemExit):
+            main(["bench", "engine.render", "--quick", "--rounds", "1", "--baseline", str(out)])
+        assert "REGRESSION" in capsys.readouterr().err
+
+    @pytest.mark.parametrize("content, message", [
+        (None, "cannot read"),
+        ("{not json", "not valid JSON"),
+        ('{"results": {"engine.render": {}}}', "not a bench report"),
+    ])
+    def test_bench_bad_baseline_fails_before_running(self, capsys, tmp_path, content, message):
+        path = tmp_path / "baseline.json"
+        if content is not None:
+            path.write_text(content)
+        with pytest.raises(SystemExit) as exc_info:
+            main(["bench", "engine.render", "--quick", "--rounds", "1", "--baseline", str(path)])
+        assert exc_info.value.code == 1
+        captured = capsys.readouterr()
+        assert captured.err.startswith("Error: ") and message in captured.err
+        assert captured.out == ""  # The suite never ran
+
     def test_no_command_shows_help(self, capsys):
         main([])
         captured = capsys.readouterr()
         assert "usage" in captured.out.lower() or "announce" in captured.out.lower()
+
+    def test_render_batch_command(self, capsys, tmp_path):
+        jobs = tmp_path / "jobs.jsonl"
+        jobs.write_text(
+            '{"template_id": "repo-launch", "channel": "mastodon"}\n'
+            "not json\n"
+            '{"template_id": "repo-launch", "channel": "bluesky"}\n'
+        )
+        main(["render-batch", "--input", str(jobs), "--jobs", "2"])
+        captured = capsys.readouterr()
+        records = [json.loads(line) for line in captured.out.splitlines()]
+        assert [r["channel"] for r in records] == ["mastodon", "bluesky"]
+        assert "Skipping line 2" in captured.err
+
+    def test_render_batch_keeps_empty_context(self, capsys, tmp_path):
+        jobs = tmp_path / "jobs.jsonl"
+        jobs.write_text('{"template_id": "repo-launch", "channel": "mastodon", "context": {}}\n')
+        main(["render-batch", "--input", str(jobs), "--jobs", "1"])
+        record = json.loads(capsys.readouterr().out)
+        assert "repo.name" in record["unresolved_vars"]
+
+    def test_render_batch_skips_invalid_jobs(self, capsys, tmp_path):
+        jobs = tmp_path / "jobs.jsonl"
+        jobs.write_text(
+            '{"template_id": "nope", "channel": "mastodon"}\n'
+            '{"template_id": "repo-launch", "channel": "mastodon", "context": null}\n'
+            '{"template_id": "repo-launch", "channel": "mastodon", "context": 3}\n'
+            '{"template_id": "repo-launch", "channel": "mastodon"}\n'
+        )
+        main(["render-batch", "--input", str(jobs), "--jobs", "1"])
+        captured = capsys.readouterr()
+        assert len(captured.out.splitlines()) == 1
+        assert "line 1: unknown template 'nope'" in captured.err
+        assert "line 2: context must be an object, not NoneType" in captured.err
+        assert "line 3: context must be an object, not int" in captured.err
+
+    @pytest.mark.parametrize("command", ["render-batch", "render-stream"])
+    def test_missing_input_file(self, capsys, tmp_path, command):
+        with pytest.raises(SystemExit) as exc_info:
+            main([command, "--input", str(tmp_path / "missing.jsonl")])
+        assert exc_info.value.code == 1
+        assert capsys.readouterr().err.startswith("Error: cannot read ")
+
+    def test_render_stream_command(self, capsys, tmp_path):
+        events = tmp_path / "events.jsonl"
+        events.write_text(
+            '{"event_type": "repo-launch", "repo_name": "r1"}\n'
+            "{broken\n"
+        )
+        main(["render-stream", "--input", str(events), "--channel", "mastodon"])
+        captured = capsys.readouterr()
+        records = [json.loads(line) for line in captured.out.splitlines()]
+        assert len(records) == 1
+        assert records[0]["channel"] == "mastodon"
+        assert "line 2" in captured.err
+
+    def test_compile_command(self, capsys, tmp_path):
+        bundle = tmp_path / "bundle.json"
+        main(["--bundle", str(bundle), "compile"])
+        assert bundle.exists()
+        assert "Compiled" in capsys.readouterr().out
+        main(["--bundle", str(bundle), "list"])
+        assert "repo-launch" in capsys.readouterr().out
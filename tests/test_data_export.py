@@ -1,14 +1,17 @@
 """Tests for kerygma_templates.data_export module."""
 import json
+import shutil
 from pathlib import Path
 
 import pytest
 
+from kerygma_templates import data_export
 from kerygma_templates.data_export import (
     build_quality_summary,
     build_template_registry,
     export_all,
 )
+from kerygma_templates.engine import TemplateEngine
 
 
 @pytest.fixture
@@ -79,3 +82,41 @@ def test_export_all_includes_quality_summary(templates_dir, tmp_output):
     data = json.loads(paths[0].read_text())
     assert "quality_summary" in data
     assert data["quality_summary"]["total_checks"] > 0
+
+
+def test_export_all_skips_unchanged_output(templates_dir, tmp_output):
+    first = export_all(templates_dir, tmp_output)
+    written = first[0].read_text()
+    assert export_all(templates_dir, tmp_output) == []
+    assert first[0].read_text() == written  # generated_at kept too
+
+
+def test_export_all_rechecks_only_edited_templates(templates_dir, tmp_path, monkeypatch):
+    src = tmp_path / "templates"
+    shutil.copytree(templates_dir, src)
+    export_all(src, tmp_path / "data")
+
+    checked = []
+    original = data_export._check_templates
+
+    def spy(engine, checker, templates, context, jobs):
+        checked.extend(t.template_id for t in templates)
+        return original(engine, checker, templates, context, jobs)
+
+    monkeypatch.setattr(data_export, "_check_templates", spy)
+    path = src / "launch" / "repo-launch.md"
+    path.write_text(path.read_text().replace("{{/channel}}", "stay tuned\n{{/channel}}", 1))
+    export_all(src, tmp_path / "data")
+    assert checked == ["repo-launch"]
+
+    data = json.loads((tmp_path / "data" / "template-registry.json").read_text())
+    assert any(
+        d["template_id"] == "repo-launch" and d["check"] == "anti_patterns"
+        for d in data["quality_summary"]["failure_details"]
+    )
+
+
+def test_quality_summary_parallel_matches_serial(templates_dir):
+    engine = TemplateEngine()
+    engine.load_directory(templates_dir)
+    assert build_quality_summary(engine=engine, jobs=2) == build_quality_summary(templates_dir)
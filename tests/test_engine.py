@@ -1,10 +1,22 @@
 """Tests for the template engine."""
 
+import io
+import os
+import random
+import threading
+from pathlib import Path
+
 import pytest
 from kerygma_templates.engine import (
     TemplateEngine,
+    TemplateSyntaxError,
     Template,
+    WalkMark,
+    clean_chunks,
+    clean_text,
     parse_frontmatter,
+    project_context,
+    walk_nodes,
     _resolve_var,
     _is_truthy,
 )
@@ -212,3 +224,553 @@ def test_zero_parsed_as_int(self):
         text = "---\ncount: 0\n---\nBody"
         meta, _ = parse_frontmatter(text)
         assert meta["count"] == 0
+
+
+class TestRenderPlan:
+    def test_register_compiles_plan(self):
+        engine = TemplateEngine()
+        tmpl = Template.from_string(
+            "---\ntemplate_id: plan\nchannels: [mastodon]\n---\n"
+            "{{#channel mastodon}}M {{ x }}{{/channel}}"
+        )
+        assert tmpl.plan is None
+        engine.register(tmpl)
+        assert tmpl.plan is not None
+        assert "mastodon" in tmpl.plan.channels
+
+    def test_unresolved_var_keeps_original_tag(self):
+        engine = TemplateEngine()
+        engine.register(Template.from_string("---\ntemplate_id: raw\n---\nHi {{name}} {{ a.b }}"))
+        result = engine.render("raw", {}, "mastodon")
+        assert result.text == "Hi {{name}} {{ a.b }}"
+        assert result.unresolved_vars == ["name", "a.b"]
+
+    def test_unknown_channel_renders_text_outside_blocks(self):
+        engine = TemplateEngine()
+        engine.register(Template.from_string(
+            "---\ntemplate_id: outside\n---\n"
+            "Shared {{ x }}\n{{#channel mastodon}}M{{/channel}}"
+        ))
+        assert engine.render("outside", {"x": 1}, "discord").text == "Shared 1"
+
+    def test_conditional_branches_are_stripped(self):
+        engine = TemplateEngine()
+        engine.register(Template.from_string(
+            "---\ntemplate_id: strip\n---\n[{{#if a}}  yes  {{#else}}\n no \n{{/if}}]"
+        ))
+        assert engine.render("strip", {"a": True}, "m").text == "[yes]"
+        assert engine.render("strip", {}, "m").text == "[no]"
+
+
+class TestNestedConditionals:
+    def _render(self, body: str, context: dict) -> str:
+        engine = TemplateEngine()
+        engine.register(Template.from_string("---\ntemplate_id: t\n---\n" + body))
+        return engine.render("t", context, "mastodon").text
+
+    def test_inner_false_keeps_outer_tail(self):
+        body = "{{#if outer}}OUTER-{{#if inner}}INNER{{/if}}-END{{/if}}"
+        assert self._render(body, {"outer": True, "inner": False}) == "OUTER--END"
+
+    def test_else_pairs_with_innermost_if(self):
+        body = "{{#if a}}{{#if b}}AB{{#else}}A{{/if}}{{#else}}NONE{{/if}}"
+        assert self._render(body, {"a": True, "b": True}) == "AB"
+        assert self._render(body, {"a": True}) == "A"
+        assert self._render(body, {"b": True}) == "NONE"
+
+    def test_deep_nesting(self):
+        depth = 5000
+        body = "{{#if x}}" * depth + "deep" + "{{/if}}" * depth
+        assert self._render(body, {"x": True}) == "deep"
+        assert self._render(body, {}) == ""
+
+    def test_unclosed_if_raises(self):
+        tmpl = Template.from_string("---\ntemplate_id: bad\n---\nline one\n{{#if a}}open")
+        with pytest.raises(TemplateSyntaxError) as exc_info:
+            TemplateEngine().register(tmpl)
+        assert exc_info.value.lineno == 2
+        assert "bad" in str(exc_info.value)
+
+    def test_stray_close_raises(self):
+        tmpl = Template.from_string(
+            "---\ntemplate_id: bad\n---\n{{#channel mastodon}}\nok\n{{/if}}{{/channel}}"
+        )
+        with pytest.raises(TemplateSyntaxError) as exc_info:
+            tmpl.compile()
+        assert exc_info.value.channel == "mastodon"
+        assert exc_info.value.lineno == 3
+
+    def test_duplicate_else_raises(self):
+        with pytest.raises(TemplateSyntaxError):
+            Template.from_string(
+                "---\ntemplate_id: bad\n---\n{{#if a}}x{{#else}}y{{#else}}z{{/if}}"
+            ).compile()
+
+
+
+class TestEach:
+    def _engine(self, body: str) -> TemplateEngine:
+        engine = TemplateEngine()
+        engine.register(Template.from_string("---\ntemplate_id: t\n---\n" + body))
+        return engine
+
+    def _render(self, body: str, context: dict) -> str:
+        return self._engine(body).render("t", context, "mastodon").text
+
+    def test_items_and_index(self):
+        body = "{{#each event.tags}}{{ @index }}:#{{ this }}{{#if @last}}.{{/if}} {{/each}}"
+        context = {"event": {"tags": ["organvm", "release"]}}
+        assert self._render(body, context) == "0:#organvm 1:#release."
+
+    def test_alias_scope_and_outer_context(self):
+        body = (
+            "# {{ title }}\n"
+            "{{#each essays as essay}}\n"
+            "- [{{ essay.title }}]({{ essay.url }}) in {{ title }}\n"
+            "{{/each}}\n"
+            "end"
+        )
+        context = {"title": "Digest", "essays": [
+            {"title": "One", "url": "u1"}, {"title": "Two", "url": "u2"},
+        ]}
+        assert self._render(body, context) == (
+            "# Digest\n- [One](u1) in Digest\n- [Two](u2) in Digest\nend"
+        )
+
+    def test_limit_and_else(self):
+        body = "{{#each xs limit=2}}{{ this }};{{#else}}none{{/each}}"
+        assert self._render(body, {"xs": [1, 2, 3]}) == "1;2;"
+        assert self._render(body, {"xs": []}) == "none"
+        assert self._render(body, {}) == "none"
+
+    def test_nested_loops(self):
+        body = (
+            "{{#each rows as row}}[{{#each row.cells}}{{ this }}{{ row.sep }}{{/each}}]"
+            "{{/each}}"
+        )
+        context = {"rows": [{"cells": [1, 2], "sep": ","}, {"cells": [3], "sep": "|"}]}
+        assert self._render(body, context) == "[1,2,][3|]"
+
+    def test_unresolved_item_fields(self):
+        result = self._engine("{{#each xs as x}}{{ x.name }}{{/each}}").render(
+            "t", {"xs": [{"name": "a"}, {}]}, "mastodon",
+        )
+        assert result.text == "a{{ x.name }}"
+        assert result.unresolved_vars == ["x.name"]
+
+    def test_many_items(self):
+        items = [{"n": i} for i in range(10_000)]
+        text = self._render("{{#each items as item}}{{ item.n }}\n{{/each}}", {"items": items})
+        assert text.split("\n") == [str(i) for i in range(10_000)]
+
+    def test_dependencies_exclude_loop_names(self):
+        tmpl = Template.from_string(
+            "---\ntemplate_id: t\n---\n"
+            "{{#each digest.essays as essay}}{{ essay.title }}{{ @index }}"
+            "{{ digest.site_url }}{{/each}}"
+        )
+        assert tmpl.dependencies() == ("digest.essays", "digest.site_url")
+
+    def test_mismatched_close_raises(self):
+        with pytest.raises(TemplateSyntaxError) as exc_info:
+            Template.from_string("---\ntemplate_id: bad\n---\n{{#each xs}}\n{{/if}}").compile()
+        assert exc_info.value.lineno == 2
+        assert "{{#each xs}}" in str(exc_info.value)
+
+    def test_unclosed_each_raises(self):
+        with pytest.raises(TemplateSyntaxError, match="unclosed"):
+            Template.from_string("---\ntemplate_id: bad\n---\n{{#each xs}}x").compile()
+
+
+class TestStreamingRender:
+    TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
+
+    def test_clean_chunks_matches_clean(self):
+        rng = random.Random(0)
+        alphabet = ["\n", "\n\n", " ", "\t", "  \n", "a", "b c"]
+        for _ in range(2000):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+            cuts = sorted(rng.sample(range(len(text) + 1), min(len(text) + 1, 4)))
+            pieces = [text[i:j] for i, j in zip([0, *cuts], [*cuts, len(text)])]
+            assert "".join(clean_chunks(pieces)) == clean_text(text), repr(text)
+
+    def test_walk_nodes_marks_structure(self):
+        nodes = Template.from_string(
+            "---\ntemplate_id: t\n---\n"
+            "{{#if a}}{{ a }}{{/if}}{{#each xs}}{{ this }}{{ nope }}{{/each}}"
+        ).compile().for_channel("m")
+        unresolved: list[str] = []
+        pieces = list(walk_nodes(nodes, {"a": "A", "xs": [1]}, unresolved))
+        assert pieces == [
+            WalkMark("section", "a"), WalkMark("var", "a"), "A", WalkMark("end", "a"),
+            WalkMark("loop", "xs"), WalkMark("var", "this"), "1",
+            WalkMark("missing", "nope"), "{{ nope }}", WalkMark("end", "xs"),
+        ]
+        assert unresolved == ["nope"]
+
+    def test_render_to_matches_render(self):
+        engine = TemplateEngine()
+        engine.load_directory(self.TEMPLATES_DIR)
+        context = {"repo": {"name": "r", "tier": "flagship"}, "event": {"title": "T"}}
+        for tmpl in engine.list_templates():
+            for channel in tmpl.channels:
+                expected = engine.render(tmpl.template_id, context, channel)
+                stream = io.StringIO()
+                unresolved = engine.render_to(stream, tmpl.template_id, context, channel)
+                assert stream.getvalue() == expected.text
+                assert unresolved == expected.unresolved_vars
+
+    def test_iter_render_chunks(self):
+        engine = TemplateEngine()
+        engine.register(Template.from_string(
+            "---\ntemplate_id: long\n---\n{{#each items}}line {{ this }}\n\n\n{{/each}}"
+        ))
+        context = {"items": list(range(2000))}
+        pieces = list(engine.iter_render("long", context, "ghost", chunk_size=1024))
+        assert len(pieces) > 1
+        assert all(len(piece) >= 1024 for piece in pieces[:-1])
+        assert "".join(pieces) == engine.render("long", context, "ghost").text
+
+    def test_render_to_uses_cache(self):
+        engine = TemplateEngine(cache_size=4)
+        engine.register(Template.from_string("---\ntemplate_id: t\n---\nHi {{ name }} {{ x }}"))
+        engine.render("t", {"name": "a"}, "m")
+        stream = io.StringIO()
+        assert engine.render_to(stream, "t", {"name": "a"}, "m") == ["x"]
+        assert stream.getvalue() == "Hi a {{ x }}"
+        assert engine.cache_stats().hits == 1
+
+class TestBatchRender:
+    def _make_engine(self) -> TemplateEngine:
+        engine = TemplateEngine()
+        engine.register(Template.from_string(
+            "---\ntemplate_id: multi\nchannels: [mastodon, discord]\n---\n"
+            "{{#channel mastodon}}M {{ title }}{{/channel}}\n"
+            "{{#channel discord}}D {{ title }} {{ missing }}{{/channel}}"
+        ))
+        return engine
+
+    def test_render_batch_matches_render(self):
+        engine = self._make_engine()
+        a, b = {"title": "A"}, {"title": "B"}
+        requests = [("multi", a, "mastodon"), ("multi", a, "discord"), ("multi", b, "mastodon")]
+        results = engine.render_batch(requests)
+        assert results == [engine.render(*req) for req in requests]
+
+    def test_render_batch_missing_template_raises(self):
+        engine = self._make_engine()
+        with pytest.raises(KeyError):
+            engine.render_batch([("nope", {}, "mastodon")])
+
+    def test_render_all_channels_order(self):
+        engine = self._make_engine()
+        results = engine.render_all_channels("multi", [{"title": "A"}, {"title": "B"}])
+        assert [(r.channel, r.text) for r in results] == [
+            ("mastodon", "M A"),
+            ("discord", "D A {{ missing }}"),
+            ("mastodon", "M B"),
+            ("discord", "D B {{ missing }}"),
+        ]
+        assert results[1].unresolved_vars == ["missing"]
+
+
+class TestRefresh:
+    def _write(self, path, template_id, body):
+        path.write_text(f"---\ntemplate_id: {template_id}\nchannels: [mastodon]\n---\n{body}")
+
+    def _bump_mtime(self, path):
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    def test_refresh_reports_changes(self, tmp_path):
+        self._write(tmp_path / "a.md", "a", "A1")
+        self._write(tmp_path / "b.md", "b", "B1")
+        engine = TemplateEngine()
+        engine.load_directory(tmp_path)
+        assert not engine.refresh().changed
+
+        self._write(tmp_path / "a.md", "a", "A2 changed")
+        (tmp_path / "b.md").unlink()
+        self._write(tmp_path / "c.md", "c", "C1")
+        report = engine.refresh()
+        assert (report.added, report.updated, report.removed) == (["c"], ["a"], ["b"])
+        assert engine.render("a", {}, "mastodon").text == "A2 changed"
+        assert engine.get_template("b") is None
+
+    def test_refresh_skips_unchanged_content(self, tmp_path):
+        self._write(tmp_path / "a.md", "a", "A1")
+        engine = TemplateEngine()
+        engine.load_directory(tmp_path)
+        before = engine.get_template("a")
+        self._bump_mtime(tmp_path / "a.md")
+        assert not engine.refresh().changed
+        assert engine.get_template("a") is before
+
+    def test_refresh_rename_is_an_update(self, tmp_path):
+        self._write(tmp_path / "a.md", "x", "X1")
+        engine = TemplateEngine()
+        engine.load_directory(tmp_path)
+        (tmp_path / "a.md").rename(tmp_path / "b.md")
+        report = engine.refresh()
+        assert (report.added, report.updated, report.removed) == ([], ["x"], [])
+        assert engine.render("x", {}, "mastodon").text == "X1"
+        (tmp_path / "b.md").unlink()
+        assert engine.refresh().removed == ["x"]
+        assert engine.get_template("x") is None
+
+    def test_refresh_falls_back_to_file_sharing_the_id(self, tmp_path):
+        self._write(tmp_path / "a.md", "x", "from a")
+        self._write(tmp_path / "b.md", "x", "from b")
+        engine = TemplateEngine()
+        engine.load_directory(tmp_path)
+        assert engine.render("x", {}, "mastodon").text == "from b"
+        (tmp_path / "a.md").unlink()
+        assert not engine.refresh().changed
+        self._write(tmp_path / "a.md", "x", "from a")
+        self._write(tmp_path / "b.md", "y", "now y")
+        report = engine.refresh()
+        assert (report.added, report.updated, report.removed) == (["y"], ["x"], [])
+        assert engine.render("x", {}, "mastodon").text == "from a"
+
+    def test_refresh_syntax_error_keeps_snapshot(self, tmp_path):
+        self._write(tmp_path / "a.md", "a", "A1")
+        engine = TemplateEngine()
+        engine.load_directory(tmp_path)
+        self._write(tmp_path / "a.md", "a", "{{#if x}}broken")
+        with pytest.raises(TemplateSyntaxError):
+            engine.refresh()
+        assert engine.render("a", {}, "mastodon").text == "A1"
+
+    def test_in_flight_batch_sees_one_snapshot(self, tmp_path):
+        self._write(tmp_path / "a.md", "a", "old")
+        engine = TemplateEngine()
+        engine.load_directory(tmp_path)
+
+        def requests():
+            yield "a", {}, "mastodon"
+            self._write(tmp_path / "a.md", "a", "new version")
+            engine.refresh()
+            yield "a", {}, "mastodon"
+
+        results = engine.render_batch(requests())
+        assert [r.text for r in results] == ["old", "old"]
+        assert engine.render("a", {}, "mastodon").text == "new version"
+
+    def test_watcher_picks_up_edits(self, tmp_path):
+        self._write(tmp_path / "a.md", "a", "A1")
+        engine = TemplateEngine()
+        engine.load_directory(tmp_path)
+        changed = threading.Event()
+        watcher = engine.watch(interval=0.01, on_change=lambda report: changed.set())
+        try:
+            self._write(tmp_path / "a.md", "a", "A2 edited")
+            assert changed.wait(5)
+        finally:
+            watcher.stop()
+        assert engine.render("a", {}, "mastodon").text == "A2 edited"
+
+
+class TestRenderCache:
+    def _make_engine(self, cache_size=8) -> TemplateEngine:
+        engine = TemplateEngine(cache_size=cache_size)
+        engine.register(Template.from_string(
+            "---\ntemplate_id: t\nchannels: [mastodon, discord]\n---\n"
+            "{{#channel mastodon}}{{ repo.name }}{{#if flag}}!{{/if}}{{/channel}}\n"
+            "{{#channel discord}}{{ repo.url }}{{/channel}}"
+        ))
+        return engine
+
+    def test_hits_on_referenced_values_only(self):
+        engine = self._make_engine()
+        first = engine.render("t", {"repo": {"name": "a", "url": "u1"}}, "mastodon")
+        second = engine.render("t", {"repo": {"name": "a", "url": "u2"}, "x": 1}, "mastodon")
+        assert first == second
+        assert engine.cache_stats().hits == 1
+        assert engine.render("t", {"repo": {"name": "a"}, "flag": True}, "mastodon").text == "a!"
+        assert engine.cache_stats().misses == 2
+
+    def test_values_with_equal_hash_do_not_collide(self):
+        engine = self._make_engine()
+        texts = [engine.render("t", {"repo": {"name": v}}, "mastodon").text
+                 for v in (1, True, 1.0, "1")]
+        assert texts == ["1", "True", "1.0", "1"]
+        assert engine.cache_stats().hits == 0
+
+    def test_objects_with_default_repr_are_not_cached(self):
+        class Name:
+            def __init__(self, value):
+                self.value = value
+
+            def __str__(self):
+                return self.value
+
+        engine = self._make_engine()
+        # Each object is freed before the next is made, so addresses (and
+        # with them default reprs) get reused
+        texts = [engine.render("t", {"repo": {"name": Name(v)}}, "mastodon").text
+                 for v in ("alice", "bob", "carol", "dave")]
+        assert texts == ["alice", "bob", "carol", "dave"]
+        assert engine.cache_stats().hits == 0
+        engine.render("t", {"repo": {"name": "alice", "tags": ["a", {"b": 1}]}}, "mastodon")
+        engine.render("t", {"repo": {"name": "alice", "tags": ["a", {"b": 1}]}}, "mastodon")
+        assert engine.cache_stats().hits == 1
+
+    def test_lru_eviction(self):
+        engine = self._make_engine(cache_size=2)
+        for name in ("a", "b", "a", "c", "b"):
+            engine.render("t", {"repo": {"name": name}}, "mastodon")
+        stats = engine.cache_stats()
+        assert (stats.hits, stats.misses, stats.evictions, stats.size) == (1, 4, 2, 2)
+
+    def test_reregister_invalidates(self):
+        engine = self._make_engine()
+        ctx = {"repo": {"name": "a"}}
+        engine.render("t", ctx, "mastodon")
+        engine.register(Template.from_string(
+            "---\ntemplate_id: t\nchannels: [mastodon]\n---\nNew {{ repo.name }}"
+        ))
+        assert engine.cache_stats().size == 0
+        assert engine.render("t", ctx, "mastodon").text == "New a"
+
+    def test_refresh_invalidates(self, tmp_path):
+        (tmp_path / "t.md").write_text("---\ntemplate_id: t\n---\nv1 {{ x }}")
+        engine = TemplateEngine(cache_size=8)
+        engine.load_directory(tmp_path)
+        assert engine.render("t", {"x": 1}, "mastodon").text == "v1 1"
+        (tmp_path / "t.md").write_text("---\ntemplate_id: t\n---\nversion 2 {{ x }}")
+        engine.refresh()
+        assert engine.render("t", {"x": 1}, "mastodon").text == "version 2 1"
+
+    def test_cached_results_are_copies(self):
+        engine = self._make_engine()
+        ctx = {"repo": {}}
+        engine.render("t", ctx, "mastodon").unresolved_vars.append("junk")
+        assert engine.render("t", ctx, "mastodon").unresolved_vars == ["repo.name"]
+
+    def test_batch_and_all_channels_use_cache(self):
+        engine = self._make_engine()
+        ctx = {"repo": {"name": "a", "url": "u"}}
+        uncached = TemplateEngine()
+        uncached.register(engine.get_template("t"))
+        expected = uncached.render_all_channels("t", [ctx, ctx])
+        assert engine.render_all_channels("t", [ctx, ctx]) == expected
+        assert engine.render_batch([("t", ctx, "discord")]) == [expected[1]]
+        assert engine.cache_stats().hits == 3
+
+    def test_cache_disabled_by_default(self):
+        assert TemplateEngine().cache_stats() is None
+
+
+class TestDependencies:
+    SOURCE = (
+        "---\ntemplate_id: t\nchannels: [mastodon, discord]\n"
+        "variables: [repo.name, event, repo.tier]\n---\n"
+        "{{#channel mastodon}}{{ repo.name }}{{#if event.url}} {{ event.url }}"
+        "{{#else}} {{ repo.url }}{{/if}} {{ repo.name }}{{/channel}}\n"
+        "{{#channel discord}}{{ event.title }}{{/channel}}"
+    )
+
+    def _engine(self) -> TemplateEngine:
+        engine = TemplateEngine()
+        engine.register(Template.from_string(self.SOURCE))
+        return engine
+
+    def test_paths_per_channel(self):
+        engine = self._engine()
+        assert engine.dependencies("t", "mastodon") == (
+            "repo.name", "event.url", "repo.url",
+        )
+        assert engine.dependencies("t", "discord") == ("event.title",)
+        assert engine.dependencies("t") == ("repo.name", "event.url", "repo.url", "event.title")
+
+    def test_computed_at_compile_time(self):
+        plan = Template.from_string(self.SOURCE).compile()
+        assert plan.dependencies["discord"] == ("event.title",)
+        assert plan.dependencies_for("ghost") == ()
+
+    def test_check_variables(self):
+        report = self._engine().get_template("t").check_variables()
+        assert report.undeclared == ["repo.url"]  # "event" covers event.url/title
+        assert report.unused == ["repo.tier"]
+        assert not report.ok
+
+    def test_engine_skips_templates_without_declarations(self):
+        engine = self._engine()
+        engine.register(Template.from_string("---\ntemplate_id: u\n---\n{{ anything }}"))
+        assert [r.template_id for r in engine.check_variables()] == ["t"]
+
+    def test_minimal_context_renders_identically(self):
+        engine = self._engine()
+        context = {
+            "repo": {"name": "n", "url": "u", "tier": "flagship"},
+            "event": {"title": "T", "url": ""},
+            "system": {"name": "organvm"},
+        }
+        for channel in ("mastodon", "discord"):
+            minimal = engine.minimal_context("t", context, channel)
+            assert "system" not in minimal
+            assert (engine.render("t", minimal, channel).text
+                    == engine.render("t", context, channel).text)
+        assert engine.minimal_context("t", context, "discord") == {"event": {"title": "T"}}
+
+    def test_project_context_parent_covers_child(self):
+        event = {"title": "T", "url": "u"}
+        projected = project_context({"event": event}, ["event.title", "event", "missing.path"])
+        assert projected == {"event": event}
+        assert projected["event"] is event
+
+
+class TestOverlay:
+    def _base(self) -> TemplateEngine:
+        base = TemplateEngine()
+        for template_id, body in (("a", "A {{ x }}"), ("b", "B")):
+            base.register(Template.from_string(
+                f"---\ntemplate_id: {template_id}\nchannels: [mastodon]\n---\n{body}"
+            ))
+        return base
+
+    def test_overrides_shadow_only_the_overlay(self):
+        base = self._base()
+        project = base.overlay()
+        project.register(Template.from_string("---\ntemplate_id: b\n---\nProject B"))
+        project.register(Template.from_string("---\ntemplate_id: c\n---\nC"))
+        assert project.render("a", {"x": 1}, "mastodon").text == "A 1"
+        assert project.render("b", {}, "mastodon").text == "Project B"
+        assert base.render("b", {}, "mastodon").text == "B"
+        assert project.get_template("a") is base.get_template("a")
+        assert [t.template_id for t in project.list_templates()] == ["a", "b", "c"]
+        assert (project.template_count, base.template_count) == (3, 2)
+        with pytest.raises(KeyError):
+            base.render("c", {}, "mastodon")
+        with pytest.raises(KeyError):
+            project.render("missing", {}, "mastodon")
+
+    def test_same_body_shares_plan(self):
+        base = self._base()
+        project = base.overlay()
+        project.register(Template.from_string(
+            "---\ntemplate_id: a\nchannels: [mastodon, discord]\n---\nA {{ x }}"
+        ))
+        tmpl = project.get_template("a")
+        assert tmpl is not base.get_template("a")
+        assert tmpl.plan is base.get_template("a").plan
+        assert tmpl.channels == ["mastodon", "discord"]
+
+    def test_parent_changes_show_through(self):
+        base = self._base()
+        project = base.overlay(cache_size=8).overlay()
+        project.parent.render("a", {"x": 1}, "mastodon")
+        base.register(Template.from_string("---\ntemplate_id: a\n---\nNew {{ x }}"))
+        assert project.parent.render("a", {"x": 1}, "mastodon").text == "New 1"
+        assert project.render_batch([("a", {"x": 2}, "m")])[0].text == "New 2"
+
+    def test_refresh_falls_back_to_parent(self, tmp_path):
+        base = self._base()
+        project = base.overlay()
+        path = tmp_path / "b.md"
+        path.write_text("---\ntemplate_id: b\n---\nProject B")
+        assert project.load_directory(tmp_path) == 1
+        assert project.render("b", {}, "mastodon").text == "Project B"
+        path.unlink()
+        assert project.refresh().removed == ["b"]
+        assert project.render("b", {}, "mastodon").text == "B"
@@ -0,0 +1,115 @@
+"""Tests for variable filters."""
+
+import pickle
+from datetime import date
+
+import pytest
+
+from kerygma_templates.engine import Template, TemplateEngine, TemplateSyntaxError
+from kerygma_templates.filters import (
+    ELLIPSIS,
+    _FILTERS,
+    format_date,
+    hashtags,
+    join,
+    register_filter,
+    resolve_filter,
+    truncate,
+)
+from kerygma_templates.fit import fit_render
+
+
+def _render(body: str, context: dict) -> str:
+    engine = TemplateEngine()
+    engine.register(Template.from_string("---\ntemplate_id: t\n---\n" + body))
+    return engine.render("t", context, "mastodon").text
+
+
+class TestBuiltins:
+    def test_truncate_on_word_boundary(self):
+        assert truncate("short", 10) == "short"
+        assert truncate("one two three four", 12) == "one two" + ELLIPSIS
+        assert truncate("one two, three", 10, "...") == "one two..."
+        assert truncate("\U0001F468\u200d\U0001F469\u200d\U0001F467 ab cd", 5) == (
+            "\U0001F468\u200d\U0001F469\u200d\U0001F467 ab" + ELLIPSIS
+        )
+
+    def test_hashtags(self):
+        assert hashtags(["organvm", "open-source", "organvm"]) == "#organvm #opensource"
+        assert hashtags("a, b c", 2) == "#a #b"
+
+    def test_scalars_are_single_items(self):
+        assert join(42) == "42"
+        assert hashtags(3.5) == "#35"
+        assert _render("{{ n | join }} {{ n | hashtags }}", {"n": 2026}) == "2026 #2026"
+
+    def test_date(self):
+        assert format_date("2026-02-17", "%d %b %Y") == "17 Feb 2026"
+        assert format_date(date(2026, 3, 1)) == "March 01, 2026"
+        assert format_date("next week") == "next week"
+
+
+class TestTemplateFilters:
+    CONTEXT = {
+        "repo": {"name": "recursive-engine"},
+        "event": {"summary": "A summary that runs long", "tags": ["organvm", "ai"]},
+    }
+
+    def test_chain_and_arguments(self):
+        body = (
+            "{{ repo.name | upper }} {{ event.summary|truncate:12 }} "
+            "{{ event.tags | hashtags }} {{ event.tags | join:\" | \" | upper }}"
+        )
+        assert _render(body, self.CONTEXT) == (
+            "RECURSIVE-ENGINE A summary" + ELLIPSIS + " #organvm #ai ORGANVM | AI"
+        )
+
+    def test_unresolved_keeps_tag(self):
+        engine = TemplateEngine()
+        engine.register(Template.from_string("---\ntemplate_id: t\n---\n{{ x | upper }}"))
+        result = engine.render("t", {}, "mastodon")
+        assert result.text == "{{ x | upper }}"
+        assert result.unresolved_vars == ["x"]
+
+    def test_resolved_once_at_compile_time(self):
+        calls = []
+
+        @register_filter("shout")
+        def shout(value, mark="!"):
+            calls.append(value)
+            return f"{value}{mark}"
+
+        try:
+            tmpl = Template.from_string("---\ntemplate_id: t\n---\n{{ a | shout:'?' }}")
+            tmpl.compile()
+            _FILTERS["shout"] = str.lower  # Already bound; later registrations don't apply
+            engine = TemplateEngine()
+            engine.register(tmpl)
+            assert engine.render("t", {"a": "hi"}, "m").text == "hi?"
+            assert calls == ["hi"]
+        finally:
+            _FILTERS.pop("shout", None)
+        with pytest.raises(KeyError):
+            resolve_filter("shout")
+
+    def test_unknown_filter_and_bad_arguments(self):
+        with pytest.raises(TemplateSyntaxError, match="unknown filter 'nope'") as exc_info:
+            Template.from_string("---\ntemplate_id: t\n---\nok\n{{ a | nope }}").compile()
+        assert exc_info.value.lineno == 2
+        with pytest.raises(TemplateSyntaxError, match="'upper' does not take 1"):
+            Template.from_string("---\ntemplate_id: t\n---\n{{ a | upper:3 }}").compile()
+
+    def test_plan_pickles(self):
+        plan = Template.from_string(
+            "---\ntemplate_id: t\n---\n{{ a | truncate:5 }}"
+        ).compile()
+        nodes = pickle.loads(pickle.dumps(plan)).default
+        assert nodes[0].filters[0].func is truncate
+
+    def test_fit_render_applies_filters(self):
+        engine = TemplateEngine()
+        engine.register(Template.from_string(
+            "---\ntemplate_id: t\nchannels: [mastodon]\n---\n{{ repo.name | upper }} #tag"
+        ))
+        result = fit_render(engine, "t", self.CONTEXT, "mastodon", limit=16)
+        assert result.text == "RECURSIVE-ENGINE"
@@ -0,0 +1,95 @@
+"""Tests for fit-to-limit rendering."""
+
+import pytest
+
+from kerygma_templates.engine import Template, TemplateEngine
+from kerygma_templates.fit import fit_render
+
+BODY = (
+    "{{ title }}: {{ event.summary }}\n\n"
+    "{{#if event.quote}}\"{{ event.quote }}\"{{/if}}\n\n"
+    "{{#if event.funder}}Funded by {{ event.funder }}.{{#else}}Independent.{{/if}}\n\n"
+    "https://example.com\n\n"
+    "{{#if event.tags}}#organvm #opensource #release{{/if}}"
+)
+
+
+def _engine(frontmatter: str = "") -> TemplateEngine:
+    engine = TemplateEngine()
+    engine.register(Template.from_string(
+        f"---\ntemplate_id: t\nchannels: [mastodon]\n{frontmatter}---\n{BODY}"
+    ))
+    return engine
+
+
+def _context(summary_words: int = 30) -> dict:
+    return {
+        "title": "Launch",
+        "event": {
+            "summary": " ".join(f"w{i}" for i in range(summary_words)),
+            "quote": "The system is the artwork.",
+            "funder": "Example Foundation",
+            "tags": ["x"],
+        },
+    }
+
+
+class TestFitRender:
+    def test_fitting_render_is_unchanged(self):
+        engine = _engine()
+        result = fit_render(engine, "t", _context(), "mastodon")
+        assert result == engine.render("t", _context(), "mastodon")
+        assert result.degradations == []
+
+    def test_drops_optional_sections_last_first(self):
+        engine = _engine()
+        full = engine.render("t", _context(), "mastodon").text
+        result = fit_render(engine, "t", _context(), "mastodon", limit=len(full) - 10, count=len)
+        assert result.degradations == ["dropped section event.tags"]
+        assert "#organvm" not in result.text
+        assert "Funded by" in result.text  # Has an {{#else}}: never optional
+
+    def test_truncates_summary_on_word_boundary(self):
+        engine = _engine()
+        result = fit_render(engine, "t", _context(200), "mastodon", limit=200, count=len)
+        assert len(result.text) <= 200
+        assert result.degradations[:2] == [
+            "dropped section event.tags", "dropped section event.quote",
+        ]
+        assert result.degradations[2].startswith("truncated event.summary to ")
+        summary = result.text.split("\n")[0]
+        assert summary.endswith("…") and summary[:-1].split()[-1].startswith("w")
+        # The longest prefix that fits was kept
+        words = int(result.degradations[2].split()[3])
+        longer = " ".join(f"w{i}" for i in range(words + 1))
+        assert len(result.text.replace(summary, f"Launch: {longer}…")) > 200
+
+    def test_removes_hashtags_when_sections_are_required(self):
+        engine = _engine("optional: []\n")
+        full = engine.render("t", _context(), "mastodon").text
+        result = fit_render(
+            engine, "t", _context(), "mastodon", limit=len(full) - 15, count=len,
+            steps=("sections", "hashtags"),
+        )
+        assert result.degradations == ["removed hashtag #release", "removed hashtag #opensource"]
+        assert result.text.endswith("#organvm")
+
+    def test_returns_most_degraded_when_nothing_fits(self):
+        engine = _engine()
+        result = fit_render(engine, "t", _context(), "mastodon", limit=5, count=len)
+        assert len(result.text) > 5
+        assert "removed hashtag #organvm" not in result.degradations  # Section already gone
+        assert result.degradations[0] == "dropped section event.tags"
+
+    def test_uses_channel_counting_by_default(self):
+        engine = TemplateEngine()
+        engine.register(Template.from_string(
+            "---\ntemplate_id: u\n---\n{{ url }} {{#if extra}}{{ extra }}{{/if}}"
+        ))
+        context = {"url": "https://example.com/" + "p" * 600, "extra": "x"}
+        # Mastodon counts the URL as 23, so it already fits
+        assert fit_render(engine, "u", context, "mastodon").degradations == []
+
+    def test_unknown_step_raises(self):
+        with pytest.raises(ValueError):
+            fit_render(_engine(), "t", _context(), "mastodon", limit=5, count=len, steps=["nope"])
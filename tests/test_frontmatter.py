@@ -0,0 +1,122 @@
+"""Tests for the frontmatter parser."""
+
+import pytest
+
+from kerygma_templates.engine import Template, TemplateEngine
+from kerygma_templates.frontmatter import FrontmatterError, _parse_block, parse_frontmatter
+
+
+def _meta(yaml: str) -> dict:
+    return parse_frontmatter(f"---\n{yaml}\n---\nBody")[0]
+
+
+class TestParse:
+    def test_nested_maps_and_sequences(self):
+        meta = _meta(
+            "fit:\n"
+            "  optional: [event.url]\n"
+            "  limits:\n"
+            "    mastodon: 500\n"
+            "links:\n"
+            "- label: Docs\n"
+            "  url: https://example.com/docs\n"
+            "- plain item\n"
+        )
+        assert meta == {
+            "fit": {"optional": ["event.url"], "limits": {"mastodon": 500}},
+            "links": [{"label": "Docs", "url": "https://example.com/docs"}, "plain item"],
+        }
+
+    def test_quoted_scalars_and_commas(self):
+        meta = _meta(
+            "title: \"Launch: phase 1, part 2\"  # trailing comment\n"
+            "quote: 'It''s live'\n"
+            "tags: [\"a, b\", 'c', d]\n"
+            "hashtag: \"#organvm\"\n"
+        )
+        assert meta["title"] == "Launch: phase 1, part 2"
+        assert meta["quote"] == "It's live"
+        assert meta["tags"] == ["a, b", "c", "d"]
+        assert meta["hashtag"] == "#organvm"
+
+    def test_block_scalars(self):
+        meta = _meta(
+            "literal: |\n"
+            "  line one\n"
+            "    indented\n"
+            "\n"
+            "  line three\n"
+            "folded: >-\n"
+            "  one\n"
+            "  two\n"
+            "\n"
+            "  three\n"
+            "after: x\n"
+        )
+        assert meta["literal"] == "line one\n  indented\n\nline three\n"
+        assert meta["folded"] == "one two\nthree"
+        assert meta["after"] == "x"
+
+    def test_scalar_typing_is_unchanged(self):
+        meta = _meta("a: 42\nb: TRUE\nc: -5\nd: 3.14\ne: '7'\nf:")
+        assert meta == {"a": 42, "b": True, "c": "-5", "d": "3.14", "e": "7", "f": []}
+
+
+class TestErrors:
+    @pytest.mark.parametrize("yaml, lineno, message", [
+        ("template_id: t\nno colon here", 3, "expected 'key: value'"),
+        ("a: 1\n  b: 2", 3, "unexpected indentation"),
+        ("a: 1\na: 2", 3, "duplicate key 'a'"),
+        ("a: \"open", 2, "unterminated quoted string"),
+        ("a: [x, y", 2, "missing ']'"),
+        ("a: 'x' y", 2, "unexpected text"),
+        ("\tb: 1", 2, "tabs"),
+    ])
+    def test_line_numbers(self, yaml, lineno, message):
+        with pytest.raises(FrontmatterError, match=message) as exc_info:
+            _meta(yaml)
+        assert exc_info.value.lineno == lineno
+
+    @pytest.mark.parametrize("yaml, message", [
+        ("template_id: 12", "'template_id' must be a string, not int"),
+        ("channels: mastodon", "'channels' must be a list of strings, not str"),
+        ("variables:\n  - repo.name\n  - name: x", "a list containing dict"),
+    ])
+    def test_schema(self, yaml, message):
+        with pytest.raises(FrontmatterError, match=message) as exc_info:
+            _meta("category: launch\n" + yaml)
+        assert exc_info.value.lineno == 3
+
+    def test_unterminated_frontmatter(self):
+        with pytest.raises(FrontmatterError, match="no closing") as exc_info:
+            parse_frontmatter("---\ntemplate_id: t\nBody")
+        assert exc_info.value.lineno == 1
+
+    def test_load_directory_names_file(self, tmp_path):
+        path = tmp_path / "bad.md"
+        path.write_text("---\ntemplate_id: bad\nchannels: mastodon\n---\nBody")
+        with pytest.raises(FrontmatterError) as exc_info:
+            TemplateEngine().load_directory(tmp_path)
+        assert str(exc_info.value).startswith(f"{path}: line 3:")
+
+    def test_refresh_error_keeps_snapshot(self, tmp_path):
+        path = tmp_path / "t.md"
+        path.write_text("---\ntemplate_id: t\n---\nOne")
+        engine = TemplateEngine()
+        engine.load_directory(tmp_path)
+        path.write_text("---\ntemplate_id: t\nchannels: [a\n---\nTwo, and longer")
+        with pytest.raises(FrontmatterError):
+            engine.refresh()
+        assert engine.render("t", {}, "m").text == "One"
+
+
+class TestCache:
+    def test_same_frontmatter_parsed_once(self):
+        _parse_block.cache_clear()
+        first = Template.from_string("---\ntemplate_id: c\nchannels: [m]\n---\nOne")
+        second = Template.from_string("---\ntemplate_id: c\nchannels: [m]\n---\nTwo")
+        info = _parse_block.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+        # Each template gets its own copy of the cached metadata
+        first.channels.append("discord")
+        assert second.channels == ["m"]
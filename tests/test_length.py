@@ -0,0 +1,74 @@
+"""Tests for platform length counting."""
+
+import pytest
+
+from kerygma_templates.length import (
+    URL_LENGTH,
+    count_graphemes,
+    count_mastodon,
+    count_twitter,
+    length_counter,
+    split_graphemes,
+)
+
+FAMILY = "\U0001F468\u200d\U0001F469\u200d\U0001F467"
+FLAGS = "\U0001F1FA\U0001F1F8\U0001F1EB\U0001F1F7"
+THUMBS_MEDIUM = "\U0001F44D\U0001F3FD"
+E_ACUTE_DECOMPOSED = "e\u0301"
+
+
+class TestGraphemes:
+    @pytest.mark.parametrize("text, expected", [
+        ("plain ascii", 11),
+        ("a\r\nb", 3),
+        (FAMILY, 1),
+        (FLAGS, 2),
+        (FLAGS + "\U0001F1FA", 3),
+        (THUMBS_MEDIUM, 1),
+        (E_ACUTE_DECOMPOSED + "x", 2),
+        ("1\ufe0f\u20e3", 1),
+        ("\u1100\u1161\u11a8", 1),  # Hangul jamo for one syllable
+        ("\u0915\u094d\u0937\u093f", 2),
+        ("\n\u0301", 2),  # Marks do not attach to controls
+        ("\u0301\u0301x", 2),
+    ])
+    def test_count(self, text, expected):
+        assert count_graphemes(text) == expected
+
+    def test_split_round_trips(self):
+        text = f"Hi {FAMILY}! {FLAGS} caf{E_ACUTE_DECOMPOSED}\r\n"
+        clusters = split_graphemes(text)
+        assert "".join(clusters) == text
+        assert len(clusters) == count_graphemes(text)
+        assert FAMILY in clusters and E_ACUTE_DECOMPOSED in clusters
+
+
+class TestMastodon:
+    def test_urls_count_as_23(self):
+        url = "https://example.com/" + "x" * 60
+        assert count_mastodon(f"Read {url}.") == 5 + URL_LENGTH + 1
+
+    def test_remote_mentions_count_user_part(self):
+        assert count_mastodon("hi @alice@mastodon.social and @bob") == len("hi @alice and @bob")
+
+    def test_email_is_not_a_mention(self):
+        text = "mail me@example.com"
+        assert count_mastodon(text) == len(text)
+
+
+class TestTwitter:
+    def test_weighted_counting(self):
+        assert count_twitter("abc") == 3
+        assert count_twitter("\u65e5\u672c") == 4  # CJK weighs 2
+        assert count_twitter(FAMILY) == 2
+        assert count_twitter(THUMBS_MEDIUM + FLAGS) == 6
+        assert count_twitter(E_ACUTE_DECOMPOSED) == 1  # NFC first
+
+    def test_urls_count_as_23(self):
+        assert count_twitter("see https://example.com/some/long/path") == 4 + URL_LENGTH
+
+
+def test_unknown_strategy_raises():
+    assert length_counter("graphemes") is count_graphemes
+    with pytest.raises(KeyError):
+        length_counter("furlongs")
@@ -0,0 +1,62 @@
+"""Tests for the parallel render/check executor."""
+
+from pathlib import Path
+
+import pytest
+
+from kerygma_templates.cli import sample_context
+from kerygma_templates.engine import TemplateEngine
+from kerygma_templates.parallel import ParallelRenderer
+from kerygma_templates.quality_checker import QualityChecker
+
+TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
+
+
+@pytest.fixture
+def engine():
+    engine = TemplateEngine()
+    engine.load_directory(TEMPLATES_DIR)
+    return engine
+
+
+def _jobs(engine):
+    context = sample_context()
+    return [(t.template_id, context, ch) for t in engine.list_templates() for ch in t.channels]
+
+
+def _expected(engine, jobs):
+    checker = QualityChecker()
+    pairs = []
+    for job in jobs:
+        result = engine.render(*job)
+        pairs.append((result, checker.check(
+            result.text, result.channel, result.template_id, result.unresolved_vars,
+        )))
+    return pairs
+
+
+class TestParallelRenderer:
+    def test_single_worker_runs_inline(self, engine):
+        jobs = _jobs(engine)
+        pairs = list(ParallelRenderer(engine, workers=1, chunk_size=7).run(jobs))
+        assert pairs == _expected(engine, jobs)
+
+    def test_pool_preserves_order(self, engine):
+        jobs = _jobs(engine)
+        pairs = list(ParallelRenderer(engine, workers=2, chunk_size=5).run(iter(jobs)))
+        assert pairs == _expected(engine, jobs)
+
+    def test_unordered_yields_every_job(self, engine):
+        jobs = _jobs(engine)
+        pairs = list(ParallelRenderer(engine, workers=2, chunk_size=3).run(jobs, ordered=False))
+        got = sorted((r.template_id, r.channel) for r, _ in pairs)
+        assert got == sorted((r.template_id, r.channel) for r, _ in _expected(engine, jobs))
+
+    def test_unknown_template_raises(self, engine):
+        renderer = ParallelRenderer(engine, workers=2)
+        with pytest.raises(KeyError):
+            list(renderer.run([("nonexistent", {}, "mastodon")]))
+
+    def test_invalid_chunk_size(self, engine):
+        with pytest.raises(ValueError):
+            ParallelRenderer(engine, chunk_size=0)
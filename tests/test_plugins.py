@@ -0,0 +1,61 @@
+"""Tests for the plugin registries shared by filters and checks."""
+
+import importlib.metadata
+
+import pytest
+
+from kerygma_templates import filters, quality_checker
+from kerygma_templates.plugins import PluginRegistry
+
+GROUP = "kerygma_templates.test_plugins"
+
+
+def _fake_entry_points(monkeypatch, *specs):
+    eps = [importlib.metadata.EntryPoint(name, value, GROUP) for name, value in specs]
+    calls = []
+    monkeypatch.setattr(
+        importlib.metadata, "entry_points", lambda **kwargs: calls.append(kwargs) or eps,
+    )
+    return calls
+
+
+class TestPluginRegistry:
+    def test_register_and_lookup(self, monkeypatch):
+        calls = _fake_entry_points(monkeypatch)
+        registry = PluginRegistry("filter", GROUP)
+
+        @registry.register("shout")
+        def shout(value):
+            return value.upper()
+
+        registry.register("quiet", str.lower)
+        assert registry.lookup("shout") is shout
+        assert calls == []  # Registered names never load entry points
+        assert registry.lookup("nope") is None
+        assert list(registry.available()) == ["shout", "quiet"]
+        assert calls == [{"group": GROUP}]
+
+    def test_entry_points_loaded_once_without_replacing(self, monkeypatch):
+        calls = _fake_entry_points(
+            monkeypatch, ("upper", "kerygma_templates.filters:upper"), ("lower", "builtins:len"),
+        )
+        registry = PluginRegistry("filter", GROUP)
+        registry.register("lower", str.lower)
+        assert registry.lookup("upper") is filters.upper
+        assert registry.available()["lower"] is str.lower
+        assert len(calls) == 1
+
+    def test_broken_entry_point_is_skipped(self, monkeypatch):
+        _fake_entry_points(
+            monkeypatch, ("broken", "no_such_module:check"), ("min", "builtins:min"),
+        )
+        registry = PluginRegistry("check", GROUP)
+        with pytest.warns(RuntimeWarning, match="Skipping check entry point 'broken'"):
+            assert registry.lookup("min") is min
+        assert registry.lookup("broken") is None
+
+    def test_filters_and_checks_use_registries(self):
+        assert filters._FILTERS.group == filters.ENTRY_POINT_GROUP
+        assert quality_checker._CHECKS.group == quality_checker.ENTRY_POINT_GROUP
+        assert filters.resolve_filter("upper") is filters.upper
+        assert quality_checker.resolve_check("not_empty")[0] == "not_empty"
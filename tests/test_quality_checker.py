@@ -1,6 +1,20 @@
 """Tests for the quality checker."""
 
-from kerygma_templates.quality_checker import QualityChecker
+import dataclasses
+
+import pytest
+
+from kerygma_templates.quality_checker import (
+    ANTI_PATTERNS,
+    SCAN_STATS_KEY,
+    TRIE_MIN_PATTERNS,
+    CheckInput,
+    CheckResult,
+    QualityChecker,
+    available_checks,
+    register_check,
+    resolve_check,
+)
 
 
 class TestQualityChecker:
@@ -85,3 +99,146 @@ def test_unknown_channel_no_limit(self):
         limit_check = next(c for c in report.checks if c.check_name == "char_limit")
         assert limit_check.passed
         assert limit_check.severity == "info"
+
+    def test_char_limit_uses_channel_counting(self):
+        checker = self._checker()
+        url = "https://example.com/" + "x" * 600
+        mastodon = checker.check(f"Long link {url}", "mastodon", "test")
+        assert _check(mastodon, "char_limit").message == "33/500 characters"
+
+        emoji = "\U0001F468\u200d\U0001F469\u200d\U0001F467" * 300
+        assert _check(checker.check(emoji, "bluesky"), "char_limit").passed
+        assert not _check(checker.check(emoji, "twitter"), "char_limit").passed
+        custom = QualityChecker(channel_counting={"bluesky": "chars"})
+        assert not _check(custom.check(emoji, "bluesky"), "char_limit").passed
+
+    def test_check_results_are_frozen_and_slotted(self):
+        report = self._checker().check("Content https://example.com", "mastodon", "test")
+        assert not hasattr(report, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            report.checks[0].passed = False
+
+
+def _check(report, name):
+    return next(c for c in report.checks if c.check_name == name)
+
+
+@pytest.fixture(params=["short", "trie"])
+def make_checker(request):
+    """Build checkers on both sides of the trie threshold."""
+    def make(patterns: list[str]) -> QualityChecker:
+        if request.param == "trie":
+            filler = [f"zzfiller{i}" for i in range(TRIE_MIN_PATTERNS)]
+            patterns = patterns + filler
+        return QualityChecker(anti_patterns=patterns)
+    return make
+
+
+class TestSinglePassScan:
+    def test_overlapping_and_prefix_patterns_all_found(self, make_checker):
+        checker = make_checker(["coming", "coming soon", "soon", "oming"])
+        report = checker.check("Coming Soon! https://example.com", "mastodon")
+        message = _check(report, "anti_patterns").message
+        assert message == "Anti-patterns found: coming, coming soon, soon, oming"
+
+    def test_patterns_inside_hashtags_links_and_placeholders(self, make_checker):
+        checker = make_checker(["hack", "tbd", "todo", "http"])
+        text = "#Hackathon https://tbd.example.com {{ todo }}"
+        report = checker.check(text, "mastodon")
+        assert _check(report, "anti_patterns").message == (
+            "Anti-patterns found: hack, tbd, todo, http"
+        )
+        assert _check(report, "hashtag_count").message.startswith("1 hashtags")
+        assert _check(report, "has_link").passed
+        assert _check(report, "unresolved_vars").message == (
+            "Found unresolved template syntax: {{ todo }}"
+        )
+
+    def test_matches_per_check_semantics(self, make_checker):
+        checker = make_checker(list(ANTI_PATTERNS))
+        text = "HTTPS://x {{{a}}} {{b}} ## #a#b #\u00e9t\u00e9 TODO lorem  ipsum"
+        report = checker.check(text, "linkedin")
+        assert not _check(report, "has_link").passed
+        assert _check(report, "unresolved_vars").message == (
+            "Found unresolved template syntax: {{{a}}, {{b}}"
+        )
+        assert _check(report, "hashtag_count").message.startswith("3 hashtags")
+        assert _check(report, "anti_patterns").message == "Anti-patterns found: todo"
+
+    def test_duplicate_and_uppercase_patterns(self, make_checker):
+        checker = make_checker(["todo", "TODO", "todo"])
+        report = checker.check("todo https://example.com", "mastodon")
+        assert _check(report, "anti_patterns").message == "Anti-patterns found: todo, todo"
+
+    def test_large_pattern_list(self):
+        patterns = [f"banned{i:04d}" for i in range(5000)] + ["stay tuned"]
+        checker = QualityChecker(anti_patterns=patterns)
+        report = checker.check("Stay tuned for banned4999! https://example.com", "mastodon")
+        assert _check(report, "anti_patterns").message == (
+            "Anti-patterns found: banned4999, stay tuned"
+        )
+
+
+def shouty(inp: CheckInput) -> CheckResult:
+    passed = not inp.text.isupper()
+    return CheckResult("shouty", passed, "ok" if passed else "All caps", "warning")
+
+
+class TestCheckRegistry:
+    def test_builtins_registered_in_order(self):
+        names = list(available_checks())
+        assert names[:6] == [
+            "char_limit", "not_empty", "unresolved_vars",
+            "anti_patterns", "has_link", "hashtag_count",
+        ]
+        assert QualityChecker().check_names()[:6] == names[:6]
+
+    def test_select_checks_by_name_and_spec(self):
+        checker = QualityChecker(checks=["not_empty", "tests.test_quality_checker:shouty"])
+        report = checker.check("LOUD", "mastodon")
+        assert [c.check_name for c in report.checks] == ["not_empty", "shouty"]
+        assert report.warnings[0].message == "All caps"
+
+    def test_per_channel_checks(self):
+        checker = QualityChecker(channel_checks={"ghost": ["not_empty", shouty]})
+        assert [c.check_name for c in checker.check("x", "ghost").checks] == [
+            "not_empty", "shouty",
+        ]
+        assert len(checker.check("x", "mastodon").checks) == len(checker.check_names())
+
+    def test_register_check_decorator(self):
+        @register_check("test_min_words")
+        def min_words(inp: CheckInput) -> CheckResult:
+            return CheckResult("test_min_words", len(inp.text.split()) >= 3, "words")
+
+        try:
+            assert resolve_check("test_min_words") == ("test_min_words", min_words)
+            report = QualityChecker().check("two words", "mastodon")
+            assert not next(c for c in report.checks if c.check_name == "test_min_words").passed
+        finally:
+            import kerygma_templates.quality_checker as qc
+            del qc._CHECKS["test_min_words"]
+
+    def test_unknown_check_raises(self):
+        with pytest.raises(KeyError):
+            QualityChecker(checks=["nope"])
+        with pytest.raises(KeyError):
+            QualityChecker(checks=["tests.test_quality_checker:nope"])
+
+    def test_stats(self):
+        checker = QualityChecker()
+        for _ in range(3):
+            checker.check("No link #a", "mastodon")
+        stats = checker.stats()
+        assert stats["has_link"].calls == 3
+        assert stats["has_link"].failures == 3
+        assert stats["not_empty"].failures == 0
+        assert stats[SCAN_STATS_KEY].calls == 3
+        assert stats["char_limit"].mean_ns >= 0
+        checker.reset_stats()
+        assert checker.stats() == {}
+
+    def test_checker_without_scanning_checks_skips_scan(self):
+        checker = QualityChecker(checks=["char_limit", "not_empty"])
+        checker.check("text", "mastodon")
+        assert SCAN_STATS_KEY not in checker.stats()
@@ -1,8 +1,11 @@
 """Tests for the registry loader."""
 
 import json
+import pickle
 from pathlib import Path
 
+from kerygma_templates import registry_loader
+from kerygma_templates.engine import Template, TemplateEngine, _resolve_var
 from kerygma_templates.registry_loader import RegistryLoader, EventContext
 
 FIXTURES = Path(__file__).parent / "fixtures"
@@ -89,6 +92,74 @@ def test_event_context_extras(self):
         assert ctx["event"]["custom_key"] == "custom_value"
 
 
+class TestLazyContext:
+    def _context(self, **kwargs):
+        loader = RegistryLoader(FIXTURES / "sample_registry.json")
+        event = EventContext(event_type="repo-launch", repo_name="recursive-engine", **kwargs)
+        return loader.build_context(event)
+
+    def test_sections_built_on_first_access(self):
+        ctx = self._context(title="T")
+        assert isinstance(ctx, dict)
+        assert ctx.pending == ("event", "repo", "system")
+        assert _resolve_var(ctx, "repo.name") == "recursive-engine"
+        assert ctx.pending == ("event", "system")
+        assert "system" in ctx and len(ctx) == 3 and ctx.pending == ("event", "system")
+        assert ctx.get("project") is None
+
+    def test_sections_memoized(self, monkeypatch):
+        calls = []
+        original = registry_loader._event_section
+        monkeypatch.setattr(
+            registry_loader, "_event_section", lambda e: calls.append(e) or original(e),
+        )
+        ctx = self._context()
+        assert ctx["event"] is ctx["event"]
+        assert len(calls) == 1
+
+    def test_whole_dict_operations_materialize(self):
+        ctx = self._context(title="T")
+        assert list(ctx) == ["event", "repo", "system"]
+        assert ctx.pending == ("event", "repo", "system")
+        assert {**ctx}["repo"]["tier"] == "flagship"
+        assert ctx.pending == ()
+        assert json.loads(json.dumps(self._context(title="T")))["event"]["title"] == "T"
+        assert self._context(title="T") == dict(ctx)
+
+    def test_pickles_as_plain_dict(self):
+        restored = pickle.loads(pickle.dumps(self._context(title="T")))
+        assert type(restored) is dict
+        assert restored["repo"]["tier"] == "flagship"
+
+    def test_engine_builds_only_referenced_sections(self):
+        engine = TemplateEngine()
+        engine.register(Template.from_string(
+            "---\ntemplate_id: t\nchannels: [bluesky]\n---\n{{ repo.name }}{{ nope.x }}"
+        ))
+        ctx = self._context()
+        result = engine.render("t", ctx, "bluesky")
+        assert result.text == "recursive-engine{{ nope.x }}"
+        assert ctx.pending == ("event", "system")
+
+    def test_all_channels_build_only_referenced_sections(self):
+        engine = TemplateEngine()
+        engine.register(Template.from_string(
+            "---\ntemplate_id: t\nchannels: [bluesky, mastodon]\n---\n{{ repo.name }}"
+        ))
+        ctx = self._context()
+        results = engine.render_all_channels("t", [ctx])
+        assert [r.text for r in results] == ["recursive-engine"] * 2
+        assert ctx.pending == ("event", "system")
+
+    def test_assignment_replaces_pending_section(self):
+        ctx = self._context()
+        ctx["repo"] = {"name": "override"}
+        assert ctx["repo"] == {"name": "override"}
+        del ctx["system"]
+        assert "system" not in ctx
+        assert set(ctx) == {"event", "repo"}
+
+
 class TestBuildContextWithProfile:
     """Tests for per-project voice variables via profile parameter."""
 
@@ -155,3 +226,155 @@ def test_profile_with_real_project_profile(self):
         ctx = loader.build_context(event, profile=profile)
         assert ctx["project"]["name"] == "Real Product"
         assert ctx["project"]["tagline"] == "Real deal"
+
+
+class TestRegistryIndexes:
+    def _loader(self, tmp_path, **kwargs):
+        data = {"organs": {
+            "a": {"repos": [
+                {"name": "r1", "tier": "flagship", "implementation_status": "PRODUCTION",
+                 "language": "python"},
+                {"name": "r2", "tier": "standard", "implementation_status": "PRODUCTION",
+                 "language": "rust", "topics": ["x"]},
+            ]},
+            "b": {"repos": [
+                {"name": "r3", "tier": "flagship", "implementation_status": "PROTOTYPE",
+                 "language": "python"},
+            ]},
+        }}
+        path = tmp_path / "registry.json"
+        path.write_text(json.dumps(data))
+        return RegistryLoader(path, **kwargs)
+
+    def _names(self, repos):
+        return [r.name for r in repos]
+
+    def test_query_single_field(self, tmp_path):
+        loader = self._loader(tmp_path)
+        assert self._names(loader.query(tier="flagship")) == ["r1", "r3"]
+        assert self._names(loader.query(implementation_status="PROTOTYPE")) == ["r3"]
+
+    def test_query_composite(self, tmp_path):
+        loader = self._loader(tmp_path)
+        assert self._names(loader.query(organ="a", tier="flagship")) == ["r1"]
+        assert loader.query(organ="b", implementation_status="PRODUCTION") == []
+        assert self._names(loader.query()) == ["r1", "r2", "r3"]
+
+    def test_query_metadata(self, tmp_path):
+        loader = self._loader(tmp_path, index_keys=("language",))
+        assert self._names(loader.query(metadata={"language": "python"})) == ["r1", "r3"]
+        assert self._names(loader.query(tier="flagship", metadata={"language": "python"})) == [
+            "r1", "r3",
+        ]
+        # Unindexed keys are indexed lazily; unhashable values never match
+        assert loader.query(metadata={"topics": ["x"]}) == []
+        assert self._names(loader.query(metadata={"name": "r2"})) == ["r2"]
+
+    def test_reload_replaces_index_entries(self, tmp_path):
+        loader = self._loader(tmp_path)
+        data = {"organs": {"c": {"repos": [{"name": "r1", "tier": "archive"}]}}}
+        path = tmp_path / "override.json"
+        path.write_text(json.dumps(data))
+        loader.load(path)
+        assert self._names(loader.list_repos(organ="a")) == ["r2"]
+        assert self._names(loader.query(tier="flagship")) == ["r3"]
+        assert self._names(loader.list_repos(organ="c")) == ["r1"]
+
+    def test_distinct_values(self, tmp_path):
+        loader = self._loader(tmp_path)
+        assert loader.distinct_values("organ") == ["a", "b"]
+        assert sorted(loader.distinct_values("language")) == ["python", "rust"]
+
+
+class TestStreamingLoad:
+    def _fields(self, repo):
+        return (repo.name, repo.organ, repo.description, repo.tier, repo.url,
+                repo.implementation_status)
+
+    def test_matches_eager_load(self):
+        eager = RegistryLoader(FIXTURES / "sample_registry.json")
+        streamed = RegistryLoader(FIXTURES / "sample_registry.json", streaming=True)
+        assert streamed.repo_count == eager.repo_count
+        for repo in eager.list_repos():
+            other = streamed.get_repo(repo.name)
+            assert self._fields(other) == self._fields(repo)
+            assert dict(other.metadata) == repo.metadata
+        assert streamed.raw_registry == {"project_status": "OPERATIONAL"}
+
+    def test_metadata_is_lazy_and_byte_accurate(self, tmp_path):
+        repos = [
+            {"name": "ünï", "description": "𝄞 \"quoted\"", "extra": {"n": [1, 2.5, None]}},
+            {"name": "plain", "extra": True},
+        ]
+        path = tmp_path / "registry.json"
+        path.write_text(
+            json.dumps({"organs": {"o": {"repositories": repos}}}, ensure_ascii=False, indent=1),
+            encoding="utf-8",
+        )
+        loader = RegistryLoader(path, streaming=True)
+        repo = loader.get_repo("ünï")
+        assert "LazyMetadata" in repr(repo.metadata)
+        assert repo.description == "𝄞 \"quoted\""
+        assert dict(repo.metadata) == repos[0]
+        assert loader.get_repo("plain").metadata["extra"] is True
+
+    def test_small_chunks(self, tmp_path, monkeypatch):
+        from kerygma_templates import registry_loader
+
+        monkeypatch.setattr(registry_loader._JsonStream.__init__, "__defaults__", (3,))
+        loader = RegistryLoader(FIXTURES / "sample_registry.json", streaming=True)
+        assert loader.repo_count == 3
+        assert loader.get_repo("metasystem-master").organ == "ii-poiesis"
+
+    def test_numbers_cut_at_chunk_edges(self, tmp_path, monkeypatch):
+        from kerygma_templates import registry_loader
+
+        # Numbers outside repo objects are decoded on their own
+        data = {
+            "version": 2.75,
+            "organs": {"o": {"weight": -3.25e-4, "repositories": [{"name": "r"}], "n": 10}},
+            "scale": 1e3,
+        }
+        path = tmp_path / "registry.json"
+        path.write_text(json.dumps(data))
+        # Every chunk size up to the file length puts some edge inside a number
+        for size in range(1, path.stat().st_size + 1):
+            monkeypatch.setattr(registry_loader._JsonStream.__init__, "__defaults__", (size,))
+            loader = RegistryLoader(path, streaming=True)
+            assert loader.raw_registry == {"version": 2.75, "scale": 1e3}, size
+            assert loader.repo_count == 1
+
+    def test_repositories_key_wins_over_repos(self, tmp_path):
+        data = {"organs": {"o": {
+            "repos": [{"name": "legacy"}],
+            "repositories": [{"name": "canonical"}],
+        }}}
+        path = tmp_path / "registry.json"
+        path.write_text(json.dumps(data))
+        loader = RegistryLoader(path, streaming=True)
+        assert [r.name for r in loader.list_repos()] == ["canonical"]
+
+    def test_registry_without_organs_key(self, tmp_path):
+        path = tmp_path / "registry.json"
+        path.write_text(json.dumps({"test": {"repos": [{"name": "r1"}]}}))
+        loader = RegistryLoader(path, streaming=True)
+        assert loader.get_repo("r1").organ == "test"
+
+    def test_index_keys_do_not_materialize_metadata(self, tmp_path):
+        data = {"organs": {"o": {"repositories": [{"name": "r1", "language": "python"}]}}}
+        path = tmp_path / "registry.json"
+        path.write_text(json.dumps(data))
+        loader = RegistryLoader(path, index_keys=("language",), streaming=True)
+        assert [r.name for r in loader.query(metadata={"language": "python"})] == ["r1"]
+        assert "LazyMetadata" in repr(loader.get_repo("r1").metadata)
+
+    def test_query_on_unindexed_key_keeps_metadata_lazy(self, tmp_path):
+        data = {"organs": {"o": {"repositories": [
+            {"name": "r1", "language": "python"}, {"name": "r2", "language": "rust"},
+        ]}}}
+        path = tmp_path / "registry.json"
+        path.write_text(json.dumps(data))
+        loader = RegistryLoader(path, streaming=True)
+        assert [r.name for r in loader.query(metadata={"language": "rust"})] == ["r2"]
+        assert loader.distinct_values("language") == ["python", "rust"]
+        assert all("LazyMetadata" in repr(r.metadata) for r in loader.list_repos())
@@ -0,0 +1,81 @@
+"""Tests for the streaming JSONL render pipeline."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from kerygma_templates.engine import TemplateEngine
+from kerygma_templates.quality_checker import QualityChecker
+from kerygma_templates.registry_loader import RegistryLoader
+from kerygma_templates.stream import event_from_record, render_stream
+
+FIXTURES = Path(__file__).parent / "fixtures"
+TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
+
+
+@pytest.fixture
+def engine():
+    engine = TemplateEngine()
+    engine.load_directory(TEMPLATES_DIR)
+    return engine
+
+
+@pytest.fixture
+def loader():
+    return RegistryLoader(FIXTURES / "sample_registry.json")
+
+
+class TestEventFromRecord:
+    def test_known_fields_and_extras(self):
+        event = event_from_record({
+            "event_type": "repo-launch", "title": "T", "custom": 1, "extras": {"x": 2},
+        })
+        assert event.title == "T"
+        assert event.extras == {"x": 2, "custom": 1}
+
+    def test_missing_event_type(self):
+        with pytest.raises(ValueError):
+            event_from_record({"title": "T"})
+
+
+class TestRenderStream:
+    def test_renders_each_declared_channel(self, engine, loader):
+        line = json.dumps({"event_type": "repo-launch", "repo_name": "recursive-engine"})
+        records = list(render_stream([line], engine, loader))
+        channels = engine.get_template("repo-launch").channels
+        assert [r["channel"] for r in records] == channels
+        assert "recursive-engine" in records[0]["text"]
+        assert all(r["line"] == 1 for r in records)
+
+    def test_malformed_lines_are_reported_and_skipped(self, engine, loader):
+        lines = [
+            "{not json",
+            json.dumps({"event_type": "no-such-template"}),
+            json.dumps(["not", "an", "object"]),
+            "",
+            json.dumps({"event_type": "repo-launch", "channels": ["bluesky"]}),
+        ]
+        errors = []
+        records = list(render_stream(
+            lines, engine, loader, on_error=lambda n, msg: errors.append(n),
+        ))
+        assert errors == [1, 2, 3]
+        assert [(r["line"], r["channel"]) for r in records] == [(5, "bluesky")]
+
+    def test_channel_override_and_check(self, engine, loader):
+        line = json.dumps({"event_type": "repo-launch", "repo_name": "recursive-engine"})
+        records = list(render_stream(
+            [line], engine, loader, channels=["mastodon"], checker=QualityChecker(),
+        ))
+        assert len(records) == 1
+        assert "passed" in records[0]
+        assert "failures" in records[0]
+
+    def test_consumes_input_lazily(self, engine, loader):
+        def lines():
+            yield json.dumps({"event_type": "repo-launch", "channels": ["mastodon"]})
+            raise AssertionError("read past the first record")
+
+        stream = render_stream(lines(), engine, loader)
+        assert next(stream)["line"] == 1
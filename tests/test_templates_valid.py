@@ -46,15 +46,23 @@
     },
     "digest": {
         "week_label": "Feb 24 – Mar 1, 2026",
-        "essay_1_title": "First Essay Title",
-        "essay_1_url": "https://example.com/essay-1",
-        "essay_1_summary": "Summary of the first essay.",
-        "essay_2_title": "Second Essay Title",
-        "essay_2_url": "https://example.com/essay-2",
-        "essay_2_summary": "Summary of the second essay.",
-        "essay_3_title": "Third Essay Title",
-        "essay_3_url": "https://example.com/essay-3",
-        "essay_3_summary": "Summary of the third essay.",
+        "essays": [
+            {
+                "title": "First Essay Title",
+                "url": "https://example.com/essay-1",
+                "summary": "Summary of the first essay.",
+            },
+            {
+                "title": "Second Essay Title",
+                "url": "https://example.com/essay-2",
+                "summary": "Summary of the second essay.",
+            },
+            {
+                "title": "Third Essay Title",
+                "url": "https://example.com/essay-3",
+                "summary": "Summary of the third essay.",
+            },
+        ],
         "site_url": "https://organvm-v-logos.github.io/public-process/",
     },
 }